@@ -15,7 +15,7 @@ from pydantic import BaseModel, Field
 
 from datalab.api.job_store import SQLiteJobStore
 from datalab.clean import run_pipeline
-from datalab.config import load_app_config, load_schema_config
+from datalab.config import load_app_config_cached, load_schema_config
 from datalab.jd.analyze import generate_jd_market_report
 from datalab.logging_utils import setup_logging
 
@@ -321,15 +321,20 @@ def _run_pipeline_job(payload: PipelineRunRequest) -> dict[str, str]:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     schema = load_schema_config(payload.schema_config_path, payload.app_config_path)
-    app_config = load_app_config(payload.app_config_path)
+    # Re-read only when the file changed, so config edits apply without a restart.
+    app_config = load_app_config_cached(payload.app_config_path)
     clean_cfg = app_config.get("clean", {}) if isinstance(app_config.get("clean"), dict) else {}
     skill_dictionary = clean_cfg.get("skill_dictionary")
+    parse_cache = clean_cfg.get("parse_cache")
     run_pipeline(
         input_path=payload.input_path,
         output_path=str(output_dir),
         schema=schema,
         topk=payload.topk,
         skill_dictionary=skill_dictionary if isinstance(skill_dictionary, dict) else None,
+        parse_cache=str(parse_cache) if parse_cache else None,
+        skill_token_boundaries=bool(clean_cfg.get("skill_token_boundaries", False)),
+        skill_long_table=bool(clean_cfg.get("skill_long_table", False)),
     )
 
     outputs: dict[str, str] = {
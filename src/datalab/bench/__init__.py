@@ -0,0 +1,2 @@
+"""Benchmarks for DataLab cleaning stages."""
+
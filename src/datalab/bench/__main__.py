@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from datalab.bench.memory import render_memory_table, run_memory_benchmark
+from datalab.bench.parsers import (
+    DEFAULT_MAX_REGRESSION,
+    compare_to_baseline,
+    render_parser_table,
+    run_parser_benchmark,
+)
+from datalab.logging_utils import setup_logging
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DataLab benchmarks.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    memory_parser = subparsers.add_parser(
+        "memory", help="Peak memory per clean stage, copying vs copy-on-write."
+    )
+    memory_parser.add_argument("--rows", type=int, default=50_000, help="Synthetic row count.")
+    memory_parser.add_argument("--seed", type=int, default=7, help="Synthetic corpus seed.")
+    memory_parser.add_argument(
+        "--no-tracemalloc",
+        action="store_true",
+        help="Skip allocation tracing (faster; RSS only).",
+    )
+    memory_parser.add_argument("--output", default=None, help="Optional JSON results path.")
+    memory_parser.add_argument(
+        "--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"]
+    )
+
+    parsers_parser = subparsers.add_parser(
+        "parsers", help="Throughput of the scalar, vectorized and memoized JD text parsers."
+    )
+    parsers_parser.add_argument("--rows", type=int, default=100_000, help="Synthetic row count.")
+    parsers_parser.add_argument(
+        "--distinct", type=int, default=2_000, help="Distinct texts per synthetic column."
+    )
+    parsers_parser.add_argument("--seed", type=int, default=7, help="Synthetic corpus seed.")
+    parsers_parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per path; the fastest is reported."
+    )
+    parsers_parser.add_argument("--output", default=None, help="Optional JSON results path.")
+    parsers_parser.add_argument(
+        "--baseline", default=None, help="JSON results of an earlier run to compare against."
+    )
+    parsers_parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed throughput drop vs the baseline before failing (0.2 = 20%%).",
+    )
+    parsers_parser.add_argument(
+        "--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"]
+    )
+
+    args = parser.parse_args()
+    if args.command == "parsers":
+        setup_logging(args.log_level)
+        results = run_parser_benchmark(
+            args.rows, distinct=args.distinct, seed=args.seed, repeat=args.repeat
+        )
+        baseline = None
+        if args.baseline:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+            results["regressions"] = compare_to_baseline(
+                results, baseline, max_regression=args.max_regression
+            )
+        print(render_parser_table(results, baseline))
+        if args.output:
+            out_path = Path(args.output)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        if results.get("regressions"):
+            slow = ", ".join(f"{r['parser']}/{r['path']}" for r in results["regressions"])
+            raise SystemExit(
+                f"Parser throughput regressed more than {args.max_regression:.0%}: {slow}"
+            )
+    if args.command == "memory":
+        setup_logging(args.log_level)
+        results = run_memory_benchmark(
+            args.rows, seed=args.seed, trace_allocations=not args.no_tracemalloc
+        )
+        print(render_memory_table(results))
+        if args.output:
+            out_path = Path(args.output)
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
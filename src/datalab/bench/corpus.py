@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+SALARY_TEXTS = [
+    "15-25K",
+    "15-25K·13薪",
+    "20-30k 14薪",
+    "1.5-2万",
+    "1-1.5万·16薪",
+    "8千-1.2万",
+    "30-50K",
+    "3万以上",
+    "8千以下",
+    "25k+",
+    "面议",
+    "薪资面议",
+    "待定",
+    "12K",
+    "",
+]
+EXP_TEXTS = [
+    "1-3年",
+    "3-5年",
+    "5-10年",
+    "3-5年经验",
+    "1年以上",
+    "5年以上",
+    "3年以下",
+    "10年",
+    "应届生",
+    "在校/应届",
+    "经验不限",
+    "无经验",
+    "",
+]
+EDU_TEXTS = ["本科", "本科及以上", "硕士", "博士", "大专", "中专/中技", "高中", "学历不限", ""]
+TITLE_STEMS = [
+    "Python开发工程师",
+    "大数据开发工程师(Spark/Hive)",
+    "数据分析师 SQL",
+    "Airflow 数据平台工程师",
+    "后端工程师 Java",
+    "机器学习工程师 PyTorch",
+    "云平台工程师 AWS/K8s",
+    "数据仓库工程师",
+    "运维工程师 Docker",
+    "产品经理",
+]
+CITIES = ["北京", "上海", "深圳", "杭州", "广州", "成都", "武汉", "南京"]
+
+
+_SALARY_UNITS = ["k", "K", "千", "万", "w"]
+_SALARY_SUFFIXES = ["", "", "·13薪", "·14薪", " 16薪", "/月"]
+_EXP_SUFFIXES = ["", "经验", "工作经验", "以上经验"]
+_EDU_SUFFIXES = ["", "及以上", "以上学历", "(统招)"]
+
+
+def synthetic_parser_texts(rows: int, distinct: int = 2_000, seed: int = 7) -> pd.DataFrame:
+    """
+    Deterministic salary, experience and education strings for parser benchmarks.
+
+    Strings are composed from numbers, units (k/千/万), month counts (薪), 面议,
+    以上/以下 and ranges, giving up to `distinct` different texts per column that
+    repeat across `rows` the way real postings do.
+    """
+    rng = np.random.default_rng(seed)
+    size = max(distinct, 1)
+    low = rng.integers(1, 60, size)
+    high = low + rng.integers(1, 30, size)
+    unit = np.asarray(_SALARY_UNITS, dtype=object)[rng.integers(0, len(_SALARY_UNITS), size)]
+    suffix = np.asarray(_SALARY_SUFFIXES, dtype=object)[
+        rng.integers(0, len(_SALARY_SUFFIXES), size)
+    ]
+    shape = rng.integers(0, 10, size)
+    salary = []
+    exp = []
+    for i in range(size):
+        if shape[i] == 0:
+            salary.append(["面议", "薪资面议", "待定"][i % 3])
+        elif shape[i] == 1:
+            salary.append(f"{low[i]}{unit[i]}{['以上', '以下', '+'][i % 3]}")
+        elif shape[i] == 2:
+            salary.append(f"{low[i]}{unit[i]}{suffix[i]}")
+        elif shape[i] == 3:
+            salary.append(f"{low[i] / 10:g}-{high[i] / 10:g}万{suffix[i]}")
+        else:
+            salary.append(f"{low[i]}-{high[i]}{unit[i]}{suffix[i]}")
+        years = low[i] % 12
+        exp_suffix = _EXP_SUFFIXES[i % len(_EXP_SUFFIXES)]
+        exp.append(
+            [
+                f"{years}-{years + high[i] % 5 + 1}年{exp_suffix}",
+                f"{years}年以上",
+                f"{years}年以下",
+                f"{years}年{exp_suffix}",
+                ["经验不限", "应届生", "在校/应届", "无经验"][i % 4],
+            ][shape[i] % 5]
+        )
+    levels = [text for text in EDU_TEXTS if "以上" not in text]
+    edu = [
+        f"{levels[i % len(levels)]}{_EDU_SUFFIXES[i // len(levels) % len(_EDU_SUFFIXES)]}"
+        for i in range(size)
+    ]
+    picks = rng.integers(0, size, (3, rows))
+    return pd.DataFrame(
+        {
+            "salary_text": np.asarray(salary, dtype=object)[picks[0]],
+            "exp_text": np.asarray(exp, dtype=object)[picks[1]],
+            "edu_text": np.asarray(edu, dtype=object)[picks[2]],
+        }
+    )
+
+
+def synthetic_jobs_frame(rows: int, seed: int = 7) -> pd.DataFrame:
+    """
+    Deterministic crawl-like JD frame for benchmarks.
+
+    Text columns are drawn from small realistic vocabularies, so cardinality stays
+    low relative to row count as it does in real crawls; about 3% of rows repeat an
+    earlier url.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows)
+    dup_mask = rng.random(rows) < 0.03
+    ids[dup_mask] = rng.integers(0, max(rows, 1), dup_mask.sum())
+
+    def pick(values: list[str]) -> np.ndarray:
+        return np.asarray(values, dtype=object)[rng.integers(0, len(values), rows)]
+
+    return pd.DataFrame(
+        {
+            "url": np.char.add("https://example.com/job/", ids.astype(str)).astype(object),
+            "title": pick(TITLE_STEMS),
+            "company": np.char.add("公司", rng.integers(0, 2000, rows).astype(str)).astype(object),
+            "city": pick(CITIES),
+            "publish_date": pd.Timestamp("2025-01-01")
+            + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+            "salary_text": pick(SALARY_TEXTS),
+            "exp_text": pick(EXP_TEXTS),
+            "edu_text": pick(EDU_TEXTS),
+        }
+    )
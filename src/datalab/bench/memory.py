@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import multiprocessing
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from datalab.bench.corpus import synthetic_jobs_frame
+from datalab.cleaning import clean_dataframe
+
+_MB = 1024 * 1024
+_CLEAR_REFS = Path("/proc/self/clear_refs")
+_STATUS = Path("/proc/self/status")
+
+
+def _reset_rss_peak() -> bool:
+    """Reset the kernel's peak-RSS counter (Linux only); False when unsupported."""
+    try:
+        _CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def _rss_peak_mb() -> float:
+    if _STATUS.exists():
+        for line in _STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    # ru_maxrss is KiB on Linux, bytes on macOS, and cannot be reset.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / _MB if sys.platform == "darwin" else peak / 1024
+
+
+def profile_clean_stages(
+    rows: int, copy_on_write: bool, seed: int = 7, trace_allocations: bool = True
+) -> dict[str, Any]:
+    """
+    Run `clean_dataframe` on a synthetic frame and record per-stage wall time, peak
+    RSS and peak traced allocations.
+
+    Peak RSS is per stage only where the kernel counter can be reset (Linux);
+    elsewhere it is the process high-water mark so far.
+    """
+    frame = synthetic_jobs_frame(rows, seed=seed)
+    stages: list[dict[str, Any]] = []
+    rss_resettable = _reset_rss_peak()
+    if trace_allocations:
+        tracemalloc.start()
+
+    @contextmanager
+    def stage_hook(name: str) -> Iterator[None]:
+        if rss_resettable:
+            _reset_rss_peak()
+        if trace_allocations:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        yield
+        record = {
+            "stage": name,
+            "seconds": round(time.perf_counter() - start, 4),
+            "peak_rss_mb": round(_rss_peak_mb(), 1),
+        }
+        if trace_allocations:
+            record["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / _MB, 1)
+        stages.append(record)
+
+    try:
+        cleaned = clean_dataframe(frame, copy_on_write=copy_on_write, stage_hook=stage_hook)
+    finally:
+        if trace_allocations:
+            tracemalloc.stop()
+    return {
+        "rows": rows,
+        "rows_cleaned": len(cleaned),
+        "copy_on_write": copy_on_write,
+        "rss_per_stage": rss_resettable,
+        "stages": stages,
+    }
+
+
+def run_memory_benchmark(
+    rows: int, seed: int = 7, trace_allocations: bool = True
+) -> dict[str, Any]:
+    """Profile the copying and copy-on-write modes, each in a fresh interpreter."""
+    ctx = multiprocessing.get_context("spawn")
+    results: dict[str, Any] = {"rows": rows, "modes": {}}
+    for mode, cow in (("copy", False), ("copy_on_write", True)):
+        with ctx.Pool(1) as pool:
+            results["modes"][mode] = pool.apply(
+                profile_clean_stages, (rows, cow, seed, trace_allocations)
+            )
+    return results
+
+
+def render_memory_table(results: dict[str, Any]) -> str:
+    before = results["modes"]["copy"]["stages"]
+    after = {s["stage"]: s for s in results["modes"]["copy_on_write"]["stages"]}
+    headers = ["stage", "rss_mb copy", "rss_mb cow", "traced_mb copy", "traced_mb cow"]
+    headers += ["s copy", "s cow"]
+    lines = ["| " + " | ".join(headers) + " |", "| " + " | ".join(["---"] * len(headers)) + " |"]
+    for stage in before:
+        other = after.get(stage["stage"], {})
+        cells = [
+            stage["stage"],
+            stage["peak_rss_mb"],
+            other.get("peak_rss_mb", "-"),
+            stage.get("peak_traced_mb", "-"),
+            other.get("peak_traced_mb", "-"),
+            stage["seconds"],
+            other.get("seconds", "-"),
+        ]
+        lines.append("| " + " | ".join(str(c) for c in cells) + " |")
+    return "\n".join(lines)
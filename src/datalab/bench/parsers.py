@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable
+
+import pandas as pd
+
+from datalab.bench.corpus import synthetic_parser_texts
+from datalab.jd_features import (
+    normalize_education,
+    normalize_education_memoized,
+    normalize_education_series,
+    parse_experience,
+    parse_experience_memoized,
+    parse_experience_series,
+    parse_salary,
+    parse_salary_memoized,
+    parse_salary_series,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_REGRESSION = 0.2
+PARSER_PATHS: dict[str, tuple[str, dict[str, Callable[[pd.Series], Any]]]] = {
+    "salary": (
+        "salary_text",
+        {
+            "scalar": lambda series: series.apply(parse_salary),
+            "vectorized": parse_salary_series,
+            "memoized": parse_salary_memoized,
+        },
+    ),
+    "experience": (
+        "exp_text",
+        {
+            "scalar": lambda series: series.apply(parse_experience),
+            "vectorized": parse_experience_series,
+            "memoized": parse_experience_memoized,
+        },
+    ),
+    "education": (
+        "edu_text",
+        {
+            "scalar": lambda series: series.apply(normalize_education),
+            "vectorized": normalize_education_series,
+            "memoized": normalize_education_memoized,
+        },
+    ),
+}
+
+
+def run_parser_benchmark(
+    rows: int, distinct: int = 2_000, seed: int = 7, repeat: int = 3
+) -> dict[str, Any]:
+    """
+    Time the scalar, vectorized and memoized paths of each JD text parser.
+
+    Each path runs `repeat` times over the same synthetic column and the fastest
+    run is reported, as seconds and rows per second.
+    """
+    corpus = synthetic_parser_texts(rows, distinct=distinct, seed=seed)
+    results: dict[str, Any] = {
+        "rows": rows,
+        "distinct": distinct,
+        "seed": seed,
+        "repeat": repeat,
+        "parsers": {},
+    }
+    for parser, (column, paths) in PARSER_PATHS.items():
+        series = corpus[column]
+        timings = {}
+        for path, func in paths.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func(series)
+                best = min(best, time.perf_counter() - start)
+            timings[path] = {
+                "seconds": round(best, 6),
+                "rows_per_sec": round(rows / max(best, 1e-9), 1),
+            }
+        results["parsers"][parser] = {"distinct": int(series.nunique()), "paths": timings}
+    return results
+
+
+def compare_to_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> list[dict[str, Any]]:
+    """
+    List parser paths whose throughput fell more than `max_regression` below `baseline`.
+
+    Only paths present in both result sets are compared; throughput is compared
+    directly, so both should come from the same machine and corpus settings.
+    """
+    for key in ("rows", "distinct", "seed"):
+        if key in baseline and baseline[key] != results[key]:
+            logger.warning(
+                "Baseline %s=%s differs from this run (%s); throughput may not be comparable",
+                key,
+                baseline[key],
+                results[key],
+            )
+    regressions = []
+    for parser, entry in results["parsers"].items():
+        base_paths = baseline.get("parsers", {}).get(parser, {}).get("paths", {})
+        for path, timing in entry["paths"].items():
+            if path not in base_paths:
+                continue
+            before = float(base_paths[path]["rows_per_sec"])
+            after = float(timing["rows_per_sec"])
+            if before > 0 and after < before * (1 - max_regression):
+                regressions.append(
+                    {
+                        "parser": parser,
+                        "path": path,
+                        "baseline_rows_per_sec": before,
+                        "rows_per_sec": after,
+                        "change": round(after / before - 1, 4),
+                    }
+                )
+    return regressions
+
+
+def render_parser_table(
+    results: dict[str, Any], baseline: dict[str, Any] | None = None
+) -> str:
+    headers = ["parser", "path", "seconds", "rows/s"]
+    if baseline is not None:
+        headers += ["baseline rows/s", "change"]
+    lines = ["| " + " | ".join(headers) + " |", "| " + " | ".join(["---"] * len(headers)) + " |"]
+    for parser, entry in results["parsers"].items():
+        base_paths = (baseline or {}).get("parsers", {}).get(parser, {}).get("paths", {})
+        for path, timing in entry["paths"].items():
+            cells = [parser, path, timing["seconds"], f"{timing['rows_per_sec']:,.0f}"]
+            if baseline is not None:
+                before = base_paths.get(path, {}).get("rows_per_sec")
+                cells.append(f"{before:,.0f}" if before else "-")
+                cells.append(
+                    f"{timing['rows_per_sec'] / before - 1:+.1%}" if before else "-"
+                )
+            lines.append("| " + " | ".join(str(c) for c in cells) + " |")
+    return "\n".join(lines)
@@ -1,15 +1,73 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
+import math
+import os
+import sys
 from pathlib import Path
+from typing import Any, Sequence
 
-from datalab.cleaning import clean_dataframe
-from datalab.config import ConfigValidationError, load_schema_config, resolve_section_config
-from datalab.io import read_input_data
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from datalab import __version__
+from datalab.cleaning import (
+    DEFAULT_CATEGORICAL_MAX_RATIO,
+    DERIVED_COLUMN_GROUPS,
+    JD_INPUT_COLUMNS,
+    build_dedupe_keys,
+    clean_dataframe,
+    derived_column_groups,
+    finalize_dataframe,
+    iqr_bounds_from_sketches,
+    prepare_dataframe,
+    recompute_derived_columns,
+    update_iqr_sketches,
+)
+from datalab.config import (
+    VALID_DTYPE_BACKENDS,
+    VALID_READ_ENGINES,
+    ConfigValidationError,
+    load_schema_config,
+    resolve_section_config,
+)
+from datalab.dedupe_index import SeenKeyIndex
+from datalab.exceptions import DataReadError, DataValidationError
+from datalab.io import discover_input_files, iter_input_data, read_input_data
+from datalab.jd.analyze import generate_jd_market_report
+from datalab.jd_features import PARSER_FINGERPRINT
 from datalab.logging_utils import setup_logging
-from datalab.metrics import compute_metrics, write_metrics
-from datalab.report import build_quality_report, write_quality_report
+from datalab.manifest import (
+    MANIFEST_VERSION,
+    describe_file,
+    is_cached,
+    load_inferred_types,
+    load_manifest,
+    settings_fingerprint,
+    shard_path_for,
+    write_inferred_types,
+    write_manifest,
+)
+from datalab.memory import copy_on_write as enable_copy_on_write
+from datalab.metrics import KEY_COLUMNS, compute_metrics, write_metrics
+from datalab.parse_cache import ParseCache
+from datalab.quantiles import KLLSketch
+from datalab.report import (
+    build_quality_report,
+    build_quality_report_from_parquet,
+    write_quality_report,
+)
+from datalab.skill_tags import (
+    SKILL_BITS_FILENAME,
+    SKILL_LONG_TABLE_FILENAME,
+    skill_bit_tags,
+    skill_long_table as build_skill_long_table,
+    write_skill_bits,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,32 +87,326 @@ def build_parser() -> argparse.ArgumentParser:
         required=False,
         help="Optional legacy schema YAML path (root must contain `schema`).",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Stream input in batches of this many rows instead of loading it all at once.",
+    )
+    parser.add_argument(
+        "--io-workers",
+        type=int,
+        default=None,
+        help="Parse input files concurrently with this many workers (non-streaming mode).",
+    )
+    parser.add_argument(
+        "--engine",
+        default=None,
+        choices=sorted(VALID_READ_ENGINES),
+        help="CSV/JSONL parser: pandas (default) or pyarrow (multithreaded).",
+    )
+    parser.add_argument(
+        "--dtype-backend",
+        default=None,
+        choices=sorted(VALID_DTYPE_BACKENDS),
+        help="Keep text columns as NumPy objects (default) or as string[pyarrow].",
+    )
+    parser.add_argument(
+        "--columns",
+        default=None,
+        help=(
+            "Comma-separated input columns to load; `jd` expands to the columns the JD "
+            "cleaning stages read. Columns referenced by `schema` are always kept."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=None,
+        help="Only re-clean input files that changed since the last run into this output.",
+    )
+    parser.add_argument(
+        "--copy-on-write",
+        action="store_true",
+        default=None,
+        help="Run cleaning stages under pandas copy-on-write instead of copying per stage.",
+    )
+    parser.add_argument(
+        "--near-duplicate-threshold",
+        type=float,
+        default=None,
+        help=(
+            "Also collapse reposted listings whose title/company/city text is at least "
+            "this similar (0-1, MinHash estimate). Off by default."
+        ),
+    )
+    parser.add_argument(
+        "--outlier-sketch",
+        action="store_true",
+        default=None,
+        help=(
+            "Streaming mode: clip outliers with IQR bounds from quantile sketches merged "
+            "over all batches instead of per-batch quartiles."
+        ),
+    )
+    parser.add_argument(
+        "--categorical-max-ratio",
+        type=float,
+        default=None,
+        help=(
+            "Store text columns whose distinct values are at most this share of their "
+            "values as categories, e.g. 0.5 (default: 0, off)."
+        ),
+    )
+    parser.add_argument(
+        "--seen-index",
+        default=None,
+        help=(
+            "Path of a persistent dedupe key index (.npy); rows already recorded there "
+            "are dropped and new keys are added after the run."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Extract JD features and skill tags on row partitions in this many worker "
+            "processes."
+        ),
+    )
+    parser.add_argument(
+        "--skill-token-boundaries",
+        action="store_true",
+        default=None,
+        help=(
+            "Match ASCII skill keywords only as whole tokens (e.g. 'py' not inside "
+            "'happy'); CJK keywords still match anywhere."
+        ),
+    )
+    parser.add_argument(
+        "--skill-long-table",
+        action="store_true",
+        default=None,
+        help=f"Also write {SKILL_LONG_TABLE_FILENAME} with one (row_id, tag) row per matched skill.",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        default=None,
+        help=(
+            "Directory of Parquet lookup tables of already parsed salary, experience and "
+            "education texts, shared across runs."
+        ),
+    )
     parser.add_argument(
         "--log-level", default=None, choices=["DEBUG", "INFO", "WARNING", "ERROR"]
     )
     return parser
 
 
+def parse_columns(value: Any) -> list[str] | None:
+    """Normalize a `columns` option from CLI (comma string) or YAML (list)."""
+    if value is None:
+        return None
+    items = value.split(",") if isinstance(value, str) else list(value)
+    columns: list[str] = []
+    for item in (str(v).strip() for v in items):
+        if item == "jd":
+            columns.extend(JD_INPUT_COLUMNS)
+        elif item:
+            columns.append(item)
+    return list(dict.fromkeys(columns)) or None
+
+
 def run_pipeline(
     input_path: str,
     output_path: str,
     schema: dict[str, object] | None,
     topk: int,
     skill_dictionary: dict[str, list[str]] | None = None,
+    batch_size: int | None = None,
+    io_workers: int = 1,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+    incremental: bool = False,
+    copy_on_write: bool = False,
+    seen_index: str | None = None,
+    near_duplicate_threshold: float | None = None,
+    outlier_sketch: bool = False,
+    imputation: Sequence[dict[str, Any]] | None = None,
+    categorical_max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+    parse_cache: str | None = None,
+    workers: int = 1,
+    skill_token_boundaries: bool = False,
+    skill_long_table: bool = False,
 ) -> None:
+    if columns is not None:
+        columns = parse_columns([*columns, *(schema or {})])
+    if incremental and batch_size:
+        raise ValueError("incremental mode cannot be combined with batch_size streaming.")
+    if outlier_sketch and not batch_size:
+        raise ValueError("outlier_sketch requires batch_size streaming.")
+    if incremental and seen_index:
+        raise ValueError("incremental mode cannot be combined with a seen-key index.")
+    if incremental:
+        _run_incremental_pipeline(
+            input_path=input_path,
+            output_path=output_path,
+            schema=schema,
+            topk=topk,
+            skill_dictionary=skill_dictionary,
+            imputation=imputation,
+            categorical_max_ratio=categorical_max_ratio,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            columns=columns,
+            copy_on_write=copy_on_write,
+            near_duplicate_threshold=near_duplicate_threshold,
+            parse_cache=parse_cache,
+            workers=workers,
+            skill_token_boundaries=skill_token_boundaries,
+            skill_long_table=skill_long_table,
+        )
+        return
+    if batch_size:
+        _run_streaming_pipeline(
+            input_path=input_path,
+            output_path=output_path,
+            schema=schema,
+            topk=topk,
+            skill_dictionary=skill_dictionary,
+            imputation=imputation,
+            categorical_max_ratio=categorical_max_ratio,
+            batch_size=batch_size,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            columns=columns,
+            copy_on_write=copy_on_write,
+            seen_index=seen_index,
+            near_duplicate_threshold=near_duplicate_threshold,
+            outlier_sketch=outlier_sketch,
+            parse_cache=parse_cache,
+            workers=workers,
+            skill_token_boundaries=skill_token_boundaries,
+            skill_long_table=skill_long_table,
+        )
+        return
+
     logger.info("Reading raw data from %s", input_path)
-    raw_df = read_input_data(input_path)
+    raw_df = read_input_data(
+        input_path,
+        workers=io_workers,
+        engine=engine,
+        dtype_backend=dtype_backend,
+        columns=columns,
+    )
     logger.info("Loaded %s rows and %s columns", len(raw_df), len(raw_df.columns))
 
-    cleaned = clean_dataframe(raw_df, schema=schema or {}, skill_dictionary=skill_dictionary)
+    raw_rows = len(raw_df)
     out_dir = Path(output_path)
+    type_cache = load_inferred_types(out_dir)
+    inferred_types = type_cache.setdefault(str(Path(input_path).resolve()), {})
+    near_duplicates = {} if near_duplicate_threshold is not None else None
+    missing_sentinels: dict[str, int] = {}
+    parsed_texts = ParseCache(parse_cache, PARSER_FINGERPRINT)
+    cleaned = clean_dataframe(
+        raw_df,
+        schema=schema or {},
+        skill_dictionary=skill_dictionary,
+        imputation=imputation,
+        categorical_max_ratio=categorical_max_ratio,
+        dtype_backend=dtype_backend,
+        copy_on_write=copy_on_write,
+        inferred_types=inferred_types,
+        sentinel_counts=missing_sentinels,
+        near_duplicate_threshold=near_duplicate_threshold,
+        near_duplicate_stats=near_duplicates,
+        parse_cache=parsed_texts,
+        workers=workers,
+        skill_token_boundaries=skill_token_boundaries,
+    )
+    del raw_df
+    if parse_cache:
+        parsed_texts.save()
+    index = SeenKeyIndex(seen_index) if seen_index else None
+    if index is not None:
+        cleaned = _drop_seen(cleaned, index)
+    _write_outputs(
+        cleaned,
+        out_dir,
+        topk=topk,
+        raw_rows=raw_rows,
+        near_duplicates=near_duplicates,
+        missing_sentinels=missing_sentinels,
+    )
+    _write_skill_outputs(cleaned, out_dir, skill_dictionary, skill_long_table)
+    # Only record keys once their rows are written, so a failed write does not make
+    # the next run drop them as already seen.
+    if index is not None:
+        index.save()
+    write_inferred_types(type_cache, out_dir)
+
+
+def _drop_seen(cleaned: pd.DataFrame, index: SeenKeyIndex) -> pd.DataFrame:
+    """Drop rows whose dedupe key is already in `index`, then record the rest."""
+    keys = build_dedupe_keys(cleaned)
+    fresh = ~index.contains(keys)
+    index.add(keys[fresh])
+    dropped = len(cleaned) - int(fresh.sum())
+    if dropped:
+        logger.debug("Dropped %s rows already present in the seen-key index", dropped)
+    return cleaned.loc[fresh].reset_index(drop=True)
+
+
+def _write_skill_outputs(
+    cleaned: pd.DataFrame | None,
+    out_dir: Path,
+    skill_dictionary: dict[str, list[str]] | None,
+    long_table: bool,
+) -> None:
+    """
+    Write the `skill_mask` bit map and, if asked, the `(row_id, tag)` long table.
+
+    Outputs that this run does not produce are removed, so stale ones from earlier
+    runs are not read back with the new `cleaned.parquet`. `cleaned=None` leaves the
+    long table to the caller (streaming mode writes it batch by batch).
+    """
+    tags = skill_bit_tags(skill_dictionary)
+    if tags:
+        write_skill_bits(tags, out_dir)
+    else:
+        logger.warning("Skill dictionary has more than 64 tags; not writing skill_mask bits")
+        (out_dir / SKILL_BITS_FILENAME).unlink(missing_ok=True)
+    long_path = out_dir / SKILL_LONG_TABLE_FILENAME
+    if not long_table:
+        long_path.unlink(missing_ok=True)
+    elif cleaned is not None:
+        build_skill_long_table(cleaned, tags).to_parquet(long_path, index=False)
+        logger.info("Wrote skill long table: %s", long_path)
+
+
+def _write_outputs(
+    cleaned: pd.DataFrame,
+    out_dir: Path,
+    topk: int,
+    raw_rows: int,
+    near_duplicates: dict[str, Any] | None = None,
+    missing_sentinels: dict[str, int] | None = None,
+) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     parquet_path = out_dir / "cleaned.parquet"
     cleaned.to_parquet(parquet_path, index=False)
     logger.info("Wrote cleaned parquet: %s", parquet_path)
 
-    metrics = compute_metrics(raw_df=raw_df, cleaned_df=cleaned)
+    metrics = compute_metrics(
+        raw_df=None,
+        cleaned_df=cleaned,
+        raw_rows=raw_rows,
+        near_duplicates=near_duplicates,
+        missing_sentinels=missing_sentinels,
+    )
     metrics_path = write_metrics(metrics, out_dir)
     logger.info("Wrote metrics json: %s", metrics_path)
 
@@ -63,9 +415,724 @@ def run_pipeline(
     logger.info("Wrote quality report: %s", report_path)
 
 
-def main() -> None:
+def _run_incremental_pipeline(
+    input_path: str,
+    output_path: str,
+    schema: dict[str, object] | None,
+    topk: int,
+    skill_dictionary: dict[str, list[str]] | None,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+    copy_on_write: bool = False,
+    near_duplicate_threshold: float | None = None,
+    imputation: Sequence[dict[str, Any]] | None = None,
+    categorical_max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+    parse_cache: str | None = None,
+    workers: int = 1,
+    skill_token_boundaries: bool = False,
+    skill_long_table: bool = False,
+) -> None:
+    """
+    Re-clean only input files that are new or changed since the previous run.
+
+    Row-local stages (`prepare_dataframe`) run per file and are cached as Parquet
+    shards next to the outputs, tracked by a manifest of size, mtime and content
+    hash. All shards are then merged and go through dedupe, clipping and schema
+    enforcement together, so outputs cover the full input set. Fills and type
+    inference therefore use per-file statistics.
+    """
+    files = discover_input_files(input_path)
+    if not files:
+        raise DataReadError(f"No supported files found under: {input_path}")
+    out_dir = Path(output_path)
+    manifest = load_manifest(out_dir)
+    settings = settings_fingerprint(
+        {
+            "version": __version__,
+            "parser": PARSER_FINGERPRINT,
+            "skill_dictionary": skill_dictionary,
+            "skill_token_boundaries": skill_token_boundaries,
+            "skill_bits": skill_bit_tags(skill_dictionary),
+            "imputation": imputation,
+            "engine": engine,
+            "dtype_backend": dtype_backend,
+            "columns": list(columns) if columns is not None else None,
+        }
+    )
+    previous_files = manifest["files"] if manifest.get("settings") == settings else {}
+    type_cache = load_inferred_types(out_dir)
+    parsed_texts = ParseCache(parse_cache, PARSER_FINGERPRINT)
+
+    file_entries: dict[str, dict[str, Any]] = {}
+    shards: list[pd.DataFrame] = []
+    reused = 0
+    for file_path in files:
+        key = str(file_path.resolve())
+        previous = previous_files.get(key)
+        entry = describe_file(file_path, previous)
+        shard_path = shard_path_for(out_dir, key)
+        if is_cached(entry, previous, shard_path):
+            entry["rows"] = int(previous["rows"])
+            entry["missing_sentinels"] = previous.get("missing_sentinels", {})
+            shard = pd.read_parquet(shard_path)
+            reused += 1
+        else:
+            raw_df = read_input_data(
+                file_path, engine=engine, dtype_backend=dtype_backend, columns=columns
+            )
+            entry["rows"] = len(raw_df)
+            entry["missing_sentinels"] = {}
+            with enable_copy_on_write(copy_on_write):
+                shard = prepare_dataframe(
+                    raw_df,
+                    skill_dictionary=skill_dictionary,
+                    imputation=imputation,
+                    inferred_types=type_cache.setdefault(key, {}),
+                    sentinel_counts=entry["missing_sentinels"],
+                    parse_cache=parsed_texts,
+                    workers=workers,
+                    skill_token_boundaries=skill_token_boundaries,
+                )
+            del raw_df
+            shard_path.parent.mkdir(parents=True, exist_ok=True)
+            shard.to_parquet(shard_path, index=False)
+        file_entries[key] = entry
+        shards.append(shard)
+    logger.info("Incremental clean: %s cached, %s re-cleaned files", reused, len(files) - reused)
+    if parse_cache:
+        parsed_texts.save()
+
+    for stale in set(manifest["files"]) - set(file_entries):
+        shard_path_for(out_dir, stale).unlink(missing_ok=True)
+    type_cache = {key: types for key, types in type_cache.items() if key in file_entries}
+
+    # Types are inferred per file, so shards may disagree on a column's type.
+    merged = pd.concat(_align_shard_types(shards), ignore_index=True, sort=False)
+    del shards
+    near_duplicates = {} if near_duplicate_threshold is not None else None
+    with enable_copy_on_write(copy_on_write):
+        cleaned = finalize_dataframe(
+            merged,
+            schema=schema or {},
+            dtype_backend=dtype_backend,
+            near_duplicate_threshold=near_duplicate_threshold,
+            near_duplicate_stats=near_duplicates,
+            categorical_max_ratio=categorical_max_ratio,
+        )
+    del merged
+    raw_rows = sum(entry["rows"] for entry in file_entries.values())
+    missing_sentinels: dict[str, int] = {}
+    for entry in file_entries.values():
+        for col, count in entry["missing_sentinels"].items():
+            missing_sentinels[col] = missing_sentinels.get(col, 0) + count
+    _write_outputs(
+        cleaned,
+        out_dir,
+        topk=topk,
+        raw_rows=raw_rows,
+        near_duplicates=near_duplicates,
+        missing_sentinels=missing_sentinels,
+    )
+    _write_skill_outputs(cleaned, out_dir, skill_dictionary, skill_long_table)
+    write_manifest(
+        {"version": MANIFEST_VERSION, "settings": settings, "files": file_entries}, out_dir
+    )
+    write_inferred_types(type_cache, out_dir)
+
+
+def _shared_type(current: pa.DataType, new: pa.DataType) -> pa.DataType:
+    """Narrowest type both `current` and `new` values can be cast to."""
+    if current == new or pa.types.is_null(new):
+        return current
+    if pa.types.is_null(current):
+        return new
+    if pa.types.is_dictionary(current) and pa.types.is_dictionary(new):
+        return pa.dictionary(pa.int32(), _shared_type(current.value_type, new.value_type))
+    if pa.types.is_dictionary(current):
+        # The first batch decides which columns are categories for the whole file.
+        return pa.dictionary(pa.int32(), _shared_type(current.value_type, new))
+    if pa.types.is_dictionary(new):
+        return _shared_type(current, new.value_type)
+    if pa.types.is_integer(current) and pa.types.is_integer(new):
+        return pa.int64()
+    numeric = (pa.types.is_integer, pa.types.is_floating)
+    if any(f(current) for f in numeric) and any(f(new) for f in numeric):
+        return pa.float64()
+    if pa.types.is_timestamp(current) and pa.types.is_timestamp(new):
+        return pa.timestamp("ns", tz=current.tz or new.tz)
+    if pa.types.is_large_string(current) or pa.types.is_large_string(new):
+        return pa.large_string()
+    return pa.string()
+
+
+def _cast_column(column: pa.ChunkedArray, target: pa.DataType) -> pa.ChunkedArray:
+    if column.type == target:
+        return column
+    if pa.types.is_null(column.type):
+        return pa.chunked_array([pa.nulls(len(column), type=target)])
+    if pa.types.is_dictionary(column.type) and not pa.types.is_dictionary(target):
+        column = column.cast(column.type.value_type)
+    if pa.types.is_dictionary(target) and not pa.types.is_dictionary(column.type):
+        column = column.cast(target.value_type)
+    return column.cast(target)
+
+
+def _cast_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    columns = [_cast_column(table[field.name], field.type) for field in schema]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _align_shard_types(shards: list[pd.DataFrame]) -> list[pd.DataFrame]:
+    """Cast shard columns in place to the type shared across shards (`_shared_type`)."""
+    schemas = [pa.Schema.from_pandas(shard, preserve_index=False) for shard in shards]
+    shared: dict[str, pa.DataType] = {}
+    for schema in schemas:
+        for field in schema:
+            shared[field.name] = _shared_type(shared.get(field.name, pa.null()), field.type)
+    for shard, schema in zip(shards, schemas):
+        for field in schema:
+            target = shared[field.name]
+            if field.type == target:
+                continue
+            column = pa.chunked_array([pa.array(shard[field.name], from_pandas=True)])
+            shard[field.name] = _cast_column(column, target).to_pandas().set_axis(shard.index)
+    return shards
+
+
+class _BatchParquetWriter:
+    """
+    Append cleaned batches to one Parquet file whose column types may still widen.
+
+    The first batch fixes the columns and their order. A later batch whose types
+    differ is cast to a type shared with the file's (`_shared_type`: typed values
+    for all-null columns, integers to floats, anything else to strings); when that
+    widens the file's schema, the rows written so far are rewritten one row group
+    at a time. Columns that stay all-null are written as strings.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = path
+        self._writer: pq.ParquetWriter | None = None
+        self._rewrites = 0
+
+    @property
+    def schema(self) -> pa.Schema | None:
+        return self._writer.schema if self._writer is not None else None
+
+    def write(self, frame: pd.DataFrame, batch_no: int) -> None:
+        if self._writer is None:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            # Later batches may hold more categories than the first one.
+            fields = [
+                field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+                if pa.types.is_dictionary(field.type)
+                else field
+                for field in table.schema
+            ]
+            schema = pa.schema(fields, metadata=table.schema.metadata)
+            self._writer = pq.ParquetWriter(self._file, schema)
+            self._writer.write_table(_cast_table(table, schema))
+            return
+
+        schema = self._writer.schema
+        extra = [col for col in frame.columns if col not in schema.names]
+        if extra:
+            logger.warning(
+                "Batch %s: dropping columns absent from first batch: %s", batch_no, extra
+            )
+        table = pa.Table.from_pandas(frame.reindex(columns=schema.names), preserve_index=False)
+        shared = [
+            field.with_type(_shared_type(field.type, table.schema.field(field.name).type))
+            for field in schema
+        ]
+        if any(a.type != b.type for a, b in zip(shared, schema)):
+            self._rewrite(pa.schema(shared, metadata=schema.metadata), batch_no)
+        try:
+            self._writer.write_table(_cast_table(table, self._writer.schema))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as exc:
+            raise DataValidationError(
+                f"Batch {batch_no} does not match the column types of earlier batches; "
+                "pin them with `schema` or use a larger batch size."
+            ) from exc
+
+    def _rewrite(self, schema: pa.Schema, batch_no: int | None = None) -> None:
+        old = self._writer.schema
+        changed = {new.name for new, prev in zip(schema, old) if new.type != prev.type}
+        if batch_no is not None:
+            logger.info("Batch %s: widening column types of %s", batch_no, sorted(changed))
+        # pandas metadata of the changed columns is taken from an empty frame of the
+        # new types, so reading the file back yields matching dtypes.
+        typed = pa.Schema.from_pandas(
+            schema.remove_metadata().empty_table().to_pandas(), preserve_index=False
+        )
+        schema = schema.with_metadata(_merged_pandas_metadata(old, typed, changed))
+        self._writer.close()
+        self._rewrites += 1
+        target = self.path.with_name(f"{self.path.name}.{self._rewrites}.tmp")
+        writer = pq.ParquetWriter(target, schema)
+        try:
+            with self._file.open("rb") as source:
+                parquet_file = pq.ParquetFile(source)
+                for group in range(parquet_file.num_row_groups):
+                    writer.write_table(_cast_table(parquet_file.read_row_group(group), schema))
+        except BaseException:
+            writer.close()
+            target.unlink(missing_ok=True)
+            raise
+        if self._file != self.path:
+            self._file.unlink()
+        self._file = target
+        self._writer = writer
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        schema = self._writer.schema
+        if any(pa.types.is_null(field.type) for field in schema):
+            self._rewrite(
+                pa.schema(
+                    [
+                        field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                        for field in schema
+                    ],
+                    metadata=schema.metadata,
+                )
+            )
+        self._writer.close()
+        if self._file != self.path:
+            os.replace(self._file, self.path)
+            self._file = self.path
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._file != self.path:
+            self._file.unlink(missing_ok=True)
+
+
+def _run_streaming_pipeline(
+    input_path: str,
+    output_path: str,
+    schema: dict[str, object] | None,
+    topk: int,
+    skill_dictionary: dict[str, list[str]] | None,
+    batch_size: int,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+    copy_on_write: bool = False,
+    seen_index: str | None = None,
+    near_duplicate_threshold: float | None = None,
+    outlier_sketch: bool = False,
+    imputation: Sequence[dict[str, Any]] | None = None,
+    categorical_max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+    parse_cache: str | None = None,
+    workers: int = 1,
+    skill_token_boundaries: bool = False,
+    skill_long_table: bool = False,
+) -> None:
+    """
+    Clean input batch by batch and append each batch to `cleaned.parquet`.
+
+    Peak memory follows `batch_size`: only the current batch and the 64-bit dedupe
+    keys seen so far are held. Missing-value fills and outlier bounds are computed
+    per batch. The first batch fixes the output columns; a later batch with other
+    column types widens them to a shared type (see `_BatchParquetWriter`). Type
+    inference decisions from the first batch are reused for later ones. Near
+    duplicates are only collapsed within a batch.
+
+    With `outlier_sketch` each batch is added to per-column KLL quantile sketches
+    instead of being clipped; the output is then clipped in one pass over its row
+    groups with bounds from the merged sketches.
+    """
+    logger.info("Streaming raw data from %s in batches of %s rows", input_path, batch_size)
+    out_dir = Path(output_path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    parquet_path = out_dir / "cleaned.parquet"
+
+    raw_rows = 0
+    seen_keys = SeenKeyIndex(seen_index)
+    near_duplicates = {} if near_duplicate_threshold is not None else None
+    missing_sentinels: dict[str, int] = {}
+    sketches: dict[str, KLLSketch] | None = {} if outlier_sketch else None
+    parsed_texts = ParseCache(parse_cache, PARSER_FINGERPRINT)
+    type_cache = load_inferred_types(out_dir)
+    inferred_types = type_cache.setdefault(str(Path(input_path).resolve()), {})
+    writer = _BatchParquetWriter(parquet_path)
+    skill_bits = skill_bit_tags(skill_dictionary)
+    long_writer: pq.ParquetWriter | None = None
+    rows_written = 0
+    try:
+        for batch_no, raw_batch in enumerate(
+            iter_input_data(
+                input_path,
+                batch_size=batch_size,
+                engine=engine,
+                dtype_backend=dtype_backend,
+                columns=columns,
+            ),
+            start=1,
+        ):
+            raw_rows += len(raw_batch)
+            cleaned = clean_dataframe(
+                raw_batch,
+                schema=schema or {},
+                skill_dictionary=skill_dictionary,
+                imputation=imputation,
+                categorical_max_ratio=categorical_max_ratio,
+                dtype_backend=dtype_backend,
+                copy_on_write=copy_on_write,
+                inferred_types=inferred_types,
+                sentinel_counts=missing_sentinels,
+                near_duplicate_threshold=near_duplicate_threshold,
+                near_duplicate_stats=near_duplicates,
+                clip_outliers=not outlier_sketch,
+                parse_cache=parsed_texts,
+                workers=workers,
+                skill_token_boundaries=skill_token_boundaries,
+            )
+            del raw_batch
+            cleaned = _drop_seen(cleaned, seen_keys)
+            if sketches is not None:
+                update_iqr_sketches(sketches, cleaned)
+            writer.write(cleaned, batch_no)
+            if skill_long_table:
+                long_table = pa.Table.from_pandas(
+                    build_skill_long_table(cleaned, skill_bits, row_offset=rows_written),
+                    preserve_index=False,
+                )
+                if long_writer is None:
+                    long_writer = pq.ParquetWriter(
+                        out_dir / SKILL_LONG_TABLE_FILENAME, long_table.schema
+                    )
+                long_writer.write_table(long_table.cast(long_writer.schema))
+            rows_written += len(cleaned)
+            logger.debug("Batch %s: %s raw rows so far", batch_no, raw_rows)
+    except BaseException:
+        writer.abort()
+        raise
+    else:
+        writer.close()
+    finally:
+        if long_writer is not None:
+            long_writer.close()
+    if writer.schema is None:
+        raise DataReadError(f"No rows found under: {input_path}")
+    if sketches is not None:
+        _clip_parquet(parquet_path, iqr_bounds_from_sketches(sketches))
+    logger.info("Wrote cleaned parquet: %s", parquet_path)
+    _write_skill_outputs(None, out_dir, skill_dictionary, skill_long_table)
+    write_inferred_types(type_cache, out_dir)
+    if seen_index:
+        seen_keys.save()
+    if parse_cache:
+        parsed_texts.save()
+
+    _write_parquet_reports(
+        parquet_path,
+        topk=topk,
+        raw_rows=raw_rows,
+        near_duplicates=near_duplicates,
+        missing_sentinels=missing_sentinels,
+    )
+
+
+def _write_parquet_reports(
+    parquet_path: Path,
+    topk: int,
+    raw_rows: int,
+    near_duplicates: dict[str, Any] | None = None,
+    missing_sentinels: dict[str, int] | None = None,
+) -> None:
+    """Write `metrics.json` and the quality report for a `cleaned.parquet` on disk."""
+    out_dir = parquet_path.parent
+    available = set(pq.read_schema(parquet_path).names)
+    metric_cols = [col for col in KEY_COLUMNS if col in available]
+    metric_df = pd.read_parquet(parquet_path, columns=metric_cols)
+    metrics = compute_metrics(
+        raw_df=None,
+        cleaned_df=metric_df,
+        raw_rows=raw_rows,
+        near_duplicates=near_duplicates,
+        missing_sentinels=missing_sentinels,
+    )
+    del metric_df
+    metrics_path = write_metrics(metrics, out_dir)
+    logger.info("Wrote metrics json: %s", metrics_path)
+
+    report = build_quality_report_from_parquet(parquet_path, topk=topk, metrics=metrics)
+    report_path = write_quality_report(report, out_dir)
+    logger.info("Wrote quality report: %s", report_path)
+
+
+def _clip_parquet(parquet_path: Path, bounds: dict[str, tuple[float, float]]) -> None:
+    """Clip columns of a Parquet file to `bounds`, rewriting it one row group at a time."""
+    tmp_path = parquet_path.with_name(parquet_path.name + ".tmp")
+    with parquet_path.open("rb") as source:
+        parquet_file = pq.ParquetFile(source)
+        schema = parquet_file.schema_arrow
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for group in range(parquet_file.num_row_groups):
+                table = parquet_file.read_row_group(group)
+                for col, (lower, upper) in bounds.items():
+                    index = schema.get_field_index(col)
+                    if index >= 0:
+                        table = table.set_column(
+                            index, schema.field(index), _clip_column(table[col], lower, upper)
+                        )
+                writer.write_table(table)
+    os.replace(tmp_path, parquet_path)
+
+
+def _clip_column(column: pa.ChunkedArray, lower: float, upper: float) -> pa.ChunkedArray:
+    if pa.types.is_integer(column.type):
+        # Round inward so that integer columns keep their type.
+        lower, upper = math.ceil(lower), math.floor(upper)
+    elif not pa.types.is_floating(column.type):
+        return column
+    low = pa.scalar(lower).cast(column.type)
+    high = pa.scalar(upper).cast(column.type)
+    clipped = pc.max_element_wise(
+        pc.min_element_wise(column, high, skip_nulls=False), low, skip_nulls=False
+    )
+    if pa.types.is_floating(column.type):
+        clipped = pc.if_else(pc.is_nan(column), column, clipped)
+    return clipped
+
+
+def run_recompute(
+    output_path: str,
+    columns: Sequence[str],
+    topk: int,
+    schema: dict[str, object] | None = None,
+    skill_dictionary: dict[str, list[str]] | None = None,
+    imputation: Sequence[dict[str, Any]] | None = None,
+    categorical_max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+    parse_cache: str | None = None,
+    skill_token_boundaries: bool = False,
+    skill_long_table: bool = False,
+) -> list[str]:
+    """
+    Recompute derived columns of an existing `cleaned.parquet` in place.
+
+    `columns` are glob patterns such as `skill_tags` or `salary_*`, resolved to
+    whole `DERIVED_COLUMN_GROUPS`. Only the source text columns of those groups (and
+    the group keys of matching imputation rules) are read; the file is then
+    rewritten one row group at a time with just the derived columns replaced.
+    `metrics.json`, the quality report, the skill outputs and an existing
+    `jd_market_report.md` are refreshed. Returns the replaced column names.
+    """
+    out_dir = Path(output_path)
+    parquet_path = out_dir / "cleaned.parquet"
+    if not parquet_path.exists():
+        raise DataReadError(f"Cleaned parquet not found: {parquet_path}")
+    groups = derived_column_groups(columns)
+    available = pq.read_schema(parquet_path).names
+    read_cols = [col for name in groups for col in DERIVED_COLUMN_GROUPS[name][0]]
+    for rule in imputation or []:
+        read_cols.extend(spec if isinstance(spec, str) else spec["column"] for spec in rule["by"])
+    read_cols = [col for col in dict.fromkeys(read_cols) if col in available]
+    logger.info("Recomputing %s from columns %s of %s", groups, read_cols, parquet_path)
+
+    parsed_texts = ParseCache(parse_cache, PARSER_FINGERPRINT)
+    derived = recompute_derived_columns(
+        pd.read_parquet(parquet_path, columns=read_cols),
+        groups,
+        skill_dictionary=skill_dictionary,
+        schema=schema,
+        imputation=imputation,
+        categorical_max_ratio=categorical_max_ratio,
+        parse_cache=parsed_texts,
+        skill_token_boundaries=skill_token_boundaries,
+    )
+    if parse_cache:
+        parsed_texts.save()
+    _replace_parquet_columns(parquet_path, derived)
+    logger.info("Replaced columns %s in %s", list(derived.columns), parquet_path)
+    if "skills" in groups:
+        _write_skill_outputs(derived, out_dir, skill_dictionary, skill_long_table)
+
+    metrics_path = out_dir / "metrics.json"
+    previous = json.loads(metrics_path.read_text(encoding="utf-8")) if metrics_path.exists() else {}
+    _write_parquet_reports(
+        parquet_path,
+        topk=topk,
+        raw_rows=int(previous.get("row_count_raw", len(derived))),
+        near_duplicates=previous.get("near_duplicates"),
+        missing_sentinels=previous.get("missing_sentinels"),
+    )
+    market_report = out_dir / "jd_market_report.md"
+    if market_report.exists():
+        generate_jd_market_report(parquet_path, market_report)
+    return list(derived.columns)
+
+
+def _replace_parquet_columns(parquet_path: Path, replacement: pd.DataFrame) -> None:
+    """
+    Swap columns of a Parquet file for those of `replacement`, one row group at a time.
+
+    Columns new to the file are appended. Replaced columns keep their stored Arrow
+    type where the new values cast to it, and the pandas metadata is updated so that
+    `pd.read_parquet` restores the new dtypes.
+    """
+    new_table = pa.Table.from_pandas(replacement, preserve_index=False)
+    tmp_path = parquet_path.with_name(parquet_path.name + ".tmp")
+    with parquet_path.open("rb") as source:
+        parquet_file = pq.ParquetFile(source)
+        old_schema = parquet_file.schema_arrow
+        if parquet_file.metadata.num_rows != new_table.num_rows:
+            raise DataValidationError(
+                f"Recomputed {new_table.num_rows} rows for {parquet_file.metadata.num_rows} "
+                f"rows in {parquet_path}."
+            )
+        columns = [pa.field(name, old_schema.field(name).type) for name in old_schema.names]
+        for index, field in enumerate(columns):
+            if field.name in new_table.column_names:
+                column = new_table[field.name]
+                try:
+                    new_table = new_table.set_column(
+                        new_table.column_names.index(field.name),
+                        field,
+                        column.cast(field.type),
+                    )
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                    columns[index] = new_table.schema.field(field.name)
+        columns.extend(field for field in new_table.schema if field.name not in old_schema.names)
+        retyped = {
+            field.name
+            for field in columns
+            if field.name not in old_schema.names or old_schema.field(field.name).type != field.type
+        }
+        metadata = _merged_pandas_metadata(old_schema, new_table.schema, retyped)
+        schema = pa.schema(columns, metadata=metadata)
+
+        kept = [name for name in old_schema.names if name not in new_table.column_names]
+        offset = 0
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for group in range(parquet_file.num_row_groups):
+                table = parquet_file.read_row_group(group, columns=kept)
+                part = new_table.slice(offset, table.num_rows)
+                offset += table.num_rows
+                writer.write_table(
+                    pa.Table.from_arrays(
+                        [
+                            table[name] if name in kept else part[name].cast(schema.field(name).type)
+                            for name in schema.names
+                        ],
+                        schema=schema,
+                    )
+                )
+    os.replace(tmp_path, parquet_path)
+
+
+def _merged_pandas_metadata(
+    old: pa.Schema, new: pa.Schema, names: set[str]
+) -> dict[bytes, bytes] | None:
+    # Take the pandas column entries of `names` from `new`, the rest from `old`.
+    old_meta = (old.metadata or {}).get(b"pandas")
+    new_meta = (new.metadata or {}).get(b"pandas")
+    if old_meta is None or new_meta is None:
+        return old.metadata
+    merged = json.loads(old_meta)
+    replaced = {
+        entry["name"]: entry for entry in json.loads(new_meta)["columns"] if entry["name"] in names
+    }
+    entries = [replaced.pop(entry["name"], entry) for entry in merged["columns"]]
+    index_names = {name for name in merged.get("index_columns", []) if isinstance(name, str)}
+    data_entries = [entry for entry in entries if entry["name"] not in index_names]
+    index_entries = [entry for entry in entries if entry["name"] in index_names]
+    merged["columns"] = [*data_entries, *replaced.values(), *index_entries]
+    return {**old.metadata, b"pandas": json.dumps(merged).encode("utf-8")}
+
+
+def _optional_float(value: Any) -> float | None:
+    return float(value) if value is not None else None
+
+
+def build_recompute_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m datalab.clean recompute",
+        description="Recompute derived columns of an existing cleaned.parquet in place.",
+    )
+    parser.add_argument(
+        "--output", required=False, help="Clean output directory holding cleaned.parquet."
+    )
+    parser.add_argument(
+        "--columns",
+        required=True,
+        help=(
+            "Comma-separated derived columns or globs to recompute, e.g. 'skill_tags,salary_*'. "
+            f"Groups: {', '.join(DERIVED_COLUMN_GROUPS)}."
+        ),
+    )
+    parser.add_argument("--config", required=False, help="Optional app config YAML path.")
+    parser.add_argument(
+        "--schema-config",
+        required=False,
+        help="Optional legacy schema YAML path (root must contain `schema`).",
+    )
+    parser.add_argument("--topk", type=int, default=None, help="Top K categories for report.")
+    parser.add_argument("--parse-cache", default=None, help="Parse cache directory.")
+    parser.add_argument("--skill-token-boundaries", action="store_true", default=None)
+    parser.add_argument("--skill-long-table", action="store_true", default=None)
+    parser.add_argument(
+        "--log-level", default=None, choices=["DEBUG", "INFO", "WARNING", "ERROR"]
+    )
+    return parser
+
+
+def recompute_main(argv: Sequence[str] | None = None) -> None:
+    parser = build_recompute_parser()
+    args = parser.parse_args(argv)
+    columns = [item.strip() for item in args.columns.split(",") if item.strip()]
+    try:
+        derived_column_groups(columns)
+    except ValueError as exc:
+        parser.error(str(exc))
+    try:
+        resolved = resolve_section_config(
+            "clean",
+            app_config_path=args.config,
+            cli_values={
+                "output": args.output,
+                "topk": args.topk,
+                "parse_cache": args.parse_cache,
+                "skill_token_boundaries": args.skill_token_boundaries,
+                "skill_long_table": args.skill_long_table,
+                "log_level": args.log_level,
+            },
+            required_keys={"output"},
+        )
+        setup_logging(str(resolved.get("log_level", "INFO")))
+        schema = load_schema_config(args.schema_config or args.config, app_config_path=args.config)
+        skill_dictionary = resolved.get("skill_dictionary")
+        run_recompute(
+            output_path=str(resolved["output"]),
+            columns=columns,
+            topk=int(resolved.get("topk", 5)),
+            schema=schema,
+            skill_dictionary=skill_dictionary if isinstance(skill_dictionary, dict) else None,
+            imputation=resolved.get("imputation"),
+            categorical_max_ratio=float(
+                resolved.get("categorical_max_ratio", DEFAULT_CATEGORICAL_MAX_RATIO)
+            ),
+            parse_cache=str(resolved["parse_cache"]) if resolved.get("parse_cache") else None,
+            skill_token_boundaries=bool(resolved.get("skill_token_boundaries", False)),
+            skill_long_table=bool(resolved.get("skill_long_table", False)),
+        )
+    except ConfigValidationError as exc:
+        raise SystemExit(f"Configuration error: {exc}") from exc
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["recompute"]:
+        recompute_main(argv[1:])
+        return
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     try:
         resolved = resolve_section_config(
             "clean",
@@ -74,6 +1141,21 @@ def main() -> None:
                 "input": args.input,
                 "output": args.output,
                 "topk": args.topk,
+                "batch_size": args.batch_size,
+                "io_workers": args.io_workers,
+                "engine": args.engine,
+                "dtype_backend": args.dtype_backend,
+                "columns": args.columns,
+                "incremental": args.incremental,
+                "copy_on_write": args.copy_on_write,
+                "seen_index": args.seen_index,
+                "near_duplicate_threshold": args.near_duplicate_threshold,
+                "outlier_sketch": args.outlier_sketch,
+                "categorical_max_ratio": args.categorical_max_ratio,
+                "parse_cache": args.parse_cache,
+                "workers": args.workers,
+                "skill_token_boundaries": args.skill_token_boundaries,
+                "skill_long_table": args.skill_long_table,
                 "log_level": args.log_level,
             },
             required_keys={"input", "output"},
@@ -87,6 +1169,24 @@ def main() -> None:
             schema=schema,
             topk=int(resolved.get("topk", 5)),
             skill_dictionary=skill_dictionary if isinstance(skill_dictionary, dict) else None,
+            batch_size=int(resolved["batch_size"]) if resolved.get("batch_size") else None,
+            io_workers=int(resolved.get("io_workers", 1)),
+            engine=str(resolved.get("engine", "pandas")),
+            dtype_backend=str(resolved.get("dtype_backend", "numpy")),
+            columns=parse_columns(resolved.get("columns")),
+            incremental=bool(resolved.get("incremental", False)),
+            copy_on_write=bool(resolved.get("copy_on_write", False)),
+            seen_index=str(resolved["seen_index"]) if resolved.get("seen_index") else None,
+            near_duplicate_threshold=_optional_float(resolved.get("near_duplicate_threshold")),
+            outlier_sketch=bool(resolved.get("outlier_sketch", False)),
+            imputation=resolved.get("imputation"),
+            categorical_max_ratio=float(
+                resolved.get("categorical_max_ratio", DEFAULT_CATEGORICAL_MAX_RATIO)
+            ),
+            parse_cache=str(resolved["parse_cache"]) if resolved.get("parse_cache") else None,
+            workers=int(resolved.get("workers", 1)),
+            skill_token_boundaries=bool(resolved.get("skill_token_boundaries", False)),
+            skill_long_table=bool(resolved.get("skill_long_table", False)),
         )
     except ConfigValidationError as exc:
         raise SystemExit(f"Configuration error: {exc}") from exc
@@ -1,66 +1,259 @@
 from __future__ import annotations
 
-from typing import Any
+from contextlib import nullcontext
+from fnmatch import fnmatchcase
+from functools import partial
+from typing import Any, Callable, ContextManager, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.api.types import (
     is_bool_dtype,
     is_datetime64_any_dtype,
     is_numeric_dtype,
+    infer_dtype,
     is_object_dtype,
 )
+from pandas.tseries.api import guess_datetime_format
 
-from datalab.exceptions import DataValidationError
-from datalab.jd_features import extract_jd_features
-from datalab.skill_tags import extract_skill_tags
+from datalab.io import apply_dtype_backend
+from datalab.jd_features import EXPERIENCE_COLUMNS, SALARY_COLUMNS, extract_jd_features
+from datalab.memory import copy_on_write as enable_copy_on_write
+from datalab.memory import working_copy
+from datalab.near_duplicates import remove_near_duplicates
+from datalab.parse_cache import ParseCache
+from datalab.partition import map_partitions
+from datalab.quantiles import KLLSketch
+from datalab.schema import DEFAULT_MAX_VIOLATIONS, cast_to_schema
+from datalab.skill_tags import SKILL_COLUMNS, SKILL_TEXT_COLUMNS, extract_skill_tags
 
 MISSING_LIKE = {"", " ", "NA", "N/A", "null", "NULL", "None", "none"}
+_MISSING_LIKE_ARRAY = pa.array(sorted(MISSING_LIKE))
+DEFAULT_INFER_SAMPLE_SIZE = 10_000
+# Off by default: encoding changes the column dtypes consumers of cleaned.parquet see.
+DEFAULT_CATEGORICAL_MAX_RATIO = 0.0
+DEFAULT_MAX_CATEGORIES = 50_000
+# Cached inference decision for columns that stay free text.
+TEXT_TYPE = "text"
+# Identifiers and multi-valued text that should stay plain strings.
+CATEGORICAL_EXCLUDE = frozenset({"url", "skill_tags"})
+CLIP_EXCLUDE = frozenset({"skill_mask"})
+# Typed as datetimes even when entirely empty, so files and batches agree on the type.
+DATE_COLUMNS = ("publish_date", "fetched_at")
+# Derived column groups: name -> (source text columns, columns derived from them).
+DERIVED_COLUMN_GROUPS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "salary": (("salary_text",), SALARY_COLUMNS),
+    "experience": (("exp_text",), EXPERIENCE_COLUMNS),
+    "education": (("edu_text",), ("edu_level",)),
+    "skills": (SKILL_TEXT_COLUMNS, SKILL_COLUMNS),
+}
+# Raw columns read by the JD cleaning stages; everything else is either passed through
+# untouched or re-derived, so re-cleaning archives can project down to these.
+JD_INPUT_COLUMNS = (
+    "url",
+    "title",
+    "company",
+    "city",
+    "salary_text",
+    "raw_salary_text",
+    "exp_text",
+    "edu_text",
+    "fetched_at",
+    "__source_file",
+)
 
 
-def normalize_missing_values(df: pd.DataFrame) -> pd.DataFrame:
-    return df.replace(list(MISSING_LIKE), pd.NA)
+def _sentinel_mask(series: pd.Series) -> np.ndarray:
+    # Arrow's trim and set lookup run in C++; mixed object columns fall back to pandas.
+    try:
+        values = pa.array(series, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        stripped = series.map(lambda value: value.strip() if isinstance(value, str) else None)
+        return stripped.isin(MISSING_LIKE).to_numpy(dtype=bool)
+    found = pc.is_in(pc.utf8_trim_whitespace(values), value_set=_MISSING_LIKE_ARRAY)
+    return found.fill_null(False).to_numpy(zero_copy_only=False)
 
 
-def infer_object_types(df: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
+def normalize_missing_values(
+    df: pd.DataFrame, sentinel_counts: dict[str, int] | None = None
+) -> pd.DataFrame:
     """
-    Attempt numeric/datetime conversion for object columns when most non-null
-    values can be parsed.
+    Replace missing-value sentinels (`MISSING_LIKE`, surrounding whitespace ignored)
+    in text columns with NA; numeric and datetime columns are not scanned.
+
+    When `sentinel_counts` is given, the number of replaced values per column is
+    added to it in place.
     """
-    out = df.copy()
+    out = working_copy(df)
     for col in out.columns:
-        if not is_object_dtype(out[col]):
+        series = out[col]
+        if not _is_text_column(series):
+            continue
+        mask = _sentinel_mask(series)
+        if not mask.any():
             continue
+        out[col] = series.mask(mask, pd.NA)
+        if sentinel_counts is not None:
+            sentinel_counts[col] = sentinel_counts.get(col, 0) + int(mask.sum())
+    return out
+
+
+def _decode_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    # Re-cleaned outputs come back as `category`; stages work on the plain values.
+    categorical = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return df
+    out = working_copy(df)
+    for col in categorical:
+        out[col] = out[col].astype(out[col].cat.categories.dtype)
+    return out
+
+
+def _is_text_column(series: pd.Series) -> bool:
+    return is_object_dtype(series) or isinstance(series.dtype, pd.StringDtype)
+
+
+def _guess_column_format(sample: pd.Series) -> str | None:
+    """Return a strftime format that parses every sampled value, if one exists."""
+    fmt = guess_datetime_format(str(sample.iloc[0]))
+    if fmt is None:
+        return None
+    parsed = pd.to_datetime(sample, errors="coerce", format=fmt)
+    return fmt if parsed.notna().all() else None
+
+
+def _infer_column_type(
+    series: pd.Series, threshold: float, sample_size: int, seed: int
+) -> dict[str, Any] | None:
+    non_null = series.dropna()
+    if non_null.empty:
+        return None
+    if len(non_null) > sample_size:
+        non_null = non_null.sample(n=sample_size, random_state=seed)
+
+    numeric = pd.to_numeric(non_null, errors="coerce")
+    if numeric.notna().mean() >= threshold:
+        return {"type": "numeric"}
+
+    fmt = _guess_column_format(non_null)
+    if fmt is not None:
+        return {"type": "datetime", "format": fmt}
+    dt = pd.to_datetime(non_null, errors="coerce", format="mixed")
+    if dt.notna().mean() >= threshold:
+        return {"type": "datetime", "format": None}
+    return None
+
+
+def _convert_column(series: pd.Series, spec: dict[str, Any]) -> pd.Series:
+    if spec["type"] == "numeric":
+        return pd.to_numeric(series, errors="coerce")
+    return pd.to_datetime(series, errors="coerce", format=spec.get("format") or "mixed")
 
-        non_null = out[col].dropna()
-        if non_null.empty:
+
+def infer_column_types(
+    df: pd.DataFrame,
+    threshold: float = 0.9,
+    sample_size: int = DEFAULT_INFER_SAMPLE_SIZE,
+    seed: int = 0,
+) -> dict[str, dict[str, Any]]:
+    """
+    Decide numeric/datetime conversions for text columns from a bounded random
+    sample of each column's non-null values.
+
+    Returns an inferred schema such as `{"publish_date": {"type": "datetime",
+    "format": "%Y-%m-%d"}}`; `format` is None when only mixed-format parsing works.
+    """
+    inferred: dict[str, dict[str, Any]] = {}
+    for col in df.columns:
+        if not _is_text_column(df[col]):
             continue
+        spec = _infer_column_type(df[col], threshold, sample_size, seed)
+        if spec is not None:
+            inferred[col] = spec
+    return inferred
+
+
+def infer_object_types(
+    df: pd.DataFrame,
+    threshold: float = 0.9,
+    inferred_types: dict[str, dict[str, Any]] | None = None,
+    sample_size: int = DEFAULT_INFER_SAMPLE_SIZE,
+) -> pd.DataFrame:
+    """
+    Attempt numeric/datetime conversion for object and string columns when most
+    non-null values can be parsed.
 
-        numeric = pd.to_numeric(non_null, errors="coerce")
-        if numeric.notna().mean() >= threshold:
-            out[col] = pd.to_numeric(out[col], errors="coerce")
+    Decisions come from a sample (see `infer_column_types`), and each column is then
+    converted once. Pass a dict as `inferred_types` to reuse decisions from an earlier
+    run or batch: cached entries are applied directly, and new or re-inferred
+    columns are written back into it. Columns that stay free text are cached as
+    `{"type": "text"}` and skipped, so their (slow, mixed-format datetime) checks
+    are not repeated. A cached conversion that now converts fewer than `threshold`
+    of the values is treated as stale and inferred again.
+    """
+    cache = inferred_types if inferred_types is not None else {}
+    out = working_copy(df)
+    for col in out.columns:
+        series = out[col]
+        if not _is_text_column(series):
+            continue
+
+        spec = cache.get(col)
+        if spec is not None and spec["type"] == TEXT_TYPE:
             continue
+        if spec is not None:
+            converted = _convert_column(series, spec)
+            non_null = int(series.notna().sum())
+            if non_null == 0 or converted.notna().sum() / non_null >= threshold:
+                out[col] = converted
+                continue
+            del cache[col]
 
-        dt = pd.to_datetime(non_null, errors="coerce", format="mixed")
-        if dt.notna().mean() >= threshold:
-            out[col] = pd.to_datetime(out[col], errors="coerce", format="mixed")
+        spec = _infer_column_type(series, threshold, sample_size, seed=0)
+        if spec is not None:
+            cache[col] = spec
+            out[col] = _convert_column(series, spec)
+        elif series.notna().any():
+            # All-missing columns carry no evidence either way; decide them later.
+            cache[col] = {"type": TEXT_TYPE}
+    return out
+
+
+def _type_empty_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # An all-empty date column reads as float NaN and would be median-filled to 0.
+    empty = [
+        col
+        for col in DATE_COLUMNS
+        if col in df.columns
+        and not is_datetime64_any_dtype(df[col])
+        and not df[col].notna().any()
+    ]
+    if not empty:
+        return df
+    out = working_copy(df)
+    for col in empty:
+        out[col] = pd.Series(pd.NaT, index=out.index, dtype="datetime64[ns]")
     return out
 
 
 def fill_missing_values(df: pd.DataFrame, skip_columns: set[str] | None = None) -> pd.DataFrame:
-    out = df.copy()
+    out = working_copy(df)
     protected = skip_columns or set()
-    for col in out.columns:
-        if col in protected:
+    missing = [col for col in out.columns if col not in protected and out[col].isna().any()]
+
+    # One reduction over every numeric column instead of a median per column.
+    numeric = [col for col in missing if is_numeric_dtype(out[col])]
+    if numeric:
+        medians = out[numeric].median().fillna(0)
+        out[numeric] = out[numeric].fillna(medians)
+
+    for col in missing:
+        if col in numeric:
             continue
         series = out[col]
-        if not series.isna().any():
-            continue
-
-        if is_numeric_dtype(series):
-            non_null = series.dropna()
-            fill_value = non_null.median() if not non_null.empty else 0
-            out[col] = series.fillna(fill_value)
-        elif is_bool_dtype(series):
+        if is_bool_dtype(series):
             mode = series.mode(dropna=True)
             out[col] = series.fillna(mode.iloc[0] if not mode.empty else False)
         elif is_datetime64_any_dtype(series):
@@ -71,6 +264,80 @@ def fill_missing_values(df: pd.DataFrame, skip_columns: set[str] | None = None)
     return out
 
 
+def _imputation_key(df: pd.DataFrame, spec: str | dict[str, Any]) -> pd.Series | None:
+    if isinstance(spec, str):
+        return df[spec] if spec in df.columns else None
+    column = spec["column"]
+    if column not in df.columns:
+        return None
+    return pd.cut(pd.to_numeric(df[column], errors="coerce"), bins=spec["bins"], right=False)
+
+
+def impute_grouped(df: pd.DataFrame, rules: Sequence[dict[str, Any]]) -> pd.DataFrame:
+    """
+    Fill numeric gaps with statistics of the row's group, e.g. salary medians per
+    city and experience bucket.
+
+    Each rule is a mapping with `columns`, `by` (column names, or
+    `{"column": ..., "bins": [...]}` for numeric buckets), optional `strategy`
+    (`median` or `mean`) and optional `min_count`, the number of observed values a
+    group needs before its statistic is used. All columns of a rule are filled
+    from a single grouped pass. Rules run in order; rows left missing fall through
+    to later rules.
+    """
+    out = working_copy(df)
+    for rule in rules:
+        columns = [
+            col
+            for col in rule["columns"]
+            if col in out.columns and is_numeric_dtype(out[col]) and out[col].isna().any()
+        ]
+        keys = [_imputation_key(out, spec) for spec in rule["by"]]
+        if not columns or any(key is None for key in keys):
+            continue
+        grouped = out[columns].groupby(keys, observed=True, sort=False, dropna=True)
+        fills = grouped.transform(rule.get("strategy", "median"))
+        min_count = int(rule.get("min_count", 1))
+        if min_count > 1:
+            fills = fills.where(grouped.transform("count") >= min_count)
+        out[columns] = out[columns].fillna(fills)
+    return out
+
+
+_FALLBACK_HASH_KEY = "datalab-fallback"
+
+
+def _text_key(values: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    return values.astype("string").fillna("")
+
+
+def _url_dedupe_key(df: pd.DataFrame) -> pd.Series:
+    url = _text_key(df["url"]).str.strip()
+    key = pd.util.hash_pandas_object(url, index=False)
+    fallback_cols = [col for col in ["title", "company", "city"] if col in df.columns]
+    if not fallback_cols:
+        return key
+
+    # A separate hash key keeps fallback hashes apart from url hashes.
+    fallback_key = pd.util.hash_pandas_object(
+        _text_key(df[fallback_cols]), index=False, hash_key=_FALLBACK_HASH_KEY
+    )
+    return key.where(url != "", fallback_key)
+
+
+def build_dedupe_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Return the per-row 64-bit identity `remove_duplicates` dedupes on.
+
+    Rows are keyed by a hash of url (title/company/city when url is blank), or by a
+    hash of the full row when the frame has no url column. Keys are stable across
+    runs and can be stored in a `SeenKeyIndex`.
+    """
+    if "url" in df.columns:
+        return _url_dedupe_key(df)
+    return pd.util.hash_pandas_object(df, index=False)
+
+
 def remove_duplicates(df: pd.DataFrame, subset: list[str] | None = None) -> pd.DataFrame:
     if subset:
         available = [col for col in subset if col in df.columns]
@@ -78,103 +345,396 @@ def remove_duplicates(df: pd.DataFrame, subset: list[str] | None = None) -> pd.D
             return df.drop_duplicates(subset=available, ignore_index=True)
         return df.drop_duplicates(ignore_index=True)
 
-    out = df.copy()
-    if "url" in out.columns:
-        url = out["url"].astype("string").str.strip()
-        has_url = url.notna() & (url != "")
-        fallback_cols = [col for col in ["title", "company", "city"] if col in out.columns]
-
-        if fallback_cols:
-            fallback_key = (
-                out[fallback_cols]
-                .fillna("")
-                .astype("string")
-                .apply(lambda row: "|".join(row.tolist()), axis=1)
-            )
-            key = pd.Series(index=out.index, dtype="string")
-            key.loc[has_url] = "url|" + url.loc[has_url]
-            key.loc[~has_url] = "fallback|" + fallback_key.loc[~has_url]
-            out["_dedupe_key"] = key
-            out = out.drop_duplicates(subset=["_dedupe_key"], ignore_index=True).drop(
-                columns=["_dedupe_key"]
-            )
-            return out
+    if "url" in df.columns:
+        keep = ~_url_dedupe_key(df).duplicated().to_numpy()
+        return df.loc[keep].reset_index(drop=True)
+
+    return df.drop_duplicates(ignore_index=True)
+
 
-        return out.drop_duplicates(subset=["url"], ignore_index=True)
+def _iqr_bounds(q1: float, q3: float, factor: float) -> tuple[float, float] | None:
+    iqr = q3 - q1
+    if pd.isna(iqr) or iqr == 0:
+        return None
+    return q1 - factor * iqr, q3 + factor * iqr
 
-    return out.drop_duplicates(ignore_index=True)
 
+def _clippable_columns(df: pd.DataFrame) -> list[str]:
+    numeric = df.select_dtypes(include=["number"]).columns
+    return [col for col in numeric if col not in CLIP_EXCLUDE]
 
-def clip_outliers_iqr(df: pd.DataFrame, factor: float = 1.5) -> pd.DataFrame:
-    out = df.copy()
-    for col in out.select_dtypes(include=["number"]).columns:
-        if out[col].dropna().empty:
+
+def clip_outliers_iqr(
+    df: pd.DataFrame,
+    factor: float = 1.5,
+    bounds: dict[str, tuple[float, float]] | None = None,
+) -> pd.DataFrame:
+    """
+    Clip numeric columns to `[q1 - factor * iqr, q3 + factor * iqr]`.
+
+    Quartiles are computed exactly from `df` unless precomputed `bounds` are given,
+    e.g. from `iqr_bounds_from_sketches`; columns missing from `bounds` are left as is.
+    Bit masks (`CLIP_EXCLUDE`) are never clipped.
+    """
+    out = working_copy(df)
+    for col in _clippable_columns(out):
+        if bounds is not None:
+            col_bounds = bounds.get(col)
+        elif out[col].dropna().empty:
             continue
-        q1 = out[col].quantile(0.25)
-        q3 = out[col].quantile(0.75)
-        iqr = q3 - q1
-        if pd.isna(iqr) or iqr == 0:
+        else:
+            col_bounds = _iqr_bounds(out[col].quantile(0.25), out[col].quantile(0.75), factor)
+        if col_bounds is None:
             continue
-        lower = q1 - factor * iqr
-        upper = q3 + factor * iqr
+        lower, upper = col_bounds
         out[col] = out[col].clip(lower=lower, upper=upper)
     return out
 
 
-def _coerce_bool_series(series: pd.Series) -> pd.Series:
-    true_vals = {"true", "1", "yes", "y", "t"}
-    false_vals = {"false", "0", "no", "n", "f"}
-    normalized = series.astype("string").str.strip().str.lower()
-    out = pd.Series(index=series.index, dtype="boolean")
-    out.loc[normalized.isin(true_vals)] = True
-    out.loc[normalized.isin(false_vals)] = False
-    out.loc[series.isna()] = pd.NA
-    invalid = ~(normalized.isin(true_vals | false_vals) | series.isna())
-    if invalid.any():
-        raise DataValidationError("Invalid boolean value found in schema conversion.")
-    return out
+def update_iqr_sketches(sketches: dict[str, KLLSketch], df: pd.DataFrame) -> None:
+    """Add the numeric columns of `df` to per-column quantile sketches, in place."""
+    for col in _clippable_columns(df):
+        values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        sketches.setdefault(col, KLLSketch()).update(values)
 
 
-def apply_schema(df: pd.DataFrame, schema: dict[str, Any] | None) -> pd.DataFrame:
+def iqr_bounds_from_sketches(
+    sketches: dict[str, KLLSketch], factor: float = 1.5
+) -> dict[str, tuple[float, float]]:
+    """Return `clip_outliers_iqr` bounds derived from merged per-column sketches."""
+    bounds: dict[str, tuple[float, float]] = {}
+    for col, sketch in sketches.items():
+        if sketch.count == 0:
+            continue
+        col_bounds = _iqr_bounds(sketch.quantile(0.25), sketch.quantile(0.75), factor)
+        if col_bounds is not None:
+            bounds[col] = col_bounds
+    return bounds
+
+
+def apply_schema(
+    df: pd.DataFrame,
+    schema: dict[str, Any] | None,
+    max_violations: int = DEFAULT_MAX_VIOLATIONS,
+) -> pd.DataFrame:
+    """
+    Cast the configured columns in one Arrow pass (see `datalab.schema.cast_to_schema`).
+
+    Raises `SchemaViolationError` listing up to `max_violations` bad rows per column.
+    """
     if not schema:
         return df
-    out = df.copy()
-    for col, dtype in schema.items():
-        if col not in out.columns:
-            raise DataValidationError(f"Configured column missing from data: {col}")
-        try:
-            if dtype == "datetime":
-                out[col] = pd.to_datetime(out[col], errors="raise")
-            elif dtype == "int":
-                out[col] = pd.to_numeric(out[col], errors="raise").astype("Int64")
-            elif dtype == "float":
-                out[col] = pd.to_numeric(out[col], errors="raise").astype(float)
-            elif dtype == "str":
-                out[col] = out[col].astype(str)
-            elif dtype == "bool":
-                out[col] = _coerce_bool_series(out[col])
-            else:
-                raise DataValidationError(f"Unsupported schema dtype for {col}: {dtype}")
-        except Exception as exc:
-            raise DataValidationError(f"Type conversion failed for {col} -> {dtype}") from exc
+    out = working_copy(df)
+    converted = cast_to_schema(out, schema, max_violations=max_violations)
+    for col in converted.columns:
+        out[col] = converted[col]
     return out
 
 
-def clean_dataframe(
+def encode_categoricals(
+    df: pd.DataFrame,
+    max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+    max_categories: int = DEFAULT_MAX_CATEGORIES,
+    exclude: Iterable[str] = CATEGORICAL_EXCLUDE,
+) -> pd.DataFrame:
+    """
+    Convert low-cardinality text columns (city, edu_level, company, ...) to `category`.
+
+    A column qualifies when its distinct values number at most `max_categories` and
+    at most `max_ratio` of its non-null values. Categories are written to Parquet as
+    dictionary arrays and come back as `category` from `pd.read_parquet`.
+    `max_ratio=0` (the default) disables the stage.
+    """
+    if max_ratio <= 0:
+        return df
+    out = working_copy(df)
+    skipped = set(exclude)
+    for col in out.columns:
+        series = out[col]
+        if col in skipped or not _is_text_column(series):
+            continue
+        if is_object_dtype(series) and infer_dtype(series, skipna=True) != "string":
+            continue
+        non_null = int(series.notna().sum())
+        distinct = series.nunique(dropna=True)
+        if non_null and distinct <= max_categories and distinct <= max_ratio * non_null:
+            out[col] = series.astype("category")
+    return out
+
+
+StageHook = Callable[[str], ContextManager[object]]
+
+
+def _no_stage_hook(_name: str) -> ContextManager[object]:
+    return nullcontext()
+
+
+def _extract_row_features(
+    df: pd.DataFrame,
+    skill_dictionary: dict[str, list[str]] | None,
+    parse_cache_path: str | None,
+    parse_cache_fingerprint: str,
+    skill_token_boundaries: bool = False,
+) -> pd.DataFrame:
+    """JD features and skill tags for one partition, run inside a worker process."""
+    cache = ParseCache(parse_cache_path, parse_cache_fingerprint) if parse_cache_path else None
+    out = extract_jd_features(df, parse_cache=cache)
+    if cache is not None:
+        cache.save()
+    return extract_skill_tags(
+        out, skill_dictionary=skill_dictionary, token_boundaries=skill_token_boundaries
+    )
+
+
+def _extract_features_partitioned(
+    df: pd.DataFrame,
+    skill_dictionary: dict[str, list[str]] | None,
+    parse_cache: ParseCache | None,
+    workers: int,
+    skill_token_boundaries: bool = False,
+) -> pd.DataFrame:
+    extract = partial(
+        _extract_row_features,
+        skill_dictionary=skill_dictionary,
+        skill_token_boundaries=skill_token_boundaries,
+        # `is not None`: an empty ParseCache is falsy, and every run starts empty.
+        parse_cache_path=(
+            str(parse_cache.path)
+            if parse_cache is not None and parse_cache.path is not None
+            else None
+        ),
+        parse_cache_fingerprint=parse_cache.fingerprint if parse_cache is not None else "",
+    )
+    return map_partitions(df, extract, workers=workers)
+
+
+def _impute_then_fill(
+    df: pd.DataFrame, rules: Sequence[dict[str, Any]], deferred: set[str]
+) -> pd.DataFrame:
+    out = impute_grouped(df, rules)
+    if deferred:
+        out = fill_missing_values(out, skip_columns=set(out.columns) - deferred)
+    return out
+
+
+def prepare_dataframe(
     df: pd.DataFrame,
-    schema: dict[str, Any] | None = None,
     skill_dictionary: dict[str, list[str]] | None = None,
+    stage_hook: StageHook | None = None,
+    inferred_types: dict[str, dict[str, Any]] | None = None,
+    imputation: Sequence[dict[str, Any]] | None = None,
+    sentinel_counts: dict[str, int] | None = None,
+    parse_cache: ParseCache | None = None,
+    workers: int = 1,
+    skill_token_boundaries: bool = False,
 ) -> pd.DataFrame:
-    out = normalize_missing_values(df)
-    if "salary_text" in out.columns and "raw_salary_text" not in out.columns:
-        out["raw_salary_text"] = out["salary_text"]
-    if "fetched_at" not in out.columns:
-        out["fetched_at"] = "UNKNOWN"
-    out = infer_object_types(out)
-    out = fill_missing_values(out, skip_columns={"url"})
-    out = extract_jd_features(out)
-    out = extract_skill_tags(out, skill_dictionary=skill_dictionary)
-    out = remove_duplicates(out)
+    """
+    Row-local stages of `clean_dataframe`: missing-value normalization, type
+    inference, filling, JD feature extraction, grouped imputation and skill tagging.
+
+    Outputs for separate sources can be concatenated and passed to
+    `finalize_dataframe`. `stage_hook(name)` returns a context manager entered
+    around each stage, e.g. for profiling. `inferred_types` is passed to
+    `infer_object_types` and updated in place. `imputation` rules (see
+    `impute_grouped`) run after feature extraction so they can target derived
+    columns such as `salary_min_k`; raw columns they target skip the global fill
+    until the rules have run. `sentinel_counts` collects per-column counts of
+    normalized missing-value sentinels. `parse_cache` is passed to
+    `extract_jd_features`, `skill_token_boundaries` to `extract_skill_tags`.
+
+    With `workers > 1` JD features and skill tags are extracted together on row
+    ranges in a process pool (see `map_partitions`), before grouped imputation;
+    skill tags only read raw text columns, so the result is the same.
+    """
+    stage = stage_hook or _no_stage_hook
+    with stage("normalize_missing_values"):
+        out = normalize_missing_values(_decode_categoricals(df), sentinel_counts)
+        if "salary_text" in out.columns and "raw_salary_text" not in out.columns:
+            out["raw_salary_text"] = out["salary_text"]
+        if "fetched_at" not in out.columns:
+            out["fetched_at"] = "UNKNOWN"
+    with stage("infer_object_types"):
+        out = infer_object_types(out, inferred_types=inferred_types)
+        out = _type_empty_date_columns(out)
+    # Raw columns targeted by grouped rules are filled by those rules first; the
+    # global fill only covers what the rules leave missing.
+    deferred = {col for rule in imputation or [] for col in rule["columns"]} & set(out.columns)
+    with stage("fill_missing_values"):
+        out = fill_missing_values(out, skip_columns={"url"} | deferred)
+    if workers > 1:
+        with stage("extract_features_partitioned"):
+            out = _extract_features_partitioned(
+                out, skill_dictionary, parse_cache, workers, skill_token_boundaries
+            )
+        if imputation:
+            with stage("impute_grouped"):
+                out = _impute_then_fill(out, imputation, deferred)
+        return out
+    with stage("extract_jd_features"):
+        out = extract_jd_features(out, parse_cache=parse_cache)
+    if imputation:
+        with stage("impute_grouped"):
+            out = _impute_then_fill(out, imputation, deferred)
+    with stage("extract_skill_tags"):
+        out = extract_skill_tags(
+            out, skill_dictionary=skill_dictionary, token_boundaries=skill_token_boundaries
+        )
+    return out
+
+
+def derived_column_groups(patterns: Iterable[str]) -> list[str]:
+    """
+    Names of the `DERIVED_COLUMN_GROUPS` selected by glob `patterns`.
+
+    A pattern selects a group when it matches the group name or any of its derived
+    columns, e.g. `salary_*` or `skill_tags`. Raises `ValueError` for patterns that
+    match nothing.
+    """
+    selected: list[str] = []
+    for pattern in patterns:
+        matched = [
+            name
+            for name, (_, derived) in DERIVED_COLUMN_GROUPS.items()
+            if fnmatchcase(name, pattern) or any(fnmatchcase(col, pattern) for col in derived)
+        ]
+        if not matched:
+            known = sorted({col for _, derived in DERIVED_COLUMN_GROUPS.values() for col in derived})
+            raise ValueError(f"No derived columns match '{pattern}'. Expected one of {known}.")
+        selected.extend(name for name in matched if name not in selected)
+    return [name for name in DERIVED_COLUMN_GROUPS if name in selected]
+
+
+def recompute_derived_columns(
+    df: pd.DataFrame,
+    groups: Sequence[str],
+    skill_dictionary: dict[str, list[str]] | None = None,
+    schema: dict[str, Any] | None = None,
+    imputation: Sequence[dict[str, Any]] | None = None,
+    categorical_max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+    parse_cache: ParseCache | None = None,
+    skill_token_boundaries: bool = False,
+) -> pd.DataFrame:
+    """
+    Re-derive the columns of `groups` (see `DERIVED_COLUMN_GROUPS`) from the source
+    text columns of an already cleaned frame, and return only those columns.
+
+    The derived columns go through the stages they pass in `clean_dataframe`:
+    grouped imputation rules that target them, IQR clipping, `schema` casts and
+    categorical encoding. Statistics are taken over the cleaned rows, i.e. after
+    deduplication.
+    """
+    out = _decode_categoricals(df)
+    derived = [col for name in groups for col in DERIVED_COLUMN_GROUPS[name][1]]
+    jd_groups = [name for name in groups if name != "skills"]
+    if jd_groups:
+        sources = [
+            col
+            for name in jd_groups
+            for col in DERIVED_COLUMN_GROUPS[name][0]
+            if col in out.columns
+        ]
+        features = extract_jd_features(out[sources], parse_cache=parse_cache)
+        jd_columns = [col for name in jd_groups for col in DERIVED_COLUMN_GROUPS[name][1]]
+        for col in jd_columns:
+            out[col] = features[col]
+        rules = [
+            {**rule, "columns": [col for col in rule["columns"] if col in jd_columns]}
+            for rule in imputation or []
+        ]
+        out = impute_grouped(out, [rule for rule in rules if rule["columns"]])
+    if "skills" in groups:
+        out = extract_skill_tags(
+            out, skill_dictionary=skill_dictionary, token_boundaries=skill_token_boundaries
+        )
+    out = out[[col for col in derived if col in out.columns]]
     out = clip_outliers_iqr(out)
-    out = apply_schema(out, schema)
+    out = apply_schema(out, {col: dtype for col, dtype in (schema or {}).items() if col in out})
+    return encode_categoricals(out, max_ratio=categorical_max_ratio)
+
+
+def finalize_dataframe(
+    df: pd.DataFrame,
+    schema: dict[str, Any] | None = None,
+    dtype_backend: str = "numpy",
+    stage_hook: StageHook | None = None,
+    near_duplicate_threshold: float | None = None,
+    near_duplicate_stats: dict[str, Any] | None = None,
+    clip_outliers: bool = True,
+    categorical_max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+) -> pd.DataFrame:
+    """
+    Dataset-wide stages of `clean_dataframe`: dedupe, outlier clipping, schema and
+    categorical encoding.
+
+    With a `near_duplicate_threshold` rows whose title/company/city text is at least
+    that similar are collapsed as well; cluster statistics go to
+    `near_duplicate_stats`. `clip_outliers=False` leaves clipping to the caller, e.g.
+    with bounds from quantile sketches merged across batches.
+    """
+    stage = stage_hook or _no_stage_hook
+    with stage("remove_duplicates"):
+        out = remove_duplicates(df)
+    if near_duplicate_threshold is not None:
+        with stage("remove_near_duplicates"):
+            out = remove_near_duplicates(
+                out, threshold=near_duplicate_threshold, stats=near_duplicate_stats
+            )
+    if clip_outliers:
+        with stage("clip_outliers_iqr"):
+            out = clip_outliers_iqr(out)
+    with stage("apply_schema"):
+        out = apply_schema(out, schema)
+        out = apply_dtype_backend(out, dtype_backend)
+    with stage("encode_categoricals"):
+        out = encode_categoricals(out, max_ratio=categorical_max_ratio)
     return out
+
+
+def clean_dataframe(
+    df: pd.DataFrame,
+    schema: dict[str, Any] | None = None,
+    skill_dictionary: dict[str, list[str]] | None = None,
+    dtype_backend: str = "numpy",
+    copy_on_write: bool = False,
+    stage_hook: StageHook | None = None,
+    inferred_types: dict[str, dict[str, Any]] | None = None,
+    imputation: Sequence[dict[str, Any]] | None = None,
+    sentinel_counts: dict[str, int] | None = None,
+    near_duplicate_threshold: float | None = None,
+    near_duplicate_stats: dict[str, Any] | None = None,
+    clip_outliers: bool = True,
+    categorical_max_ratio: float = DEFAULT_CATEGORICAL_MAX_RATIO,
+    parse_cache: ParseCache | None = None,
+    workers: int = 1,
+    skill_token_boundaries: bool = False,
+) -> pd.DataFrame:
+    """
+    Run every cleaning stage in order.
+
+    With `dtype_backend="pyarrow"` text columns, including derived ones such as
+    `edu_level` and `skill_tags`, come out as `string[pyarrow]` instead of object.
+    With `copy_on_write=True` the stages run under pandas copy-on-write and share
+    unchanged columns instead of deep-copying the frame at every stage.
+    """
+    with enable_copy_on_write(copy_on_write):
+        out = prepare_dataframe(
+            df,
+            skill_dictionary=skill_dictionary,
+            stage_hook=stage_hook,
+            inferred_types=inferred_types,
+            imputation=imputation,
+            sentinel_counts=sentinel_counts,
+            parse_cache=parse_cache,
+            workers=workers,
+            skill_token_boundaries=skill_token_boundaries,
+        )
+        return finalize_dataframe(
+            out,
+            schema=schema,
+            dtype_backend=dtype_backend,
+            stage_hook=stage_hook,
+            near_duplicate_threshold=near_duplicate_threshold,
+            near_duplicate_stats=near_duplicate_stats,
+            clip_outliers=clip_outliers,
+            categorical_max_ratio=categorical_max_ratio,
+        )
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import copy
+import logging
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +14,14 @@ from dotenv import load_dotenv
 DEFAULT_APP_CONFIG_PATH = "config/config.yaml"
 VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR"}
 KNOWN_SECTIONS = {"clean", "crawl", "analyze", "oneclick", "db", "dashboard", "api"}
+VALID_READ_ENGINES = {"pandas", "pyarrow"}
+VALID_DTYPE_BACKENDS = {"numpy", "pyarrow"}
+VALID_IMPUTE_STRATEGIES = {"median", "mean"}
+
+logger = logging.getLogger(__name__)
+# Resolved config path -> ((mtime_ns, size), parsed config); see load_app_config_cached.
+_APP_CONFIG_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+_APP_CONFIG_LOCK = threading.Lock()
 
 
 class ConfigValidationError(ValueError):
@@ -59,7 +70,13 @@ def _validate_section_types(section: str, values: dict[str, Any]) -> None:
             f"Invalid log_level for section '{section}': {values['log_level']}. "
             f"Expected one of {sorted(VALID_LOG_LEVELS)}."
         )
-    for int_key in ("pages", "topk"):
+    for key, valid in (("engine", VALID_READ_ENGINES), ("dtype_backend", VALID_DTYPE_BACKENDS)):
+        if key in values and values[key] is not None and str(values[key]) not in valid:
+            raise ConfigValidationError(
+                f"Invalid {key} for section '{section}': {values[key]}. "
+                f"Expected one of {sorted(valid)}."
+            )
+    for int_key in ("pages", "topk", "batch_size", "io_workers", "workers"):
         if int_key in values and values[int_key] is not None:
             try:
                 ivalue = int(values[int_key])
@@ -83,6 +100,65 @@ def _validate_section_types(section: str, values: dict[str, Any]) -> None:
                 raise ConfigValidationError(
                     f"'{float_key}' must be >= 0 for section '{section}', got {fvalue}."
                 )
+    if values.get("imputation") is not None:
+        _validate_imputation(section, values["imputation"])
+    ratio = values.get("categorical_max_ratio")
+    if ratio is not None:
+        try:
+            rvalue = float(ratio)
+        except Exception as exc:
+            raise ConfigValidationError(
+                f"Invalid 'categorical_max_ratio' for section '{section}': {ratio}"
+            ) from exc
+        if not 0 <= rvalue <= 1:
+            raise ConfigValidationError(
+                f"'categorical_max_ratio' must be in [0, 1] for section '{section}', "
+                f"got {rvalue}."
+            )
+    threshold = values.get("near_duplicate_threshold")
+    if threshold is not None:
+        try:
+            tvalue = float(threshold)
+        except Exception as exc:
+            raise ConfigValidationError(
+                f"Invalid 'near_duplicate_threshold' for section '{section}': {threshold}"
+            ) from exc
+        if not 0 < tvalue <= 1:
+            raise ConfigValidationError(
+                f"'near_duplicate_threshold' must be in (0, 1] for section '{section}', "
+                f"got {tvalue}."
+            )
+
+
+def _validate_imputation(section: str, rules: Any) -> None:
+    if not isinstance(rules, list):
+        raise ConfigValidationError(f"'imputation' for section '{section}' must be a list.")
+    for pos, rule in enumerate(rules):
+        where = f"imputation[{pos}] for section '{section}'"
+        if not isinstance(rule, dict):
+            raise ConfigValidationError(f"{where} must be a mapping.")
+        for key in ("columns", "by"):
+            if not isinstance(rule.get(key), list) or not rule[key]:
+                raise ConfigValidationError(f"{where} needs a non-empty '{key}' list.")
+        for spec in rule["by"]:
+            if isinstance(spec, dict) and not (
+                isinstance(spec.get("column"), str) and isinstance(spec.get("bins"), list)
+            ):
+                raise ConfigValidationError(
+                    f"{where}: bucketed 'by' entries need 'column' and a 'bins' list."
+                )
+        strategy = rule.get("strategy", "median")
+        if strategy not in VALID_IMPUTE_STRATEGIES:
+            raise ConfigValidationError(
+                f"Invalid strategy in {where}: {strategy}. "
+                f"Expected one of {sorted(VALID_IMPUTE_STRATEGIES)}."
+            )
+
+
+def _app_config_path(config_path: str | None) -> str | None:
+    if config_path is None and Path(DEFAULT_APP_CONFIG_PATH).exists():
+        return DEFAULT_APP_CONFIG_PATH
+    return config_path
 
 
 def load_app_config(config_path: str | None = None) -> dict[str, Any]:
@@ -92,11 +168,7 @@ def load_app_config(config_path: str | None = None) -> dict[str, Any]:
     Missing config file is allowed when config_path is None.
     """
     load_dotenv()
-    path = config_path
-    if path is None and Path(DEFAULT_APP_CONFIG_PATH).exists():
-        path = DEFAULT_APP_CONFIG_PATH
-
-    data = _load_yaml(path)
+    data = _load_yaml(_app_config_path(config_path))
     for key in data.keys():
         if key not in KNOWN_SECTIONS and key != "schema":
             raise ConfigValidationError(
@@ -107,6 +179,30 @@ def load_app_config(config_path: str | None = None) -> dict[str, Any]:
     return data
 
 
+def load_app_config_cached(config_path: str | None = None) -> dict[str, Any]:
+    """
+    `load_app_config` for long-running processes such as the API server.
+
+    The parsed file is kept per path and re-read only when its mtime or size changes,
+    so an edited `config.yaml` takes effect on the next call without a restart. Each
+    call returns its own copy.
+    """
+    path = _app_config_path(config_path)
+    if path is None or not Path(path).exists():
+        return load_app_config(path)
+    key = str(Path(path).resolve())
+    stat = Path(key).stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _APP_CONFIG_LOCK:
+        cached = _APP_CONFIG_CACHE.get(key)
+        if cached is None or cached[0] != version:
+            if cached is not None:
+                logger.info("Reloading changed app config: %s", key)
+            cached = (version, load_app_config(key))
+            _APP_CONFIG_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
 def resolve_section_config(
     section: str,
     *,
@@ -6,6 +6,8 @@ import duckdb
 import pandas as pd
 import streamlit as st
 
+from datalab.skill_tags import load_skill_bits, skill_counts
+
 
 def load_dataframe(duckdb_path: str | None, parquet_path: str | None) -> pd.DataFrame:
     if duckdb_path:
@@ -22,6 +24,20 @@ def load_dataframe(duckdb_path: str | None, parquet_path: str | None) -> pd.Data
     raise ValueError("Provide either duckdb_path or parquet_path.")
 
 
+def load_skill_bit_tags(duckdb_path: str | None, parquet_path: str | None) -> list[str] | None:
+    """The `skill_mask` tag order from the DuckDB `skill_bits` table or `skill_bits.json`."""
+    if duckdb_path:
+        with duckdb.connect(str(duckdb_path), read_only=True) as conn:
+            tables = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
+            if "skill_bits" not in tables:
+                return None
+            rows = conn.execute("SELECT tag FROM skill_bits ORDER BY bit").fetchall()
+        return [row[0] for row in rows] or None
+    if parquet_path:
+        return load_skill_bits(Path(parquet_path).parent)
+    return None
+
+
 def _build_exp_bucket(df: pd.DataFrame) -> pd.Series:
     rep = (
         pd.to_numeric(df.get("exp_min_years"), errors="coerce").fillna(0)
@@ -34,7 +50,7 @@ def _build_exp_bucket(df: pd.DataFrame) -> pd.Series:
     ).astype("string").fillna("unknown")
 
 
-def render_dashboard(df: pd.DataFrame) -> None:
+def render_dashboard(df: pd.DataFrame, skill_bits: list[str] | None = None) -> None:
     st.title("DataLab JD Dashboard")
     st.caption("Source: cleaned parquet / DuckDB")
 
@@ -51,12 +67,17 @@ def render_dashboard(df: pd.DataFrame) -> None:
     col3.metric("Companies", int(work.get("company", pd.Series(dtype="object")).nunique()))
 
     st.subheader("City Job Counts")
-    city_counts = work.groupby("city", dropna=False).size().sort_values(ascending=False).head(20)
+    city_counts = (
+        work.groupby("city", dropna=False, observed=True)
+        .size()
+        .sort_values(ascending=False)
+        .head(20)
+    )
     st.bar_chart(city_counts)
 
     st.subheader("City x Experience Salary (p50/p90)")
     city_exp = (
-        work.groupby(["city", "exp_bucket"], dropna=False)["mid_k"]
+        work.groupby(["city", "exp_bucket"], dropna=False, observed=True)["mid_k"]
         .agg(p50_mid_k="median", p90_mid_k=lambda x: x.quantile(0.9), n_jobs="size")
         .reset_index()
         .sort_values(["city", "exp_bucket"])
@@ -65,17 +86,7 @@ def render_dashboard(df: pd.DataFrame) -> None:
 
     if "skill_tags" in work.columns:
         st.subheader("Skill Heatmap by City x Experience")
-        skill = work[["city", "exp_bucket", "skill_tags"]].copy()
-        skill["skill_tags"] = skill["skill_tags"].fillna("").astype(str)
-        skill = skill.assign(skill_tag=skill["skill_tags"].str.split("|")).explode("skill_tag")
-        skill = skill[skill["skill_tag"].astype(str).str.len() > 0]
-        skill_heat = (
-            skill.groupby(["city", "exp_bucket", "skill_tag"], dropna=False)
-            .size()
-            .reset_index(name="n_jobs")
-            .sort_values("n_jobs", ascending=False)
-            .head(200)
-        )
+        skill_heat = skill_counts(work, ["city", "exp_bucket"], skill_bits).head(200)
         st.dataframe(skill_heat, use_container_width=True)
 
 
@@ -87,10 +98,11 @@ def main() -> None:
 
     try:
         df = load_dataframe(duckdb_path=duckdb_path, parquet_path=parquet_path)
+        skill_bits = load_skill_bit_tags(duckdb_path=duckdb_path, parquet_path=parquet_path)
     except Exception as exc:
         st.error(str(exc))
         return
-    render_dashboard(df)
+    render_dashboard(df, skill_bits=skill_bits)
 
 
 if __name__ == "__main__":
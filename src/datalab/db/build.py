@@ -7,6 +7,7 @@ from pathlib import Path
 import duckdb
 
 from datalab.logging_utils import setup_logging
+from datalab.skill_tags import SKILL_LONG_TABLE_FILENAME, load_skill_bits
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,14 @@ FROM jd_cleaned
 WHERE salary_min_k IS NOT NULL OR salary_max_k IS NOT NULL
 ORDER BY mid_k DESC
 LIMIT 20;
+""".strip(),
+    "skill_counts_by_city": """
+SELECT j.city, b.tag AS skill_tag, COUNT(*) AS n_jobs
+FROM jd_cleaned AS j
+JOIN skill_bits AS b ON (j.skill_mask >> b.bit) & 1 = 1
+GROUP BY j.city, b.tag
+ORDER BY n_jobs DESC
+LIMIT 50;
 """.strip(),
 }
 
@@ -54,16 +63,37 @@ def build_duckdb(cleaned_parquet: str | Path, duckdb_path: str | Path) -> Path:
 
     with duckdb.connect(str(db_path)) as conn:
         conn.execute("DROP TABLE IF EXISTS jd_cleaned")
+        # row_id is the row position in the parquet file, the key of jd_skill_tags.
         conn.execute(
-            "CREATE TABLE jd_cleaned AS SELECT * FROM read_parquet(?)",
+            "CREATE TABLE jd_cleaned AS SELECT * RENAME (file_row_number AS row_id) "
+            "FROM read_parquet(?, file_row_number = true)",
             [str(parquet_path)],
         )
         conn.execute("CREATE INDEX IF NOT EXISTS idx_jd_city ON jd_cleaned(city)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_jd_company ON jd_cleaned(company)")
+        _load_skill_tables(conn, parquet_path.parent)
     logger.info("Built DuckDB at %s", db_path)
     return db_path
 
 
+def _load_skill_tables(conn: duckdb.DuckDBPyConnection, clean_dir: Path) -> None:
+    """Load `skill_bits(bit, tag)` and `jd_skill_tags(row_id, tag)` written by the cleaner."""
+    conn.execute("DROP TABLE IF EXISTS skill_bits")
+    conn.execute("DROP TABLE IF EXISTS jd_skill_tags")
+    tags = load_skill_bits(clean_dir)
+    if tags:
+        conn.execute("CREATE TABLE skill_bits (bit INTEGER, tag VARCHAR)")
+        conn.executemany("INSERT INTO skill_bits VALUES (?, ?)", list(enumerate(tags)))
+    long_path = clean_dir / SKILL_LONG_TABLE_FILENAME
+    if long_path.exists():
+        conn.execute(
+            "CREATE TABLE jd_skill_tags AS "
+            "SELECT row_id, CAST(tag AS VARCHAR) AS tag FROM read_parquet(?)",
+            [str(long_path)],
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jd_skill_tag ON jd_skill_tags(tag)")
+
+
 def write_example_queries(output_path: str | Path) -> Path:
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class SeenKeyIndex:
+    """
+    Sorted set of 64-bit dedupe keys (see `build_dedupe_keys`).
+
+    Membership is a binary search over a NumPy array, so large histories cost
+    8 bytes per posting and no per-key Python objects. With a `path` the index is
+    loaded from and saved to a `.npy` file, letting later runs drop postings that
+    earlier runs already emitted.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self._keys = np.empty(0, dtype=np.uint64)
+        if self.path is not None and self.path.exists():
+            self._keys = np.unique(np.load(self.path).astype(np.uint64, copy=False))
+
+    def __len__(self) -> int:
+        return int(self._keys.size)
+
+    def contains(self, keys: pd.Series | np.ndarray) -> np.ndarray:
+        values = np.asarray(keys, dtype=np.uint64)
+        if self._keys.size == 0:
+            return np.zeros(values.shape, dtype=bool)
+        pos = np.searchsorted(self._keys, values)
+        pos[pos == self._keys.size] = 0
+        return self._keys[pos] == values
+
+    def add(self, keys: pd.Series | np.ndarray) -> None:
+        values = np.unique(np.asarray(keys, dtype=np.uint64))
+        values = values[~self.contains(values)]
+        if values.size:
+            # Insert at the binary-search positions instead of re-sorting the history,
+            # so each batch costs one linear copy rather than a full sort.
+            self._keys = np.insert(self._keys, np.searchsorted(self._keys, values), values)
+
+    def save(self) -> Path:
+        if self.path is None:
+            raise ValueError("SeenKeyIndex has no path to save to.")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # np.save appends `.npy` to names without it, so write through a file handle.
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            np.save(f, self._keys)
+        os.replace(tmp_path, self.path)
+        return self.path
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+from pandas._libs.parsers import STR_NA_VALUES
+
+from datalab.manifest import file_content_hash
+
+logger = logging.getLogger(__name__)
+
+EXCEL_CACHE_ENV = "DATALAB_EXCEL_CACHE_DIR"
+# Bump when the parse logic changes so stale sidecars are not reused.
+SIDECAR_FORMAT_VERSION = 1
+_FULL_READ_BATCH_SIZE = 100_000
+
+
+def excel_cache_dir() -> Path | None:
+    """
+    Directory for parsed-sheet Parquet sidecars.
+
+    Taken from `DATALAB_EXCEL_CACHE_DIR`; the cache is off when it is unset or empty.
+    """
+    value = os.getenv(EXCEL_CACHE_ENV, "")
+    return Path(value) if value.strip() else None
+
+
+def _sidecar_path(path: Path) -> Path | None:
+    cache_dir = excel_cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / f"{file_content_hash(path)}-v{SIDECAR_FORMAT_VERSION}.parquet"
+
+
+def _dedupe_names(names: list[str]) -> list[str]:
+    # pandas renames repeated headers to "title", "title.1", "title.2", ...
+    counts: dict[str, int] = {}
+    out: list[str] = []
+    for name in names:
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        counts[name] = count + 1
+        out.append(name)
+    return out
+
+
+def _header_names(row: tuple[Any, ...], width: int) -> list[str]:
+    # Mirror pandas' naming for blank and repeated header cells.
+    padded = list(row) + [None] * (width - len(row))
+    return _dedupe_names(
+        [f"Unnamed: {i}" if value is None else str(value) for i, value in enumerate(padded)]
+    )
+
+
+def _trim_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
+    end = len(row)
+    while end and row[end - 1] is None:
+        end -= 1
+    return row[:end]
+
+
+def _na_cell(value: Any) -> Any:
+    # pd.read_excel reads pandas' default NA strings ("#N/A", "n/a", ...) as missing.
+    if isinstance(value, str) and value.strip() in STR_NA_VALUES:
+        return None
+    return value
+
+
+def _records_frame(rows: list[tuple[Any, ...]], names: list[str]) -> pd.DataFrame:
+    width = len(names)
+    return pd.DataFrame.from_records(
+        [tuple(map(_na_cell, row)) + (None,) * (width - len(row)) for row in rows],
+        columns=names,
+    )
+
+
+def _iter_sheet_rows(path: Path, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Stream the first sheet of an .xlsx workbook with openpyxl's read-only mode.
+
+    Rows follow `pd.read_excel`: blank rows between data rows are kept as empty
+    rows, trailing blank rows and trailing empty cells are dropped, and a data row
+    wider than the header adds `Unnamed: i` columns.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = _trim_row(header)
+        names = _header_names(header, len(header))
+        pending: list[tuple[Any, ...]] = []
+        blank_run = 0
+        yielded = False
+        for row in rows:
+            row = _trim_row(row)
+            if not row:
+                blank_run += 1
+                continue
+            pending.extend([()] * blank_run)
+            blank_run = 0
+            if len(row) > len(names):
+                names = _header_names(header, len(row))
+            pending.append(row)
+            while len(pending) >= batch_size:
+                yield _records_frame(pending[:batch_size], names)
+                pending = pending[batch_size:]
+                yielded = True
+        if pending or not yielded:
+            yield _records_frame(pending, names)
+    finally:
+        workbook.close()
+
+
+def _parse_batches(path: Path, batch_size: int) -> Iterator[pd.DataFrame]:
+    if path.suffix.lower() == ".xls":
+        # openpyxl cannot read legacy .xls; pandas parses it in one go.
+        frame = pd.read_excel(path)
+        for start in range(0, len(frame), batch_size):
+            yield frame.iloc[start : start + batch_size].reset_index(drop=True)
+        return
+    yield from _iter_sheet_rows(path, batch_size)
+
+
+def _projection(names: list[str], columns: Sequence[str] | None) -> list[str] | None:
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return [name for name in names if name in wanted]
+
+
+def _project(frame: pd.DataFrame, columns: Sequence[str] | None) -> pd.DataFrame:
+    projection = _projection(list(frame.columns), columns)
+    return frame if projection is None else frame[projection]
+
+
+def _read_sidecar_batches(
+    sidecar: Path, batch_size: int, columns: Sequence[str] | None
+) -> Iterator[pd.DataFrame]:
+    parquet_file = pq.ParquetFile(sidecar, memory_map=True)
+    projection = _projection(parquet_file.schema_arrow.names, columns)
+    for record_batch in parquet_file.iter_batches(batch_size=batch_size, columns=projection):
+        yield record_batch.to_pandas()
+
+
+def iter_excel_file(
+    path: Path, batch_size: int, columns: Sequence[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield the first sheet of a workbook in batches of at most `batch_size` rows.
+
+    A cached Parquet sidecar keyed by the workbook's content hash is used when
+    present; otherwise the sheet is parsed in openpyxl read-only mode and the
+    sidecar is written alongside. Batches whose columns or column types drift from
+    the first batch abandon the sidecar rather than fail the read.
+    """
+    sidecar = _sidecar_path(path)
+    if sidecar is not None and sidecar.exists():
+        logger.debug("Excel sidecar hit for %s", path)
+        yield from _read_sidecar_batches(sidecar, batch_size, columns)
+        return
+
+    writer: pq.ParquetWriter | None = None
+    tmp_path = sidecar.with_suffix(".tmp") if sidecar is not None else None
+    cacheable = tmp_path is not None
+    try:
+        for frame in _parse_batches(path, batch_size):
+            if cacheable:
+                try:
+                    table = pa.Table.from_pandas(frame, preserve_index=False)
+                    if writer is None:
+                        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+                        writer = pq.ParquetWriter(tmp_path, table.schema)
+                    writer.write_table(table.cast(writer.schema))
+                except (
+                    pa.ArrowInvalid,
+                    pa.ArrowTypeError,
+                    pa.ArrowNotImplementedError,
+                    ValueError,
+                ):
+                    logger.debug("Excel sidecar skipped for %s: inconsistent types", path)
+                    cacheable = False
+            yield _project(frame, columns)
+        if writer is not None:
+            writer.close()
+            writer = None
+            if cacheable:
+                tmp_path.replace(sidecar)
+    finally:
+        if writer is not None:
+            writer.close()
+        if tmp_path is not None and tmp_path.exists():
+            tmp_path.unlink()
+
+
+def read_excel_file(path: Path, columns: Sequence[str] | None = None) -> pd.DataFrame:
+    """Read the first sheet of a workbook, via its Parquet sidecar when cached."""
+    sidecar = _sidecar_path(path)
+    if sidecar is not None and sidecar.exists():
+        logger.debug("Excel sidecar hit for %s", path)
+        projection = _projection(pq.read_schema(sidecar).names, columns)
+        return pq.read_table(sidecar, columns=projection, memory_map=True).to_pandas()
+    frames = list(iter_excel_file(path, batch_size=_FULL_READ_BATCH_SIZE, columns=columns))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True, sort=False)
+
@@ -1,44 +1,423 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
+from typing import Any, Iterator, Sequence
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+import pyarrow.json as pajson
+import pyarrow.parquet as pq
+from pandas._libs.parsers import STR_NA_VALUES
+from pandas.api.types import infer_dtype, is_object_dtype
 
+from datalab.config import VALID_DTYPE_BACKENDS, VALID_READ_ENGINES
+from datalab.excel import iter_excel_file, read_excel_file
 from datalab.exceptions import DataReadError
 
-SUPPORTED_SUFFIXES = {".csv", ".jsonl", ".xlsx", ".xls"}
+COLUMNAR_SUFFIXES = {".parquet", ".feather", ".arrow"}
+SUPPORTED_SUFFIXES = {".csv", ".jsonl", ".xlsx", ".xls"} | COLUMNAR_SUFFIXES
+# Outer suffix -> pyarrow codec; only line-oriented text formats may be compressed.
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd"}
+COMPRESSIBLE_SUFFIXES = {".csv", ".jsonl"}
+DEFAULT_BATCH_SIZE = 50_000
+ARROW_STRING_DTYPE = pd.StringDtype("pyarrow")
+
+
+def _validate_read_options(engine: str, dtype_backend: str) -> None:
+    if engine not in VALID_READ_ENGINES:
+        raise ValueError(
+            f"Unknown read engine: {engine}. Expected one of {sorted(VALID_READ_ENGINES)}."
+        )
+    if dtype_backend not in VALID_DTYPE_BACKENDS:
+        raise ValueError(
+            f"Unknown dtype_backend: {dtype_backend}. "
+            f"Expected one of {sorted(VALID_DTYPE_BACKENDS)}."
+        )
+
+
+def apply_dtype_backend(df: pd.DataFrame, dtype_backend: str = "numpy") -> pd.DataFrame:
+    """
+    Convert object columns holding only strings to `string[pyarrow]` when
+    `dtype_backend="pyarrow"`; a no-op for the default NumPy backend.
+    """
+    if dtype_backend != "pyarrow":
+        return df
+    for col in df.columns:
+        if is_object_dtype(df[col]) and infer_dtype(df[col], skipna=True) == "string":
+            df[col] = df[col].astype(ARROW_STRING_DTYPE)
+    return df
+
+
+def _arrow_to_pandas(table: pa.Table, dtype_backend: str) -> pd.DataFrame:
+    if dtype_backend == "pyarrow":
+        string_types = {pa.string(): ARROW_STRING_DTYPE, pa.large_string(): ARROW_STRING_DTYPE}
+        return table.to_pandas(types_mapper=string_types.get)
+    return table.to_pandas()
+
+
+def _csv_convert_options() -> pacsv.ConvertOptions:
+    # pandas' NA strings, also for string columns, so both engines read the same nulls.
+    return pacsv.ConvertOptions(null_values=sorted(STR_NA_VALUES), strings_can_be_null=True)
+
+
+def _project_frame(frame: pd.DataFrame, columns: Sequence[str] | None) -> pd.DataFrame:
+    if columns is None:
+        return frame
+    wanted = set(columns)
+    return frame[[col for col in frame.columns if col in wanted]]
+
+
+def _csv_usecols(columns: Sequence[str] | None):
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return lambda col: col in wanted
+
+
+def _columnar_projection(
+    schema_names: list[str], columns: Sequence[str] | None
+) -> list[str] | None:
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return [name for name in schema_names if name in wanted]
+
+
+def _project_table(table: pa.Table, columns: Sequence[str] | None) -> pa.Table:
+    projection = _columnar_projection(table.schema.names, columns)
+    return table if projection is None else table.select(projection)
+
+
+def _read_columnar(path: Path, columns: Sequence[str] | None) -> pa.Table:
+    """Memory-map a Parquet/Feather/Arrow IPC file and read only the projected columns."""
+    if path.suffix.lower() == ".parquet":
+        parquet_file = pq.ParquetFile(path, memory_map=True)
+        projection = _columnar_projection(parquet_file.schema_arrow.names, columns)
+        return parquet_file.read(columns=projection, use_pandas_metadata=False)
+    with pa.ipc.open_file(pa.memory_map(str(path))) as reader:
+        names = reader.schema.names
+    return feather.read_table(path, columns=_columnar_projection(names, columns), memory_map=True)
+
+
+def _split_suffix(path: Path) -> tuple[str, str | None]:
+    """Return (format suffix, compression codec), e.g. `a.csv.gz` -> (".csv", "gzip")."""
+    suffixes = [s.lower() for s in path.suffixes]
+    if len(suffixes) >= 2 and suffixes[-1] in COMPRESSION_SUFFIXES:
+        return suffixes[-2], COMPRESSION_SUFFIXES[suffixes[-1]]
+    return path.suffix.lower(), None
+
+
+def _is_supported(path: Path) -> bool:
+    suffix, codec = _split_suffix(path)
+    if codec is not None:
+        return suffix in COMPRESSIBLE_SUFFIXES
+    return suffix in SUPPORTED_SUFFIXES
+
+
+@contextmanager
+def _open_source(path: Path) -> Iterator[Any]:
+    """
+    Yield something the CSV/JSONL readers accept: the path itself, or a streaming
+    decompressor so compressed files are never inflated to disk or fully into RAM.
+    """
+    _, codec = _split_suffix(path)
+    if codec is None:
+        yield path
+        return
+    with pa.input_stream(str(path), compression=codec) as stream:
+        yield stream
 
 
 def discover_input_files(input_path: str | Path) -> list[Path]:
     base = Path(input_path)
     if base.is_file():
-        return [base] if base.suffix.lower() in SUPPORTED_SUFFIXES else []
+        return [base] if _is_supported(base) else []
     if not base.exists():
         return []
-    return sorted(
-        p for p in base.rglob("*") if p.is_file() and p.suffix.lower() in SUPPORTED_SUFFIXES
-    )
+    return sorted(p for p in base.rglob("*") if p.is_file() and _is_supported(p))
+
+
+def read_single_file(
+    path: Path,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read one input file, keeping only `columns` when given (absent names are ignored).
+
+    `engine="pyarrow"` parses CSV/JSONL with pyarrow's multithreaded readers.
+    Parquet/Feather/Arrow files are memory-mapped and only the projected columns are
+    deserialized. Excel sheets are parsed once and then served from a Parquet
+    sidecar (see `datalab.excel`).
+    """
+    _validate_read_options(engine, dtype_backend)
+    suffix, _ = _split_suffix(path)
+    if suffix in COLUMNAR_SUFFIXES:
+        return _arrow_to_pandas(_read_columnar(path, columns), dtype_backend)
+    if suffix in COMPRESSIBLE_SUFFIXES:
+        with _open_source(path) as source:
+            if engine == "pyarrow" and suffix == ".csv":
+                table = pacsv.read_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(use_threads=True),
+                    convert_options=_csv_convert_options(),
+                )
+                return _arrow_to_pandas(_project_table(table, columns), dtype_backend)
+            if engine == "pyarrow":
+                read_options = pajson.ReadOptions(use_threads=True)
+                table = pajson.read_json(source, read_options=read_options)
+                return _arrow_to_pandas(_project_table(table, columns), dtype_backend)
+            if suffix == ".csv":
+                frame = pd.read_csv(source, usecols=_csv_usecols(columns))
+            else:
+                frame = _project_frame(pd.read_json(source, lines=True), columns)
+            return apply_dtype_backend(frame, dtype_backend)
+    if suffix in {".xlsx", ".xls"}:
+        return apply_dtype_backend(read_excel_file(path, columns=columns), dtype_backend)
+    raise DataReadError(f"Unsupported file type: {path}")
+
+
+def _rebatch_arrow(
+    record_batches: Iterator[pa.RecordBatch], batch_size: int, dtype_backend: str
+) -> Iterator[pd.DataFrame]:
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for record_batch in record_batches:
+        pending.append(record_batch)
+        pending_rows += record_batch.num_rows
+        while pending_rows >= batch_size:
+            table = pa.Table.from_batches(pending)
+            yield _arrow_to_pandas(table.slice(0, batch_size), dtype_backend)
+            rest = table.slice(batch_size)
+            pending = rest.to_batches()
+            pending_rows = rest.num_rows
+    if pending_rows:
+        yield _arrow_to_pandas(pa.Table.from_batches(pending), dtype_backend)
+
+
+def _iter_columnar(
+    path: Path, batch_size: int, columns: Sequence[str] | None
+) -> Iterator[pa.RecordBatch]:
+    if path.suffix.lower() == ".parquet":
+        parquet_file = pq.ParquetFile(path, memory_map=True)
+        projection = _columnar_projection(parquet_file.schema_arrow.names, columns)
+        yield from parquet_file.iter_batches(
+            batch_size=batch_size, columns=projection, use_pandas_metadata=False
+        )
+        return
+    # Slices of a memory-mapped IPC table are zero-copy views.
+    yield from _read_columnar(path, columns).to_batches(max_chunksize=batch_size)
+
+
+def _iter_pandas_csv(
+    path: Path,
+    batch_size: int,
+    dtype_backend: str,
+    columns: Sequence[str] | None,
+    skip_rows: int = 0,
+) -> Iterator[pd.DataFrame]:
+    with _open_source(path) as source, pd.read_csv(
+        source, chunksize=batch_size, usecols=_csv_usecols(columns)
+    ) as reader:
+        for frame in reader:
+            if skip_rows >= len(frame):
+                skip_rows -= len(frame)
+                continue
+            if skip_rows:
+                frame = frame.iloc[skip_rows:]
+                skip_rows = 0
+            yield apply_dtype_backend(frame, dtype_backend)
+
 
+def _iter_pyarrow_csv(
+    path: Path, batch_size: int, dtype_backend: str, columns: Sequence[str] | None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV with pyarrow's reader, parsing only the projected columns.
 
-def read_single_file(path: Path) -> pd.DataFrame:
-    suffix = path.suffix.lower()
+    The streaming reader fixes column types from the first block, so a column that
+    looks numeric there and holds text further down fails mid-file; the remaining
+    rows are then read with the pandas reader, as a pandas-engine read would.
+    """
+    convert_options = _csv_convert_options()
+    if columns is not None:
+        with _open_source(path) as source:
+            names = pacsv.open_csv(source).schema.names
+        projection = _columnar_projection(names, columns)
+        if not projection:
+            yield from _iter_pandas_csv(path, batch_size, dtype_backend, columns)
+            return
+        convert_options.include_columns = projection
+    yielded = 0
+    with _open_source(path) as source:
+        reader = pacsv.open_csv(
+            source,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=convert_options,
+        )
+        try:
+            for frame in _rebatch_arrow(reader, batch_size, dtype_backend):
+                yielded += len(frame)
+                yield frame
+            return
+        except pa.ArrowInvalid:
+            pass
+    yield from _iter_pandas_csv(path, batch_size, dtype_backend, columns, skip_rows=yielded)
+
+
+def iter_single_file(
+    path: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a file as DataFrame batches of at most `batch_size` rows.
+
+    CSV, JSONL (compressed or not), columnar files and .xlsx workbooks are read
+    incrementally. pyarrow has no incremental JSON reader, so JSONL always streams
+    through pandas.
+    """
+    _validate_read_options(engine, dtype_backend)
+    suffix, _ = _split_suffix(path)
+    if suffix in COLUMNAR_SUFFIXES:
+        record_batches = _iter_columnar(path, batch_size, columns)
+        yield from _rebatch_arrow(record_batches, batch_size, dtype_backend)
+        return
+    if suffix == ".csv" and engine == "pyarrow":
+        yield from _iter_pyarrow_csv(path, batch_size, dtype_backend, columns)
+        return
     if suffix == ".csv":
-        return pd.read_csv(path)
+        yield from _iter_pandas_csv(path, batch_size, dtype_backend, columns)
+        return
     if suffix == ".jsonl":
-        return pd.read_json(path, lines=True)
+        with _open_source(path) as source, pd.read_json(
+            source, lines=True, chunksize=batch_size
+        ) as reader:
+            for frame in reader:
+                yield apply_dtype_backend(_project_frame(frame, columns), dtype_backend)
+        return
     if suffix in {".xlsx", ".xls"}:
-        return pd.read_excel(path)
+        for frame in iter_excel_file(path, batch_size=batch_size, columns=columns):
+            yield apply_dtype_backend(frame, dtype_backend)
+        return
     raise DataReadError(f"Unsupported file type: {path}")
 
 
-def read_input_data(input_path: str | Path) -> pd.DataFrame:
+def _tag_source_file(frame: pd.DataFrame, path: Path) -> pd.DataFrame:
+    # Re-cleaned outputs already carry lineage from the original crawl files; keep it.
+    if "__source_file" not in frame.columns:
+        frame["__source_file"] = path.name
+    return frame
+
+
+def _read_tagged_file(
+    path: Path,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    frame = read_single_file(path, engine=engine, dtype_backend=dtype_backend, columns=columns)
+    return _tag_source_file(frame, path)
+
+
+def _read_files_parallel(
+    files: list[Path],
+    workers: int,
+    engine: str,
+    dtype_backend: str,
+    columns: Sequence[str] | None,
+) -> list[pd.DataFrame]:
+    """
+    Parse files concurrently and return frames in the order of `files`.
+
+    pyarrow releases the GIL while decoding columnar files (and parsing CSV when
+    `engine="pyarrow"`), so those are read on threads and never pickled; the
+    remaining formats are parsed in a process pool with the requested engine, so
+    the result does not depend on `workers`.
+    """
+    threaded_suffixes = set(COLUMNAR_SUFFIXES)
+    if engine == "pyarrow":
+        threaded_suffixes.add(".csv")
+    threaded = [_split_suffix(p)[0] in threaded_suffixes for p in files]
+    thread_idx = [i for i, flag in enumerate(threaded) if flag]
+    process_idx = [i for i, flag in enumerate(threaded) if not flag]
+    frames: list[pd.DataFrame | None] = [None] * len(files)
+    read_file = partial(
+        _read_tagged_file, engine=engine, dtype_backend=dtype_backend, columns=columns
+    )
+
+    if thread_idx:
+        thread_files = [files[i] for i in thread_idx]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i, frame in zip(thread_idx, pool.map(read_file, thread_files)):
+                frames[i] = frame
+    if process_idx:
+        process_files = [files[i] for i in process_idx]
+        with ProcessPoolExecutor(max_workers=min(workers, len(process_idx))) as pool:
+            for i, frame in zip(process_idx, pool.map(read_file, process_files)):
+                frames[i] = frame
+    return frames  # type: ignore[return-value]
+
+
+def read_input_data(
+    input_path: str | Path,
+    workers: int = 1,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
     files = discover_input_files(input_path)
     if not files:
         raise DataReadError(f"No supported files found under: {input_path}")
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    _validate_read_options(engine, dtype_backend)
 
-    frames: list[pd.DataFrame] = []
-    for file_path in files:
-        frame = read_single_file(file_path)
-        frame["__source_file"] = file_path.name
-        frames.append(frame)
+    if workers > 1 and len(files) > 1:
+        frames = _read_files_parallel(files, workers, engine, dtype_backend, columns)
+    else:
+        frames = [
+            _read_tagged_file(
+                file_path, engine=engine, dtype_backend=dtype_backend, columns=columns
+            )
+            for file_path in files
+        ]
     return pd.concat(frames, ignore_index=True, sort=False)
+
+
+def iter_input_data(
+    input_path: str | Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    engine: str = "pandas",
+    dtype_backend: str = "numpy",
+    columns: Sequence[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streaming counterpart of `read_input_data`.
+
+    Batches never span two files, so every batch carries a single `__source_file` value.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    _validate_read_options(engine, dtype_backend)
+    files = discover_input_files(input_path)
+    if not files:
+        raise DataReadError(f"No supported files found under: {input_path}")
+
+    for file_path in files:
+        for frame in iter_single_file(
+            file_path,
+            batch_size=batch_size,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            columns=columns,
+        ):
+            yield _tag_source_file(frame, file_path)
@@ -9,6 +9,7 @@ import pandas as pd
 
 from datalab.config import ConfigValidationError, resolve_section_config
 from datalab.logging_utils import setup_logging
+from datalab.skill_tags import load_skill_bits, skill_counts
 
 logger = logging.getLogger(__name__)
 
@@ -123,7 +124,7 @@ def city_exp_summary(df: pd.DataFrame) -> pd.DataFrame:
     work["negotiable_bool"] = work["salary_is_negotiable"].apply(_as_bool)
     work["negotiable_float"] = work["negotiable_bool"].astype("float64")
     grouped = (
-        work.groupby(["city", "exp_bucket"], dropna=False)
+        work.groupby(["city", "exp_bucket"], dropna=False, observed=True)
         .agg(
             n_jobs=("url", "size"),
             p50_mid_k=("mid_k", "median"),
@@ -163,7 +164,13 @@ def _render_table(headers: list[str], rows: list[list[Any]]) -> str:
     return "\n".join([header_line, align_line, *body])
 
 
-def build_jd_market_report(df: pd.DataFrame) -> str:
+def build_jd_market_report(df: pd.DataFrame, skill_bits: list[str] | None = None) -> str:
+    """
+    Render the market report for a cleaned JD frame.
+
+    `skill_bits` is the `skill_mask` tag order of the cleaning run (`skill_bits.json`);
+    with it skill counts come from the bit masks instead of the `skill_tags` strings.
+    """
     work = df.copy()
     if "raw_salary_text" not in work.columns:
         work["raw_salary_text"] = work.get("salary_text", pd.Series(["UNKNOWN"] * len(work)))
@@ -233,22 +240,11 @@ def build_jd_market_report(df: pd.DataFrame) -> str:
 
     skill_rows: list[list[Any]] = []
     if "skill_tags" in work.columns:
-        skill = work[["city", "exp_bucket", "skill_tags"]].copy()
-        skill["skill_tags"] = skill["skill_tags"].fillna("").astype(str)
-        skill = skill.assign(skill_tag=skill["skill_tags"].str.split("|")).explode("skill_tag")
-        skill = skill[skill["skill_tag"].astype(str).str.len() > 0]
-        if not skill.empty:
-            skill_heat = (
-                skill.groupby(["city", "exp_bucket", "skill_tag"], dropna=False)
-                .size()
-                .reset_index(name="n_jobs")
-                .sort_values("n_jobs", ascending=False)
-                .head(50)
-            )
-            skill_rows = [
-                [row["city"], row["exp_bucket"], row["skill_tag"], int(row["n_jobs"])]
-                for _, row in skill_heat.iterrows()
-            ]
+        skill_heat = skill_counts(work, ["city", "exp_bucket"], skill_bits).head(50)
+        skill_rows = [
+            [row["city"], row["exp_bucket"], row["skill_tag"], int(row["n_jobs"])]
+            for _, row in skill_heat.iterrows()
+        ]
 
     lines = [
         "# JD Market Report",
@@ -299,7 +295,7 @@ def generate_jd_market_report(input_path: str | Path, output_path: str | Path) -
     logger.info("Reading parquet from %s", in_path)
     df = pd.read_parquet(in_path)
     ensure_required_columns(df)
-    report = build_jd_market_report(df)
+    report = build_jd_market_report(df, skill_bits=load_skill_bits(in_path.parent))
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(report, encoding="utf-8")
     logger.info("Wrote JD market report: %s", out_path)
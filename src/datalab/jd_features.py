@@ -1,9 +1,75 @@
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from datalab.memory import working_copy
+
+if TYPE_CHECKING:
+    from datalab.parse_cache import ParseCache
+
+
+def _number(name: str) -> str:
+    return rf"(?P<{name}>\d+(?:\.\d+)?)"
+
+
+_SALARY_UNIT = r"(?P<{}>k|千|w|万)"
+SALARY_MONTHS_RE = re.compile(r"(?P<months>\d{1,2})\s*薪")
+SALARY_RANGE_RE = re.compile(
+    _number("low")
+    + r"\s*"
+    + _SALARY_UNIT.format("low_unit")
+    + r"?\s*[-~至到]\s*"
+    + _number("high")
+    + r"\s*"
+    + _SALARY_UNIT.format("high_unit")
+    + "?"
+)
+SALARY_SINGLE_RE = re.compile(_number("value") + r"\s*" + _SALARY_UNIT.format("unit"))
+NEGOTIABLE_TOKENS = ("面议", "negotiable", "待定")
+EXP_RANGE_RE = re.compile(_number("low") + r"\s*[-~至到]\s*" + _number("high") + r"\s*年")
+EXP_MIN_RE = re.compile(_number("value") + r"\s*年以上")
+EXP_MAX_RE = re.compile(_number("value") + r"\s*年以下")
+EXP_SINGLE_RE = re.compile(_number("value") + r"\s*年")
+EXP_NONE_TOKENS = ("不限", "无经验", "无需经验")
+EXP_GRADUATE_TOKENS = ("应届", "在校")
+# Ordered: the first matching rule wins.
+EDUCATION_RULES = (
+    (("不限", "无要求"), "no_requirement"),
+    (("博士",), "phd"),
+    (("硕士",), "master"),
+    (("本科",), "bachelor"),
+    (("大专",), "associate"),
+    (("中专", "高中"), "high_school"),
+)
+SALARY_COLUMNS = ("salary_min_k", "salary_max_k", "salary_months", "salary_is_negotiable")
+EXPERIENCE_COLUMNS = ("exp_min_years", "exp_max_years")
+# Always float64, so batches and files without a single match agree on the type.
+NUMERIC_FEATURE_COLUMNS = (*SALARY_COLUMNS[:3], *EXPERIENCE_COLUMNS)
+# Changes whenever a pattern or token list does, invalidating persisted parse caches.
+PARSER_FINGERPRINT = hashlib.sha256(
+    repr(
+        [
+            pattern.pattern
+            for pattern in (
+                SALARY_MONTHS_RE,
+                SALARY_RANGE_RE,
+                SALARY_SINGLE_RE,
+                EXP_RANGE_RE,
+                EXP_MIN_RE,
+                EXP_MAX_RE,
+                EXP_SINGLE_RE,
+            )
+        ]
+        + [NEGOTIABLE_TOKENS, EXP_NONE_TOKENS, EXP_GRADUATE_TOKENS, EDUCATION_RULES]
+    ).encode()
+).hexdigest()[:16]
 
 
 def _to_text(value: Any) -> str:
@@ -27,15 +93,12 @@ def parse_salary(salary_text: Any) -> tuple[float | None, float | None, int | No
         return (None, None, None, False)
 
     text_lower = text.lower()
-    negotiable = any(token in text_lower for token in ["面议", "negotiable", "待定"])
+    negotiable = any(token in text_lower for token in NEGOTIABLE_TOKENS)
 
-    months_match = re.search(r"(\d{1,2})\s*薪", text_lower)
+    months_match = SALARY_MONTHS_RE.search(text_lower)
     months = int(months_match.group(1)) if months_match else None
 
-    range_match = re.search(
-        r"(\d+(?:\.\d+)?)\s*(k|千|w|万)?\s*[-~至到]\s*(\d+(?:\.\d+)?)\s*(k|千|w|万)?",
-        text_lower,
-    )
+    range_match = SALARY_RANGE_RE.search(text_lower)
     if range_match:
         left = float(range_match.group(1))
         right = float(range_match.group(3))
@@ -43,7 +106,7 @@ def parse_salary(salary_text: Any) -> tuple[float | None, float | None, int | No
         right_unit = range_match.group(4) or range_match.group(2) or "k"
         return (_to_k(left, left_unit), _to_k(right, right_unit), months, negotiable)
 
-    single_match = re.search(r"(\d+(?:\.\d+)?)\s*(k|千|w|万)", text_lower)
+    single_match = SALARY_SINGLE_RE.search(text_lower)
     if single_match:
         val = _to_k(float(single_match.group(1)), single_match.group(2))
         if "以上" in text_lower or "+" in text_lower:
@@ -60,24 +123,24 @@ def parse_experience(exp_text: Any) -> tuple[float | None, float | None]:
     if not text:
         return (None, None)
 
-    if any(token in text for token in ["不限", "无经验", "无需经验"]):
+    if any(token in text for token in EXP_NONE_TOKENS):
         return (None, None)
-    if any(token in text for token in ["应届", "在校"]):
+    if any(token in text for token in EXP_GRADUATE_TOKENS):
         return (0.0, 1.0)
 
-    range_match = re.search(r"(\d+(?:\.\d+)?)\s*[-~至到]\s*(\d+(?:\.\d+)?)\s*年", text)
+    range_match = EXP_RANGE_RE.search(text)
     if range_match:
         return (float(range_match.group(1)), float(range_match.group(2)))
 
-    min_match = re.search(r"(\d+(?:\.\d+)?)\s*年以上", text)
+    min_match = EXP_MIN_RE.search(text)
     if min_match:
         return (float(min_match.group(1)), None)
 
-    max_match = re.search(r"(\d+(?:\.\d+)?)\s*年以下", text)
+    max_match = EXP_MAX_RE.search(text)
     if max_match:
         return (0.0, float(max_match.group(1)))
 
-    single_match = re.search(r"(\d+(?:\.\d+)?)\s*年", text)
+    single_match = EXP_SINGLE_RE.search(text)
     if single_match:
         year = float(single_match.group(1))
         return (year, year)
@@ -90,47 +153,263 @@ def normalize_education(edu_text: Any) -> str:
     if not text:
         return "unknown"
 
-    if any(token in text for token in ["不限", "无要求"]):
-        return "no_requirement"
-    if "博士" in text:
-        return "phd"
-    if "硕士" in text:
-        return "master"
-    if "本科" in text:
-        return "bachelor"
-    if "大专" in text:
-        return "associate"
-    if any(token in text for token in ["中专", "高中"]):
-        return "high_school"
+    for tokens, level in EDUCATION_RULES:
+        if any(token in text for token in tokens):
+            return level
     return "other"
 
 
-def extract_jd_features(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
+# RE2 spellings of Python's Unicode-aware `\d` and `\s`, so the Arrow kernels
+# match exactly what the scalar parsers match.
+_RE2_CLASSES = {r"\d": r"\p{Nd}", r"\s": r"[\t-\r\x{1c}-\x{1f}\x{85}\p{Z}]"}
+
+
+def _re2_pattern(pattern: re.Pattern[str]) -> str:
+    text = pattern.pattern
+    for python_class, re2_class in _RE2_CLASSES.items():
+        text = text.replace(python_class, re2_class)
+    return text
+
+
+def _text_array(series: pd.Series, lower: bool = False) -> pa.Array:
+    """Vectorized `_to_text`: stripped text with missing values as ""."""
+    values = series.astype("string") if not pd.api.types.is_string_dtype(series) else series
+    text = pc.utf8_trim_whitespace(pa.array(values, type=pa.string(), from_pandas=True))
+    if lower:
+        text = pc.utf8_lower(text)
+    return pc.fill_null(text, "")
+
+
+def _contains_any(text: pa.Array, tokens: tuple[str, ...]) -> np.ndarray:
+    found = np.zeros(len(text), dtype=bool)
+    for token in tokens:
+        found |= pc.match_substring(text, token).to_numpy(zero_copy_only=False)
+    return found
+
+
+def _extract(text: pa.Array, pattern: re.Pattern[str]) -> dict[str, pa.Array]:
+    """Named groups of the first match of `pattern`; unmatched groups are null."""
+    matches = pc.extract_regex(text, _re2_pattern(pattern))
+    groups = {}
+    for name in pattern.groupindex:
+        group = pc.struct_field(matches, name)
+        groups[name] = pc.if_else(pc.equal(group, ""), pa.scalar(None, pa.string()), group)
+    return groups
+
+
+def _found(group: pa.Array) -> np.ndarray:
+    return pc.is_valid(group).to_numpy(zero_copy_only=False)
+
+
+def _to_float(group: pa.Array) -> np.ndarray:
+    is_ascii = pc.fill_null(pc.string_is_ascii(group), False)
+    ascii_group = pc.if_else(is_ascii, group, pa.scalar(None, pa.string()))
+    numbers = ascii_group.cast(pa.float64()).to_numpy(zero_copy_only=False)
+    # Non-ASCII digits (e.g. full-width) match `\d` but need Python's float().
+    leftover = np.flatnonzero(_found(group) & ~is_ascii.to_numpy(zero_copy_only=False))
+    if len(leftover):
+        numbers[leftover] = [float(value) for value in group.take(leftover).to_pylist()]
+    return numbers
+
+
+def _unit_scale(units: pa.Array) -> np.ndarray:
+    in_ten_k = pc.fill_null(pc.is_in(units, value_set=pa.array(["w", "万"])), False)
+    return np.where(in_ten_k.to_numpy(zero_copy_only=False), 10.0, 1.0)
+
+
+def _like_apply(values: np.ndarray, index: pd.Index, integer: bool = False) -> pd.Series:
+    """Build the column `Series.apply` would infer from the scalar parsers' results."""
+    missing = np.isnan(values)
+    if missing.all():
+        return pd.Series([None] * len(values), index=index, dtype=object)
+    if integer and not missing.any():
+        return pd.Series(values.astype(np.int64), index=index)
+    return pd.Series(values, index=index)
+
+
+def parse_salary_series(series: pd.Series) -> pd.DataFrame:
+    """
+    Vectorized `parse_salary`: Arrow regex kernels over the whole column.
+
+    Returns `salary_min_k`, `salary_max_k`, `salary_months` and
+    `salary_is_negotiable` with the values `parse_salary` gives row by row.
+    """
+    text = _text_array(series, lower=True)
+    negotiable = _contains_any(text, NEGOTIABLE_TOKENS)
+    months = _to_float(_extract(text, SALARY_MONTHS_RE)["months"])
+
+    ranged = _extract(text, SALARY_RANGE_RE)
+    has_range = _found(ranged["low"])
+    low_unit, high_unit = ranged["low_unit"], ranged["high_unit"]
+    range_min = _to_float(ranged["low"]) * _unit_scale(pc.coalesce(low_unit, high_unit))
+    range_max = _to_float(ranged["high"]) * _unit_scale(pc.coalesce(high_unit, low_unit))
+
+    single = _extract(text, SALARY_SINGLE_RE)
+    single_value = _to_float(single["value"]) * _unit_scale(single["unit"])
+    has_single = ~has_range & ~np.isnan(single_value)
+    at_least = _contains_any(text, ("以上", "+"))
+    at_most = ~at_least & _contains_any(text, ("以下",))
+
+    salary_min = np.where(has_range, range_min, np.nan)
+    salary_max = np.where(has_range, range_max, np.nan)
+    salary_min = np.where(has_single & ~at_most, single_value, salary_min)
+    salary_max = np.where(has_single & ~at_least, single_value, salary_max)
+    return pd.DataFrame(
+        {
+            "salary_min_k": _like_apply(salary_min, series.index),
+            "salary_max_k": _like_apply(salary_max, series.index),
+            "salary_months": _like_apply(months, series.index, integer=True),
+            "salary_is_negotiable": pd.Series(negotiable, index=series.index),
+        }
+    )
+
+
+def parse_experience_series(series: pd.Series) -> pd.DataFrame:
+    """Vectorized `parse_experience`, returning `exp_min_years` and `exp_max_years`."""
+    text = _text_array(series, lower=True)
+    ranged = _extract(text, EXP_RANGE_RE)
+    minimum = _to_float(_extract(text, EXP_MIN_RE)["value"])
+    maximum = _to_float(_extract(text, EXP_MAX_RE)["value"])
+    single = _to_float(_extract(text, EXP_SINGLE_RE)["value"])
+
+    # Rules in the order `parse_experience` tries them; the first match wins.
+    conditions = [
+        _contains_any(text, EXP_NONE_TOKENS),
+        _contains_any(text, EXP_GRADUATE_TOKENS),
+        _found(ranged["low"]),
+        ~np.isnan(minimum),
+        ~np.isnan(maximum),
+        ~np.isnan(single),
+    ]
+    low, high = _to_float(ranged["low"]), _to_float(ranged["high"])
+    exp_min = np.select(conditions, [np.nan, 0.0, low, minimum, 0.0, single], default=np.nan)
+    exp_max = np.select(conditions, [np.nan, 1.0, high, np.nan, maximum, single], default=np.nan)
+    return pd.DataFrame(
+        {
+            "exp_min_years": _like_apply(exp_min, series.index),
+            "exp_max_years": _like_apply(exp_max, series.index),
+        }
+    )
+
+
+def normalize_education_series(series: pd.Series) -> pd.Series:
+    """Vectorized `normalize_education`."""
+    text = _text_array(series)
+    conditions = [pc.equal(text, "").to_numpy(zero_copy_only=False)]
+    levels = ["unknown"]
+    for tokens, level in EDUCATION_RULES:
+        conditions.append(_contains_any(text, tokens))
+        levels.append(level)
+    return pd.Series(
+        np.select(conditions, levels, default="other").astype(object), index=series.index
+    )
+
+
+def _stored_form(parsed: pd.DataFrame) -> pd.DataFrame:
+    # Numeric columns as float64 (None -> NaN) so lookup tables have one stable dtype.
+    numeric = [col for col in parsed.columns if col != "salary_is_negotiable"]
+    return parsed.astype(dict.fromkeys(numeric, float))
+
+
+def _salary_table(texts: pd.Series) -> pd.DataFrame:
+    return _stored_form(parse_salary_series(texts))
+
+
+def _experience_table(texts: pd.Series) -> pd.DataFrame:
+    return _stored_form(parse_experience_series(texts))
+
+
+def _education_table(texts: pd.Series) -> pd.DataFrame:
+    return normalize_education_series(texts).to_frame("edu_level")
+
+
+def _memoized(
+    series: pd.Series,
+    kind: str,
+    parse: Callable[[pd.Series], pd.DataFrame],
+    cache: ParseCache | None,
+) -> pd.DataFrame:
+    """
+    Parse each distinct text of `series` once and broadcast the results by row code.
+
+    Missing values share the code of "", which parses to the same defaults.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    texts = _text_array(pd.Series(uniques, dtype=object)).to_numpy(zero_copy_only=False)
+    text_codes, distinct = pd.factorize(np.append(texts, ""))
+    rows = text_codes[np.where(codes < 0, len(texts), codes)]
+    distinct = np.asarray(distinct, dtype=object)
+    if cache is not None:
+        table = cache.lookup(kind, distinct, parse)
+    else:
+        table = parse(pd.Series(distinct, dtype=object))
+    columns = {}
+    for col in table.columns:
+        values = table[col].to_numpy()[rows]
+        if values.dtype == float:
+            columns[col] = _like_apply(values, series.index, integer=col == "salary_months")
+        else:
+            columns[col] = pd.Series(values, index=series.index)
+    return pd.DataFrame(columns, index=series.index)
+
+
+def parse_salary_memoized(series: pd.Series, cache: ParseCache | None = None) -> pd.DataFrame:
+    """
+    `parse_salary_series` over distinct texts only, broadcast back to every row.
+
+    JD text columns repeat a few thousand strings across many postings, so this is
+    the fast path; with a `cache` texts parsed by earlier runs are not parsed again.
+    """
+    return _memoized(series, "salary", _salary_table, cache)
+
+
+def parse_experience_memoized(
+    series: pd.Series, cache: ParseCache | None = None
+) -> pd.DataFrame:
+    """`parse_experience_series` over distinct texts only; see `parse_salary_memoized`."""
+    return _memoized(series, "experience", _experience_table, cache)
+
+
+def normalize_education_memoized(
+    series: pd.Series, cache: ParseCache | None = None
+) -> pd.Series:
+    """`normalize_education_series` over distinct texts only; see `parse_salary_memoized`."""
+    return _memoized(series, "education", _education_table, cache)["edu_level"]
+
+
+def extract_jd_features(df: pd.DataFrame, parse_cache: ParseCache | None = None) -> pd.DataFrame:
+    """
+    Derive salary, experience and education columns from the raw JD text columns.
+
+    Each distinct text is parsed once by the vectorized parsers, optionally through
+    a persistent `parse_cache`; `parse_salary`, `parse_experience` and
+    `normalize_education` remain the row-level reference implementations.
+    """
+    out = working_copy(df)
 
-    salary_values = out["salary_text"].apply(parse_salary) if "salary_text" in out.columns else []
-    if len(salary_values):
-        out["salary_min_k"] = salary_values.apply(lambda x: x[0])
-        out["salary_max_k"] = salary_values.apply(lambda x: x[1])
-        out["salary_months"] = salary_values.apply(lambda x: x[2])
-        out["salary_is_negotiable"] = salary_values.apply(lambda x: x[3])
+    if "salary_text" in out.columns and len(out):
+        salary = parse_salary_memoized(out["salary_text"], parse_cache)
+        for col in salary.columns:
+            out[col] = salary[col]
     else:
         out["salary_min_k"] = pd.NA
         out["salary_max_k"] = pd.NA
         out["salary_months"] = pd.NA
         out["salary_is_negotiable"] = False
 
-    exp_values = out["exp_text"].apply(parse_experience) if "exp_text" in out.columns else []
-    if len(exp_values):
-        out["exp_min_years"] = exp_values.apply(lambda x: x[0])
-        out["exp_max_years"] = exp_values.apply(lambda x: x[1])
+    if "exp_text" in out.columns and len(out):
+        experience = parse_experience_memoized(out["exp_text"], parse_cache)
+        out["exp_min_years"] = experience["exp_min_years"]
+        out["exp_max_years"] = experience["exp_max_years"]
     else:
         out["exp_min_years"] = pd.NA
         out["exp_max_years"] = pd.NA
 
     if "edu_text" in out.columns:
-        out["edu_level"] = out["edu_text"].apply(normalize_education)
+        out["edu_level"] = normalize_education_memoized(out["edu_text"], parse_cache)
     else:
         out["edu_level"] = "unknown"
 
+    for col in NUMERIC_FEATURE_COLUMNS:
+        out[col] = pd.to_numeric(out[col], errors="coerce").astype("float64")
     return out
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+MANIFEST_FILENAME = "ingest_manifest.json"
+SHARD_DIRNAME = "shards"
+MANIFEST_VERSION = 1
+INFERRED_TYPES_FILENAME = "inferred_types.json"
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_content_hash(path: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def settings_fingerprint(settings: dict[str, Any]) -> str:
+    """Stable hash of the options that shape cleaned shards; a change invalidates them."""
+    payload = json.dumps(settings, sort_keys=True, ensure_ascii=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def shard_path_for(output_dir: str | Path, source_path: str | Path) -> Path:
+    name = hashlib.sha1(str(Path(source_path).resolve()).encode("utf-8")).hexdigest()
+    return Path(output_dir) / SHARD_DIRNAME / f"{name}.parquet"
+
+
+def load_manifest(output_dir: str | Path) -> dict[str, Any]:
+    path = Path(output_dir) / MANIFEST_FILENAME
+    if not path.exists():
+        return {"version": MANIFEST_VERSION, "settings": None, "files": {}}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != MANIFEST_VERSION or not isinstance(data.get("files"), dict):
+        return {"version": MANIFEST_VERSION, "settings": None, "files": {}}
+    return data
+
+
+def write_manifest(manifest: dict[str, Any], output_dir: str | Path) -> Path:
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / MANIFEST_FILENAME
+    path.write_text(json.dumps(manifest, ensure_ascii=True, indent=2), encoding="utf-8")
+    return path
+
+
+def describe_file(path: str | Path, previous: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Build the manifest entry for `path`.
+
+    The content hash of `previous` is reused when size and mtime are unchanged, so
+    untouched files are never re-read.
+    """
+    stat = Path(path).stat()
+    unchanged = (
+        previous is not None
+        and previous.get("size") == stat.st_size
+        and previous.get("mtime_ns") == stat.st_mtime_ns
+    )
+    if unchanged:
+        content_hash = previous["sha256"]
+    else:
+        content_hash = file_content_hash(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": content_hash}
+
+
+def is_cached(entry: dict[str, Any], previous: dict[str, Any] | None, shard_path: Path) -> bool:
+    return bool(previous) and previous.get("sha256") == entry["sha256"] and shard_path.exists()
+
+
+def load_inferred_types(output_dir: str | Path) -> dict[str, dict[str, Any]]:
+    """Return cached `infer_object_types` decisions keyed by resolved source path."""
+    path = Path(output_dir) / INFERRED_TYPES_FILENAME
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != MANIFEST_VERSION or not isinstance(data.get("sources"), dict):
+        return {}
+    return data["sources"]
+
+
+def write_inferred_types(sources: dict[str, dict[str, Any]], output_dir: str | Path) -> Path:
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / INFERRED_TYPES_FILENAME
+    payload = {"version": MANIFEST_VERSION, "sources": sources}
+    path.write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
+    return path
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import pandas as pd
+
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+
+def copy_on_write_active() -> bool:
+    """Whether pandas copy-on-write semantics are in effect (always on from pandas 3)."""
+    return _PANDAS_MAJOR >= 3 or pd.get_option("mode.copy_on_write") is True
+
+
+@contextmanager
+def copy_on_write(enabled: bool = True) -> Iterator[None]:
+    """
+    Enable pandas copy-on-write for the duration of the block.
+
+    The option is process-wide, so threads running cleaning stages concurrently see
+    it as well; that is safe because it only makes copies lazier, never shared writes.
+    """
+    if not enabled or _PANDAS_MAJOR >= 3:
+        yield
+        return
+    with pd.option_context("mode.copy_on_write", True):
+        yield
+
+
+def working_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy `df` for a stage that assigns columns on its result.
+
+    Under copy-on-write a shallow copy is enough, since pandas copies a column only
+    when it is written; otherwise the stage gets a deep copy so the caller's frame is
+    never mutated.
+    """
+    return df.copy(deep=not copy_on_write_active())
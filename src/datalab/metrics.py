@@ -41,8 +41,23 @@ def _compute_parse_rate(df: pd.DataFrame) -> float:
     return _as_rate((salary_ok.mean() + exp_ok.mean() + edu_ok.mean()) / 3)
 
 
-def compute_metrics(raw_df: pd.DataFrame, cleaned_df: pd.DataFrame) -> dict[str, Any]:
-    raw_rows = int(len(raw_df))
+def compute_metrics(
+    raw_df: pd.DataFrame | None,
+    cleaned_df: pd.DataFrame,
+    *,
+    raw_rows: int | None = None,
+    near_duplicates: dict[str, Any] | None = None,
+    missing_sentinels: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """
+    Summarize parse quality of a cleaned frame.
+
+    `raw_df` is only used for its row count; streaming runs pass `raw_rows` instead.
+    `near_duplicates` holds the cluster statistics of the near-duplicate stage, if it ran.
+    `missing_sentinels` counts, per column, raw values such as "null" or "N/A" that
+    were normalized to missing.
+    """
+    raw_rows = int(raw_rows if raw_rows is not None else len(raw_df))
     cleaned_rows = int(len(cleaned_df))
 
     missing_rate: dict[str, float] = {}
@@ -62,7 +77,7 @@ def compute_metrics(raw_df: pd.DataFrame, cleaned_df: pd.DataFrame) -> dict[str,
     if raw_rows > 0:
         duplicates_rate = _as_rate(max(raw_rows - cleaned_rows, 0) / raw_rows)
 
-    return {
+    metrics: dict[str, Any] = {
         "row_count_raw": raw_rows,
         "row_count_cleaned": cleaned_rows,
         "parse_rate": _as_rate(_compute_parse_rate(cleaned_df)),
@@ -70,6 +85,13 @@ def compute_metrics(raw_df: pd.DataFrame, cleaned_df: pd.DataFrame) -> dict[str,
         "duplicates_rate": duplicates_rate,
         "missing_rate": missing_rate,
     }
+    if missing_sentinels is not None:
+        metrics["missing_sentinels"] = {
+            col: int(count) for col, count in sorted(missing_sentinels.items())
+        }
+    if near_duplicates is not None:
+        metrics["near_duplicates"] = dict(near_duplicates)
+    return metrics
 
 
 def write_metrics(metrics: dict[str, Any], output_dir: str | Path) -> Path:
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+NEAR_DUPLICATE_COLUMNS = ("title", "company", "city")
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 3
+_MERSENNE_PRIME = np.uint64(4294967311)  # smallest prime above 2**32
+_CODEPOINT_BITS = np.uint64(21)
+_CHUNK_ROWS = 100_000
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer; uint64 arithmetic wraps, which is what we want here.
+    with np.errstate(over="ignore"):
+        values = values + np.uint64(0x9E3779B97F4A7C15)
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+def _shingle_hashes(texts: Sequence[str], shingle_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Hash every character `shingle_size`-gram of `texts` to 32 bits.
+
+    Returns the hashes and the number of shingles per text. All texts must be
+    non-empty; shorter ones are padded to one full shingle.
+    """
+    padded = [text.ljust(shingle_size) for text in texts]
+    lengths = np.fromiter((len(text) for text in padded), dtype=np.int64, count=len(padded))
+    codepoints = np.frombuffer("".join(padded).encode("utf-32-le"), dtype=np.uint32)
+    codepoints = codepoints.astype(np.uint64)
+
+    counts = lengths - shingle_size + 1
+    text_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    shingle_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    positions = np.arange(int(counts.sum()), dtype=np.int64)
+    positions += np.repeat(text_starts - shingle_starts, counts)
+
+    packed = np.zeros(positions.shape, dtype=np.uint64)
+    for offset in range(shingle_size):
+        packed = (packed << _CODEPOINT_BITS) | codepoints[positions + offset]
+    return _mix64(packed) >> np.uint64(32), counts
+
+
+def minhash_signatures(
+    texts: Sequence[str],
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    seed: int = 1,
+) -> np.ndarray:
+    """
+    Return a `(len(texts), num_perm)` MinHash signature matrix over character shingles.
+
+    The fraction of equal signature entries between two rows estimates the Jaccard
+    similarity of their shingle sets. Texts must be non-empty.
+    """
+    rng = np.random.default_rng(seed)
+    coef_a = rng.integers(1, 2**31, size=num_perm, dtype=np.uint64)
+    coef_b = rng.integers(0, 2**31, size=num_perm, dtype=np.uint64)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint64)
+    for start in range(0, len(texts), _CHUNK_ROWS):
+        chunk = texts[start : start + _CHUNK_ROWS]
+        hashes, counts = _shingle_hashes(chunk, shingle_size)
+        row_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        for perm in range(num_perm):
+            permuted = (coef_a[perm] * hashes + coef_b[perm]) % _MERSENNE_PRIME
+            signatures[start : start + len(chunk), perm] = np.minimum.reduceat(
+                permuted, row_starts
+            )
+    return signatures
+
+
+def _candidate_pairs(signatures: np.ndarray, bands: int) -> tuple[np.ndarray, np.ndarray]:
+    # Within each LSH band, rows with an identical band slice share a bucket; pair
+    # every row with the first row of its bucket instead of enumerating all pairs.
+    rows_per_band = signatures.shape[1] // bands
+    order = np.arange(len(signatures))
+    left: list[np.ndarray] = []
+    right: list[np.ndarray] = []
+    for band in range(bands):
+        band_slice = signatures[:, band * rows_per_band : (band + 1) * rows_per_band]
+        bucket = pd.util.hash_pandas_object(pd.DataFrame(band_slice), index=False).to_numpy()
+        leader = pd.Series(order).groupby(bucket, sort=False).transform("first").to_numpy()
+        members = leader != order
+        left.append(order[members])
+        right.append(leader[members])
+    return np.concatenate(left), np.concatenate(right)
+
+
+def _connected_components(size: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Label each node with the smallest node index of its component."""
+    labels = np.arange(size)
+    while True:
+        previous = labels.copy()
+        lowest = np.minimum(labels[left], labels[right])
+        np.minimum.at(labels, left, lowest)
+        np.minimum.at(labels, right, lowest)
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def _near_duplicate_text(df: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+    available = [col for col in columns if col in df.columns]
+    if not available:
+        return pd.Series("", index=df.index, dtype="string")
+    text = df[available[0]].astype("string").fillna("")
+    for col in available[1:]:
+        text = text + " " + df[col].astype("string").fillna("")
+    return text.str.lower().str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def find_near_duplicate_clusters(
+    df: pd.DataFrame,
+    threshold: float = 0.8,
+    columns: Sequence[str] = NEAR_DUPLICATE_COLUMNS,
+    num_perm: int = DEFAULT_NUM_PERM,
+    bands: int = DEFAULT_BANDS,
+) -> np.ndarray:
+    """
+    Assign each row the position of the first row of its near-duplicate cluster.
+
+    Rows are compared on the joined `columns` text: MinHash signatures over
+    character shingles, LSH banding for candidate pairs, and a signature-similarity
+    check of each pair against `threshold`. Clusters are the connected components
+    of the accepted pairs. Rows with empty text are never clustered.
+    """
+    if num_perm % bands:
+        raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands}).")
+    labels = np.arange(len(df))
+    text = _near_duplicate_text(df, columns)
+    present = np.flatnonzero((text != "").to_numpy())
+    if len(present) < 2:
+        return labels
+
+    signatures = minhash_signatures(text.iloc[present].tolist(), num_perm=num_perm)
+    left, right = _candidate_pairs(signatures, bands)
+    similarity = (signatures[left] == signatures[right]).mean(axis=1)
+    accepted = similarity >= threshold
+    components = _connected_components(len(present), left[accepted], right[accepted])
+    labels[present] = present[components]
+    return labels
+
+
+def remove_near_duplicates(
+    df: pd.DataFrame,
+    threshold: float = 0.8,
+    columns: Sequence[str] = NEAR_DUPLICATE_COLUMNS,
+    stats: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    """
+    Keep only the first row of each near-duplicate cluster.
+
+    When `stats` is given it is updated in place with cluster statistics for
+    `metrics.json` (see `merge_near_duplicate_stats`).
+    """
+    labels = find_near_duplicate_clusters(df, threshold=threshold, columns=columns)
+    keep = labels == np.arange(len(df))
+    if stats is not None:
+        sizes = np.bincount(labels, minlength=len(df))
+        sizes = sizes[sizes > 1]
+        merge_near_duplicate_stats(
+            stats,
+            {
+                "threshold": threshold,
+                "clusters": int(len(sizes)),
+                "clustered_rows": int(sizes.sum()),
+                "rows_removed": int((~keep).sum()),
+                "largest_cluster": int(sizes.max()) if len(sizes) else 0,
+            },
+        )
+    return df.loc[keep].reset_index(drop=True)
+
+
+def merge_near_duplicate_stats(total: dict[str, Any], part: dict[str, Any]) -> None:
+    """Fold the statistics of one `remove_near_duplicates` call into `total`."""
+    total["threshold"] = part["threshold"]
+    for key in ("clusters", "clustered_rows", "rows_removed"):
+        total[key] = int(total.get(key, 0)) + int(part[key])
+    total["largest_cluster"] = max(int(total.get("largest_cluster", 0)), part["largest_cluster"])
+    clusters = total["clusters"]
+    total["mean_cluster_size"] = round(total["clustered_rows"] / clusters, 6) if clusters else 0.0
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_KEY = b"datalab_parser_fingerprint"
+
+
+class ParseCache:
+    """
+    Lookup tables of text -> parsed values, one per parser `kind`.
+
+    Each table is a DataFrame indexed by the (stripped) input text. With a `path`
+    the tables are loaded from and saved to `<path>/<kind>.parquet`, so runs and API
+    jobs that see the same salary or experience strings parse them only once.
+    Tables written under a different `fingerprint` (i.e. by other parser rules)
+    are ignored.
+    """
+
+    def __init__(self, path: str | Path | None = None, fingerprint: str = "") -> None:
+        self.path = Path(path) if path is not None else None
+        self.fingerprint = fingerprint
+        self._tables: dict[str, pd.DataFrame] = {}
+        self._dirty: set[str] = set()
+
+    def _file(self, kind: str) -> Path:
+        return Path(self.path or ".") / f"{kind}.parquet"
+
+    def _read(self, kind: str) -> pd.DataFrame | None:
+        if self.path is None or not self._file(kind).exists():
+            return None
+        table = pq.read_table(self._file(kind))
+        if (table.schema.metadata or {}).get(FINGERPRINT_KEY) != self.fingerprint.encode():
+            logger.debug("Ignoring parse cache %s built by other parser rules", self._file(kind))
+            return None
+        return table.to_pandas().set_index("text")
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+    def lookup(
+        self,
+        kind: str,
+        texts: np.ndarray,
+        parse: Callable[[pd.Series], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Return parsed rows for distinct `texts`, in order.
+
+        Texts without an entry are parsed in one `parse` call and recorded.
+        """
+        if kind not in self._tables:
+            loaded = self._read(kind)
+            if loaded is not None:
+                self._tables[kind] = loaded
+        table = self._tables.get(kind)
+        missing = texts if table is None else texts[~pd.Index(texts).isin(table.index)]
+        if len(missing):
+            parsed = parse(pd.Series(missing, dtype=object))
+            parsed.index = pd.Index(missing, name="text")
+            table = parsed if table is None else pd.concat([table, parsed])
+            self._tables[kind] = table
+            self._dirty.add(kind)
+        return table.reindex(texts)
+
+    def save(self) -> Path:
+        if self.path is None:
+            raise ValueError("ParseCache has no path to save to.")
+        self.path.mkdir(parents=True, exist_ok=True)
+        for kind in sorted(self._dirty):
+            table = self._tables[kind]
+            # Keep entries another run or job saved since this cache was loaded.
+            on_disk = self._read(kind)
+            if on_disk is not None:
+                table = pd.concat([table, on_disk[~on_disk.index.isin(table.index)]])
+            arrow = pa.Table.from_pandas(table.reset_index(), preserve_index=False)
+            arrow = arrow.replace_schema_metadata(
+                {**(arrow.schema.metadata or {}), FINGERPRINT_KEY: self.fingerprint.encode()}
+            )
+            # Per-process temp names: partition workers may save the same table at once.
+            tmp_path = self._file(kind).with_name(f"{self._file(kind).name}.{os.getpid()}.tmp")
+            pq.write_table(arrow, tmp_path)
+            os.replace(tmp_path, self._file(kind))
+        self._dirty.clear()
+        return self.path
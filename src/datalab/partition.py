@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+import math
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_PARTITION_ROWS = 50_000
+# tmpfs-backed where available, so partition files never touch disk.
+_SHARED_MEMORY_DIR = Path("/dev/shm")
+
+PartitionFunc = Callable[[pd.DataFrame], pd.DataFrame]
+
+
+def _write_ipc(df: pd.DataFrame, path: Path) -> None:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _read_ipc(path: Path) -> pd.DataFrame:
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+def _run_partition(func: PartitionFunc, in_path: Path, out_path: Path) -> None:
+    _write_ipc(func(_read_ipc(in_path)), out_path)
+
+
+def _concat_partitions(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    # A partition whose column is all missing comes back as object (or null-typed)
+    # data; give it the dtype of the other partitions, so the result matches what
+    # a single pass over all rows would produce.
+    for col in frames[0].columns:
+        filled = [frame for frame in frames if frame[col].notna().any()]
+        dtypes = {str(frame[col].dtype) for frame in filled}
+        if len(dtypes) != 1 or len(filled) == len(frames):
+            continue
+        target = filled[0][col].dtype
+        if target == np.dtype(bool):
+            continue
+        if isinstance(target, np.dtype) and target.kind in "iu":
+            # NumPy integers cannot hold missing values; pandas would use float64.
+            target = np.dtype(np.float64)
+        for frame in frames:
+            if frame[col].dtype != target and not frame[col].notna().any():
+                try:
+                    frame[col] = frame[col].astype(target)
+                except (TypeError, ValueError):
+                    pass
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+
+def partition_bounds(rows: int, parts: int) -> list[tuple[int, int]]:
+    """Split `rows` into `parts` contiguous `(start, stop)` ranges of near-equal size."""
+    step = max(math.ceil(rows / max(parts, 1)), 1)
+    return [(start, min(start + step, rows)) for start in range(0, rows, step)]
+
+
+def map_partitions(
+    df: pd.DataFrame,
+    func: PartitionFunc,
+    workers: int,
+    min_partition_rows: int = DEFAULT_MIN_PARTITION_ROWS,
+) -> pd.DataFrame:
+    """
+    Apply a row-local `func` to row ranges of `df` in a process pool.
+
+    Partitions travel to and from the workers as Arrow IPC files in shared memory
+    (`/dev/shm` where available) that are memory-mapped on read, so frames are never
+    pickled; only `func` is, so it must be a module-level function or a `partial`
+    of one. Results are reassembled in row order with the index of `df`. Frames
+    smaller than two partitions of `min_partition_rows`, or with columns Arrow
+    cannot represent, are processed in-process instead.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    parts = min(workers, len(df) // max(min_partition_rows, 1))
+    if parts < 2:
+        return func(df)
+
+    tmp_root = _SHARED_MEMORY_DIR if _SHARED_MEMORY_DIR.is_dir() else None
+    with tempfile.TemporaryDirectory(prefix="datalab-partitions-", dir=tmp_root) as tmp:
+        tmp_dir = Path(tmp)
+        bounds = partition_bounds(len(df), parts)
+        in_paths = [tmp_dir / f"in-{i}.arrow" for i in range(len(bounds))]
+        out_paths = [tmp_dir / f"out-{i}.arrow" for i in range(len(bounds))]
+        try:
+            for (start, stop), path in zip(bounds, in_paths):
+                _write_ipc(df.iloc[start:stop], path)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as exc:
+            logger.debug("Processing %s rows in-process; not Arrow-serializable: %s", len(df), exc)
+            return func(df)
+
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            futures = [
+                pool.submit(_run_partition, func, in_path, out_path)
+                for in_path, out_path in zip(in_paths, out_paths)
+            ]
+            for future in futures:
+                future.result()
+        out = _concat_partitions([_read_ipc(path) for path in out_paths])
+    out.index = df.index
+    logger.debug("Processed %s rows in %s partitions", len(df), len(bounds))
+    return out
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import numpy as np
+
+DEFAULT_SKETCH_K = 200
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch over floats.
+
+    Memory stays below about `3 * k` values however many are added. Quantiles carry a
+    rank error, not a value error: for `k=200` the returned value's rank is
+    typically within about 1% of the requested quantile (`~1.7 / k`). The sketch is
+    exact while it holds fewer than `k` values. NaN values are ignored.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: int | None = 0) -> None:
+        if k < 8:
+            raise ValueError(f"KLLSketch k must be >= 8, got {k}.")
+        self.k = k
+        self.count = 0
+        self._levels: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) < self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+            items = np.sort(items)
+            # Promote every other item of an even-length prefix at double weight,
+            # starting at a random offset so that rank errors cancel out on average.
+            even = len(items) - len(items) % 2
+            promoted = items[int(self._rng.integers(2)) : even : 2]
+            self._levels[level] = items[even:]
+            self._levels[level + 1] = np.concatenate((self._levels[level + 1], promoted))
+            # Adding a level shrinks the capacities below it, so start over.
+            level = 0
+
+    def update(self, values: Iterable[float] | np.ndarray) -> None:
+        array = np.asarray(values, dtype=np.float64).ravel()
+        array = array[~np.isnan(array)]
+        if not len(array):
+            return
+        self.count += len(array)
+        self._levels[0] = np.concatenate((self._levels[0], array))
+        self._compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        """Fold `other` into this sketch; both must use the same `k`."""
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge KLL sketches with k={self.k} and k={other.k}.")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate((self._levels[level], items))
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be in [0, 1], got {q}.")
+        if self.count == 0:
+            return math.nan
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(level_items), 2**level) for level, level_items in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return float(items[order][min(position, len(items) - 1)])
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow.parquet as pq
 from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
 
 
@@ -41,9 +42,22 @@ def _render_missing_rate_table(missing_rate: dict[str, Any]) -> list[str]:
     return _render_markdown_table(["column", "missing_rate"], rows)
 
 
-def build_quality_report(
-    df: pd.DataFrame, topk: int = 5, metrics: dict[str, Any] | None = None
-) -> str:
+def _render_column_details(col: str, series: pd.Series, topk: int) -> list[str]:
+    missing_rate = series.isna().mean() * 100
+    dtype = str(series.dtype)
+    dist = _render_distribution(series, topk=topk)
+    return [
+        f"### `{col}`",
+        f"- dtype: {dtype}",
+        f"- missing_rate: {missing_rate:.2f}%",
+        f"- distribution: {dist}",
+        "",
+    ]
+
+
+def _render_report_header(
+    row_count: int, column_count: int, metrics: dict[str, Any] | None
+) -> list[str]:
     lines: list[str] = [
         "# Data Quality Report",
         "",
@@ -55,8 +69,8 @@ def build_quality_report(
         "## Overview",
     ]
     overview_rows = [
-        ["Rows", len(df)],
-        ["Columns", len(df.columns)],
+        ["Rows", row_count],
+        ["Columns", column_count],
     ]
     lines.extend(_render_markdown_table(["item", "value"], overview_rows))
     lines.append("")
@@ -74,17 +88,33 @@ def build_quality_report(
         lines.append("### Key Column Missing Rate")
         lines.extend(_render_missing_rate_table(metrics.get("missing_rate", {})))
         lines.append("")
+    return lines
+
+
+def build_quality_report(
+    df: pd.DataFrame, topk: int = 5, metrics: dict[str, Any] | None = None
+) -> str:
+    lines = _render_report_header(len(df), len(df.columns), metrics)
     lines.append("## Column Details")
     for col in df.columns:
-        series = df[col]
-        missing_rate = series.isna().mean() * 100
-        dtype = str(series.dtype)
-        dist = _render_distribution(series, topk=topk)
-        lines.append(f"### `{col}`")
-        lines.append(f"- dtype: {dtype}")
-        lines.append(f"- missing_rate: {missing_rate:.2f}%")
-        lines.append(f"- distribution: {dist}")
-        lines.append("")
+        lines.extend(_render_column_details(col, df[col], topk=topk))
+    return "\n".join(lines)
+
+
+def build_quality_report_from_parquet(
+    parquet_path: str | Path, topk: int = 5, metrics: dict[str, Any] | None = None
+) -> str:
+    """
+    Same report as `build_quality_report`, loading one column at a time so that
+    memory stays bounded by the widest column rather than the whole table.
+    """
+    parquet_file = pq.ParquetFile(parquet_path)
+    columns = parquet_file.schema_arrow.names
+    lines = _render_report_header(parquet_file.metadata.num_rows, len(columns), metrics)
+    lines.append("## Column Details")
+    for col in columns:
+        series = parquet_file.read(columns=[col]).to_pandas()[col]
+        lines.extend(_render_column_details(col, series, topk=topk))
     return "\n".join(lines)
 
 
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from datalab.exceptions import DataValidationError
+
+SCHEMA_ARROW_TYPES: dict[str, pa.DataType] = {
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "str": pa.string(),
+    "bool": pa.bool_(),
+    "datetime": pa.timestamp("ns"),
+}
+DEFAULT_MAX_VIOLATIONS = 5
+TRUE_VALUES = ["true", "1", "yes", "y", "t"]
+FALSE_VALUES = ["false", "0", "no", "n", "f"]
+_PANDAS_TYPES = {pa.int64(): pd.Int64Dtype(), pa.bool_(): pd.BooleanDtype()}
+
+
+class SchemaViolationError(DataValidationError):
+    """Raised when values cannot be cast to the configured schema; see `violations`."""
+
+    def __init__(self, violations: dict[str, dict[str, Any]]) -> None:
+        self.violations = violations
+        details = "; ".join(
+            f"{col} -> {info['dtype']}: {info['count']} bad value(s), e.g. "
+            + ", ".join(
+                f"row {row}={value!r}" for row, value in zip(info["rows"], info["values"])
+            )
+            for col, info in violations.items()
+        )
+        super().__init__(f"Type conversion failed for {', '.join(violations)} ({details})")
+
+
+def compile_schema(schema: dict[str, Any]) -> pa.Schema:
+    """Translate a `clean.schema` mapping (`column: int|float|str|bool|datetime`) to Arrow."""
+    fields = []
+    for col, dtype in schema.items():
+        if dtype not in SCHEMA_ARROW_TYPES:
+            raise DataValidationError(f"Unsupported schema dtype for {col}: {dtype}")
+        fields.append(pa.field(col, SCHEMA_ARROW_TYPES[dtype]))
+    return pa.schema(fields)
+
+
+def _to_arrow(series: pd.Series) -> pa.Array:
+    try:
+        return pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns: fall back to their text form.
+        return pa.array(series.astype("string"), from_pandas=True)
+
+
+def _bool_from_text(values: pa.Array) -> pa.Array:
+    normalized = pc.utf8_lower(pc.utf8_trim_whitespace(values.cast(pa.string())))
+    is_true = pc.is_in(normalized, value_set=pa.array(TRUE_VALUES))
+    is_false = pc.is_in(normalized, value_set=pa.array(FALSE_VALUES))
+    # Unrecognized text becomes an invalid marker that fails the final cast.
+    return pc.if_else(is_true, "true", pc.if_else(is_false, "false", normalized))
+
+
+def _source_array(series: pd.Series, target: pa.DataType) -> pa.Array:
+    if pa.types.is_string(target) and not pd.api.types.is_string_dtype(series):
+        # Match pandas' text form of numbers and dates (e.g. 20.0 -> "20.0").
+        return _to_arrow(series.astype("string"))
+    values = _to_arrow(series)
+    if pa.types.is_boolean(target) and not pa.types.is_boolean(values.type):
+        return _bool_from_text(values)
+    if pa.types.is_timestamp(target) and pa.types.is_timestamp(values.type):
+        # Keep the source unit and time zone of columns that already hold datetimes.
+        return values.cast(pa.timestamp("ns", values.type.tz))
+    return values
+
+
+def _pandas_fallback(series: pd.Series, dtype: str) -> tuple[pd.Series, pd.Series]:
+    """Convert one column with pandas parsers; returns the values and a bad-row mask."""
+    if dtype == "datetime":
+        converted = pd.to_datetime(series, errors="coerce", format="mixed")
+    elif dtype in {"int", "float"}:
+        converted = pd.to_numeric(series, errors="coerce")
+    elif dtype == "bool":
+        normalized = series.astype("string").str.strip().str.lower()
+        converted = normalized.map(
+            dict.fromkeys(TRUE_VALUES, True) | dict.fromkeys(FALSE_VALUES, False)
+        ).astype("boolean")
+    else:
+        converted = series.astype("string").astype(object)
+    bad = series.notna() & converted.isna()
+    if dtype == "int":
+        fractional = converted.notna() & (converted % 1 != 0)
+        bad |= fractional
+        converted = converted.mask(fractional).astype("Int64")
+    return converted, bad
+
+
+def _violation(series: pd.Series, bad: pd.Series, dtype: str, limit: int) -> dict[str, Any]:
+    examples = series[bad].head(limit)
+    return {
+        "dtype": dtype,
+        "count": int(bad.sum()),
+        "rows": examples.index.tolist(),
+        "values": [str(value) for value in examples],
+    }
+
+
+def cast_to_schema(
+    df: pd.DataFrame,
+    schema: dict[str, Any],
+    max_violations: int = DEFAULT_MAX_VIOLATIONS,
+) -> pd.DataFrame:
+    """
+    Return the `schema` columns of `df` cast to their configured types.
+
+    All columns go through a single Arrow `Table.cast`. Only if that fails is each
+    column retried on its own, with pandas parsers as a fallback for formats Arrow
+    does not read (e.g. non-ISO dates). Remaining bad values of every column are
+    collected, up to `max_violations` row labels and values per column, and raised
+    together as a `SchemaViolationError`.
+
+    Missing values stay missing in `str` columns (`None`), unlike the earlier
+    `astype(str)` cast, which turned them into the literal text "nan"; non-text
+    values such as numbers become their text form.
+    """
+    target = compile_schema(schema)
+    missing = [col for col in target.names if col not in df.columns]
+    if missing:
+        raise DataValidationError(f"Configured column missing from data: {missing[0]}")
+
+    arrays = [_source_array(df[field.name], field.type) for field in target]
+    target = pa.schema(
+        field.with_type(array.type) if pa.types.is_timestamp(array.type) else field
+        for field, array in zip(target, arrays)
+    )
+    table = pa.Table.from_arrays(arrays, names=target.names)
+    try:
+        return _table_to_frame(table.cast(target), df.index)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        pass
+
+    columns: dict[str, pd.Series] = {}
+    violations: dict[str, dict[str, Any]] = {}
+    for field, array in zip(target, arrays):
+        try:
+            columns[field.name] = _table_to_frame(
+                pa.table({field.name: array.cast(field.type)}), df.index
+            )[field.name]
+            continue
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+        dtype = schema[field.name]
+        converted, bad = _pandas_fallback(df[field.name], dtype)
+        if bad.any():
+            violations[field.name] = _violation(df[field.name], bad, dtype, max_violations)
+        columns[field.name] = converted
+    if violations:
+        raise SchemaViolationError(violations)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _table_to_frame(table: pa.Table, index: pd.Index) -> pd.DataFrame:
+    frame = table.to_pandas(types_mapper=_PANDAS_TYPES.get)
+    frame.index = index
+    return frame
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import deque
+
+_ASCII_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+
+def _boundary_checks(keyword: str) -> tuple[bool, bool]:
+    """Whether the left and right edge of an ASCII keyword need a token boundary."""
+    if not keyword.isascii():
+        return (False, False)
+    return (keyword[0] in _ASCII_WORD_CHARS, keyword[-1] in _ASCII_WORD_CHARS)
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every keyword of a skill dictionary.
+
+    `tags(text)` scans `text` once, however many keywords there are, and returns
+    the sorted tags with at least one matching keyword. Matching is by substring,
+    as `keyword in text` would be. With `token_boundaries=True` the letter/digit
+    edges of ASCII keywords must not touch other ASCII letters, digits or `_`, so
+    "py" no longer fires inside "happy" while "python开发" still matches "python":
+    CJK text has no word separators, so CJK characters count as boundaries and CJK
+    keywords always match by substring.
+    """
+
+    def __init__(self, dictionary: dict[str, list[str]], token_boundaries: bool = False) -> None:
+        self.token_boundaries = token_boundaries
+        self._tag_names = sorted(dictionary)
+        self._goto: list[dict[str, int]] = [{}]
+        # Per node: (keyword length, tag index, check left edge, check right edge).
+        self._outputs: list[list[tuple[int, int, bool, bool]]] = [[]]
+        for tag_index, tag in enumerate(self._tag_names):
+            for keyword in dictionary[tag]:
+                if keyword:
+                    checks = _boundary_checks(keyword) if token_boundaries else (False, False)
+                    self._add(keyword, tag_index, checks)
+        self._link()
+
+    def _add(self, keyword: str, tag_index: int, checks: tuple[bool, bool]) -> None:
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._outputs.append([])
+            node = nxt
+        self._outputs[node].append((len(keyword), tag_index, *checks))
+
+    def _link(self) -> None:
+        # Breadth-first failure links; each node inherits the outputs of its failure
+        # node, so a scan only looks at the node it is in.
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+                queue.append(child)
+
+    @property
+    def tag_names(self) -> list[str]:
+        """All tags in sorted order; `indices` refers to positions in this list."""
+        return list(self._tag_names)
+
+    def tags(self, text: str) -> list[str]:
+        return [self._tag_names[index] for index in self.indices(text)]
+
+    def indices(self, text: str) -> list[int]:
+        """Sorted `tag_names` positions of the tags matching `text`."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found: set[int] = set()
+        node = 0
+        last = len(text) - 1
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, tag_index, check_left, check_right in outputs[node]:
+                start = pos - length + 1
+                if check_left and start > 0 and text[start - 1] in _ASCII_WORD_CHARS:
+                    continue
+                if check_right and pos < last and text[pos + 1] in _ASCII_WORD_CHARS:
+                    continue
+                found.add(tag_index)
+        return sorted(found)
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from datalab.skill_matcher import SkillMatcher
+
+DEFAULT_NUM_BUCKETS = 1 << 20
+DEFAULT_MIN_TITLES = 20
+DEFAULT_TOP_K = 50
+DEFAULT_MAX_WORDS = 2
+DEFAULT_MIN_LIFT = 1.0
+CJK_NGRAM_SIZES = (2, 3, 4)
+RANK_METRICS = ("tfidf", "lift")
+# Candidate buckets kept after the hashed pass, per requested candidate.
+_BUCKETS_PER_CANDIDATE = 4
+# Distinct titles tokenized per step; bounds the per-step term arrays.
+_TOKENIZE_TITLES = 20_000
+
+# ASCII tech tokens keep their inner punctuation: c++, c#, node.js, ci-cd.
+_ASCII_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#._-]*[a-z0-9+#]|[a-z][+#]*")
+_CJK_RUN_RE = re.compile("[\u3400-\u4dbf\u4e00-\u9fff]+")
+_SEGMENT_RE = re.compile(f"{_ASCII_TOKEN_RE.pattern}|{_CJK_RUN_RE.pattern}")
+
+
+def title_terms(title: str, max_words: int = DEFAULT_MAX_WORDS) -> set[str]:
+    """
+    Candidate terms of one title: ASCII word n-grams up to `max_words` words and
+    CJK character n-grams of `CJK_NGRAM_SIZES`.
+
+    CJK text has no word separators, so every 2-4 character window of a CJK run is a
+    candidate. Pure numbers and single letters are dropped.
+    """
+    terms: set[str] = set()
+    words: list[str] = []
+    for segment in _SEGMENT_RE.findall(title.lower()):
+        if segment[0] >= "\u3400":
+            words = []
+            terms.update(_cjk_windows(segment))
+            continue
+        words.append(segment)
+        if len(segment) > 1 and not segment.isdigit():
+            terms.add(segment)
+        for size in range(2, min(max_words, len(words)) + 1):
+            terms.add(" ".join(words[-size:]))
+    return terms
+
+
+@lru_cache(maxsize=1 << 16)
+def _cjk_windows(run: str) -> tuple[str, ...]:
+    # CJK runs repeat across titles far more often than whole titles do.
+    return tuple(
+        run[i : i + size] for size in CJK_NGRAM_SIZES for i in range(len(run) - size + 1)
+    )
+
+
+def _term_hashes(terms: np.ndarray) -> np.ndarray:
+    return pd.util.hash_array(terms, categorize=False)
+
+
+class _TermCounts:
+    """Per-term title counts, overall and among titles the dictionary does not tag."""
+
+    def __init__(self, num_buckets: int | None = None) -> None:
+        self.num_buckets = num_buckets
+        self.titles = 0
+        self.uncovered = 0
+        if num_buckets is None:
+            self.exact: dict[str, list[int]] = {}
+        else:
+            self.total = np.zeros(num_buckets, dtype=np.int64)
+            self.missed = np.zeros(num_buckets, dtype=np.int64)
+
+    def add(self, terms: np.ndarray, weights: np.ndarray, missed: np.ndarray) -> None:
+        if self.num_buckets is not None:
+            buckets = (_term_hashes(terms) % np.uint64(self.num_buckets)).astype(np.int64)
+            self.total += np.bincount(buckets, weights=weights, minlength=self.num_buckets).astype(
+                np.int64
+            )
+            self.missed += np.bincount(
+                buckets, weights=weights * missed, minlength=self.num_buckets
+            ).astype(np.int64)
+            return
+        for term, weight, is_missed in zip(terms, weights, missed):
+            counts = self.exact.setdefault(term, [0, 0])
+            counts[0] += int(weight)
+            counts[1] += int(weight) * int(is_missed)
+
+
+def _score(
+    titles: np.ndarray, missed: np.ndarray, total_titles: int, uncovered_titles: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Uncovered-title TF-IDF and lift of terms from their title counts."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        idf = np.log(total_titles / titles)
+        tfidf = np.where(titles > 0, missed * idf, 0.0)
+        lift = np.where(
+            (titles > 0) & (uncovered_titles > 0),
+            (missed / max(uncovered_titles, 1)) / (titles / max(total_titles, 1)),
+            0.0,
+        )
+    return tfidf, lift
+
+
+def _chunk_terms(
+    titles: pd.Series,
+    matcher: SkillMatcher,
+    max_words: int,
+    keep: np.ndarray | None = None,
+    num_buckets: int | None = None,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, int, int]]:
+    """
+    Terms of one batch of titles with their title counts and an uncovered flag.
+
+    Each distinct title is tokenized once and weighted by how often it occurs;
+    distinct titles are tokenized `_TOKENIZE_TITLES` at a time, so the term arrays
+    stay small however large the batch is. With `keep`, only terms in those hash
+    buckets are returned.
+    """
+    text = titles.dropna().astype(str).str.strip()
+    counts = text[text != ""].value_counts(sort=False)
+    for start in range(0, len(counts), _TOKENIZE_TITLES):
+        part = counts.iloc[start : start + _TOKENIZE_TITLES]
+        terms: list[str] = []
+        weights: list[int] = []
+        missed: list[bool] = []
+        uncovered = 0
+        for title, count in part.items():
+            is_missed = not matcher.indices(title.lower())
+            uncovered += int(count) * is_missed
+            found = title_terms(title, max_words)
+            terms.extend(found)
+            weights.extend([int(count)] * len(found))
+            missed.extend([is_missed] * len(found))
+        term_array = np.asarray(terms, dtype=object)
+        weight_array = np.asarray(weights, dtype=np.float64)
+        missed_array = np.asarray(missed, dtype=bool)
+        if keep is not None and num_buckets is not None and len(term_array):
+            buckets = (_term_hashes(term_array) % np.uint64(num_buckets)).astype(np.int64)
+            mask = np.isin(buckets, keep)
+            term_array, weight_array, missed_array = (
+                term_array[mask],
+                weight_array[mask],
+                missed_array[mask],
+            )
+        yield term_array, weight_array, missed_array, int(part.sum()), uncovered
+
+
+def mine_skill_terms(
+    batches: Callable[[], Iterable[pd.Series]],
+    matcher: SkillMatcher,
+    top_k: int = DEFAULT_TOP_K,
+    min_titles: int = DEFAULT_MIN_TITLES,
+    max_words: int = DEFAULT_MAX_WORDS,
+    rank_by: str = "tfidf",
+    num_buckets: int = DEFAULT_NUM_BUCKETS,
+    min_lift: float = DEFAULT_MIN_LIFT,
+    stats: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    """
+    Rank title terms the skill dictionary of `matcher` does not cover yet.
+
+    `batches` is a zero-argument callable returning a fresh iterable of title
+    Series, since titles are read twice. The first pass accumulates title counts per
+    term into `num_buckets` hashed counters, so memory does not grow with the
+    vocabulary; the second pass counts exact terms only for the best-scoring
+    buckets. Terms are ranked by `rank_by`:
+
+    - `tfidf`: titles containing the term that the dictionary tags with nothing,
+      times the term's IDF over all titles;
+    - `lift`: the term's share among untagged titles over its share among all
+      titles, so terms concentrated where the dictionary misses score high.
+
+    Terms with a lift of at most `min_lift` are dropped: generic words such as
+    "engineer" are about as common in tagged titles as in untagged ones. So is a
+    term that only occurs inside a longer candidate. Returns `term`, `n_titles`,
+    `n_uncovered`, `lift` and `tfidf` for at most `top_k` terms seen in at least
+    `min_titles` titles. `stats` is updated in place with the
+    number of titles scanned and of titles the dictionary left untagged.
+    """
+    if rank_by not in RANK_METRICS:
+        raise ValueError(f"rank_by must be one of {list(RANK_METRICS)}, got {rank_by!r}")
+    hashed = _TermCounts(num_buckets)
+    for titles in batches():
+        for terms, weights, missed, total, uncovered in _chunk_terms(titles, matcher, max_words):
+            hashed.add(terms, weights, missed)
+            hashed.titles += total
+            hashed.uncovered += uncovered
+
+    tfidf, lift = _score(hashed.total, hashed.missed, hashed.titles, hashed.uncovered)
+    bucket_score = np.where(hashed.total >= min_titles, tfidf if rank_by == "tfidf" else lift, 0.0)
+    ranked = np.argsort(-bucket_score, kind="stable")[: top_k * _BUCKETS_PER_CANDIDATE]
+    # A crowded bucket can score zero (its IDF bottoms out) while holding a good term;
+    # any bucket with untagged titles stays eligible for the exact pass.
+    keep = ranked[hashed.missed[ranked] > 0]
+    if stats is not None:
+        stats.update({"titles": hashed.titles, "uncovered_titles": hashed.uncovered})
+
+    exact = _TermCounts()
+    if len(keep):
+        for titles in batches():
+            for terms, weights, missed, _, _ in _chunk_terms(
+                titles, matcher, max_words, keep=keep, num_buckets=num_buckets
+            ):
+                exact.add(terms, weights, missed)
+
+    columns = ["term", "n_titles", "n_uncovered", "lift", "tfidf"]
+    if not exact.exact:
+        return pd.DataFrame(columns=columns)
+    out = pd.DataFrame(
+        [(term, total, missed) for term, (total, missed) in exact.exact.items()],
+        columns=["term", "n_titles", "n_uncovered"],
+    )
+    # A term the dictionary already tags only occurs in tagged titles, so it scores
+    # zero anyway; it is dropped here rather than looked up for every term in pass one.
+    out = out[out["n_titles"] >= min_titles]
+    out = out[[not matcher.indices(term) for term in out["term"]]]
+    tfidf, lift = _score(
+        out["n_titles"].to_numpy(), out["n_uncovered"].to_numpy(), hashed.titles, hashed.uncovered
+    )
+    out = out.assign(lift=np.round(lift, 4), tfidf=np.round(tfidf, 4))
+    out = out[(out["lift"] > min_lift) & (out[rank_by] > 0)]
+    out = _prune_candidates(out)
+    out = out.sort_values([rank_by, "term"], ascending=[False, True])
+    return out.head(top_k).reset_index(drop=True)[columns]
+
+
+def _contains(longer: str, term: str) -> bool:
+    if term.isascii():
+        return f" {term} " in f" {longer} "
+    return term in longer
+
+
+def _prune_candidates(candidates: pd.DataFrame) -> pd.DataFrame:
+    terms = candidates["term"].tolist()
+    counts = candidates["n_titles"].tolist()
+    vocabulary = set(terms)
+    # An ASCII phrase with a word that is not a candidate itself ("c++ engineer") is a
+    # candidate plus a generic word, so only its candidate words are kept.
+    generic = [
+        term.isascii() and " " in term and any(word not in vocabulary for word in term.split())
+        for term in terms
+    ]
+    # A term found in exactly as many titles as a longer candidate containing it only
+    # ever occurs inside that candidate ("boot" in "spring boot", or a CJK window of a
+    # longer word), so the longer one is kept.
+    by_count: dict[int, list[str]] = {}
+    for term, count, skip in zip(terms, counts, generic):
+        if not skip:
+            by_count.setdefault(count, []).append(term)
+    enclosed = [
+        any(len(other) > len(term) and _contains(other, term) for other in by_count.get(count, []))
+        for term, count in zip(terms, counts)
+    ]
+    return candidates[~(np.asarray(generic, dtype=bool) | np.asarray(enclosed, dtype=bool))]
+
+
+def write_skill_candidates(
+    candidates: pd.DataFrame,
+    output_path: str | Path,
+    stats: dict[str, Any] | None = None,
+) -> Path:
+    """
+    Write candidates as a `skill_dictionary` YAML mapping (`term: [term]`).
+
+    Each entry carries its statistics as a trailing comment, so the file can be
+    reviewed, trimmed and merged into `clean.skill_dictionary`.
+    """
+    out_path = Path(output_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    lines = ["# Candidate skill terms mined from job titles; review before use."]
+    if stats:
+        lines.append(
+            f"# titles scanned: {stats['titles']}, "
+            f"not tagged by the current dictionary: {stats['uncovered_titles']}"
+        )
+    lines.append("skill_dictionary:" if len(candidates) else "skill_dictionary: {}")
+    for row in candidates.itertuples(index=False):
+        # JSON strings are valid YAML scalars and quote terms such as "c++" safely.
+        term = json.dumps(row.term, ensure_ascii=False)
+        lines.append(
+            f"  {term}: [{term}]  # titles={row.n_titles} uncovered={row.n_uncovered} "
+            f"lift={row.lift:.2f} tfidf={row.tfidf:.1f}"
+        )
+    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return out_path
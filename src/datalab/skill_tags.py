@@ -1,9 +1,42 @@
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_string_dtype
 
+from datalab.config import ConfigValidationError, resolve_section_config
+from datalab.io import DEFAULT_BATCH_SIZE, iter_input_data
+from datalab.logging_utils import setup_logging
+from datalab.memory import working_copy
+from datalab.skill_matcher import SkillMatcher
+from datalab.skill_mining import (
+    DEFAULT_MAX_WORDS,
+    DEFAULT_MIN_LIFT,
+    DEFAULT_MIN_TITLES,
+    DEFAULT_NUM_BUCKETS,
+    DEFAULT_TOP_K,
+    RANK_METRICS,
+    mine_skill_terms,
+    write_skill_candidates,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_SKILL_BITS = 64
+SKILL_BITS_FILENAME = "skill_bits.json"
+SKILL_LONG_TABLE_FILENAME = "skill_tags_long.parquet"
+MATCHER_CACHE_SIZE = 8
+SKILL_TEXT_COLUMNS = ("title", "salary_text", "exp_text", "edu_text")
+SKILL_COLUMNS = ("skill_tags", "skill_tag_count", "skill_mask")
 DEFAULT_SKILL_DICTIONARY: dict[str, list[str]] = {
     "python": ["python", "py"],
     "sql": ["sql", "mysql", "postgres", "postgresql"],
@@ -35,22 +68,305 @@ def _normalize_dictionary(skill_dictionary: dict[str, Iterable[str]] | None) ->
     return normalized or DEFAULT_SKILL_DICTIONARY
 
 
+# (dictionary content hash, token_boundaries) -> compiled matcher, least recent first.
+_MATCHER_CACHE: OrderedDict[tuple[str, bool], SkillMatcher] = OrderedDict()
+_MATCHER_LOCK = threading.Lock()
+
+
+def skill_dictionary_hash(skill_dictionary: dict[str, Iterable[str]] | None = None) -> str:
+    """Content hash of the normalized dictionary; equal for equivalent spellings."""
+    normalized = _normalize_dictionary(skill_dictionary)
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def compiled_skill_matcher(
+    skill_dictionary: dict[str, Iterable[str]] | None = None,
+    token_boundaries: bool = False,
+) -> SkillMatcher:
+    """
+    Process-wide `SkillMatcher` for a dictionary, compiled once per content hash.
+
+    Jobs and batches that pass an unchanged dictionary reuse the automaton; an edited
+    dictionary hashes differently and is compiled on first use. The last
+    `MATCHER_CACHE_SIZE` dictionaries are kept.
+    """
+    normalized = _normalize_dictionary(skill_dictionary)
+    key = (skill_dictionary_hash(normalized), token_boundaries)
+    with _MATCHER_LOCK:
+        matcher = _MATCHER_CACHE.get(key)
+        if matcher is not None:
+            _MATCHER_CACHE.move_to_end(key)
+            return matcher
+    matcher = SkillMatcher(normalized, token_boundaries)
+    with _MATCHER_LOCK:
+        matcher = _MATCHER_CACHE.setdefault(key, matcher)
+        _MATCHER_CACHE.move_to_end(key)
+        while len(_MATCHER_CACHE) > MATCHER_CACHE_SIZE:
+            _MATCHER_CACHE.popitem(last=False)
+    return matcher
+
+
+def _column_text(df: pd.DataFrame, col: str) -> pd.Series:
+    """Vectorized `_to_text` over one column; absent columns give empty strings."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    series = df[col]
+    if not is_string_dtype(series):
+        return series.map(_to_text).astype(object)
+    return series.astype("string").str.strip().str.lower().fillna("").astype(object)
+
+
+def skill_bit_tags(skill_dictionary: dict[str, Iterable[str]] | None = None) -> list[str]:
+    """
+    Tags in `skill_mask` bit order: bit `i` is set when tag `i` matched.
+
+    Empty when the dictionary has more than 64 tags, which do not fit one mask.
+    """
+    tags = sorted(_normalize_dictionary(skill_dictionary))
+    return tags if len(tags) <= MAX_SKILL_BITS else []
+
+
 def extract_skill_tags(
     df: pd.DataFrame,
     skill_dictionary: dict[str, Iterable[str]] | None = None,
-    text_columns: tuple[str, ...] = ("title", "salary_text", "exp_text", "edu_text"),
+    text_columns: tuple[str, ...] = SKILL_TEXT_COLUMNS,
+    token_boundaries: bool = False,
 ) -> pd.DataFrame:
-    out = df.copy()
-    dictionary = _normalize_dictionary(skill_dictionary)
-
-    def _tag_row(row: pd.Series) -> str:
-        text = " ".join(_to_text(row.get(col, "")) for col in text_columns)
-        matched: list[str] = []
-        for tag, keywords in dictionary.items():
-            if any(keyword in text for keyword in keywords):
-                matched.append(tag)
-        return "|".join(sorted(set(matched)))
-
-    out["skill_tags"] = out.apply(_tag_row, axis=1)
-    out["skill_tag_count"] = out["skill_tags"].apply(lambda x: 0 if not x else len(x.split("|")))
+    """
+    Tag each row with the skills whose keywords occur in its `text_columns`.
+
+    Distinct row texts are scanned once each by the cached `compiled_skill_matcher`
+    of the dictionary; see `SkillMatcher` for the `token_boundaries` rules. Besides
+    the `"|"`-joined `skill_tags` and `skill_tag_count`, rows get a uint64
+    `skill_mask` with one bit per tag in `skill_bit_tags` order, unless the
+    dictionary has more than 64 tags.
+    """
+    out = working_copy(df)
+    matcher = compiled_skill_matcher(skill_dictionary, token_boundaries)
+    names = matcher.tag_names
+
+    text = _column_text(out, text_columns[0]) if text_columns else pd.Series("", index=out.index)
+    for col in text_columns[1:]:
+        text = text + " " + _column_text(out, col)
+    codes, uniques = pd.factorize(text)
+    matches = [matcher.indices(unique) for unique in uniques]
+    tags = np.asarray(["|".join(names[i] for i in found) for found in matches], dtype=object)
+    counts = np.asarray([len(found) for found in matches], dtype=np.int64)
+    out["skill_tags"] = pd.Series(tags[codes], index=out.index, dtype=object)
+    out["skill_tag_count"] = pd.Series(counts[codes], index=out.index)
+    if len(names) <= MAX_SKILL_BITS:
+        masks = np.asarray([sum(1 << i for i in found) for found in matches], dtype=np.uint64)
+        out["skill_mask"] = pd.Series(masks[codes], index=out.index)
     return out
+
+
+def _mask_bits(df: pd.DataFrame, tags: list[str]) -> list[np.ndarray] | None:
+    if not tags or "skill_mask" not in df.columns:
+        return None
+    mask = df["skill_mask"].to_numpy(dtype=np.uint64)
+    return [(mask >> np.uint64(bit)) & np.uint64(1) == 1 for bit in range(len(tags))]
+
+
+def _exploded_tags(df: pd.DataFrame) -> pd.Series:
+    tags = df["skill_tags"].astype("string").fillna("").str.split("|").explode()
+    return tags[tags.str.len() > 0].astype(object)
+
+
+def skill_long_table(
+    df: pd.DataFrame, tags: list[str] | None = None, row_offset: int = 0
+) -> pd.DataFrame:
+    """
+    One `(row_id, tag)` row per matched skill; `row_id` is the row position plus
+    `row_offset`.
+
+    Built from the `skill_mask` bits when `tags` (see `skill_bit_tags`) are given,
+    otherwise from the `skill_tags` strings.
+    """
+    bits = _mask_bits(df, tags or [])
+    if bits is not None:
+        rows = [np.flatnonzero(hit) for hit in bits]
+        row_ids = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        codes = np.repeat(np.arange(len(rows)), [len(r) for r in rows])
+        categories = list(tags or [])
+    else:
+        exploded = _exploded_tags(df.reset_index(drop=True))
+        row_ids = exploded.index.to_numpy(dtype=np.int64)
+        codes, categories = pd.factorize(exploded, sort=True)
+    order = np.lexsort((codes, row_ids))
+    return pd.DataFrame(
+        {
+            "row_id": row_ids[order].astype(np.int64) + row_offset,
+            "tag": pd.Categorical.from_codes(codes[order], categories=list(categories)),
+        }
+    )
+
+
+def skill_counts(df: pd.DataFrame, by: list[str], tags: list[str] | None = None) -> pd.DataFrame:
+    """
+    Count rows per `by` group and skill, as `[*by, "skill_tag", "n_jobs"]`, most
+    frequent first.
+
+    With `tags` (the `skill_bit_tags` of the run) counts come from `skill_mask` bits
+    with integer ops; otherwise `skill_tags` strings are split.
+    """
+    bits = _mask_bits(df, tags or [])
+    if bits is not None:
+        grouped = df.groupby(by, dropna=False, observed=True, sort=True)
+        group_ids = grouped.ngroup().to_numpy()
+        keys = grouped.size().index.to_frame(index=False)
+        per_tag = np.stack(
+            [np.bincount(group_ids[hit], minlength=len(keys)) for hit in bits], axis=1
+        )
+        group_pos, tag_pos = np.nonzero(per_tag)
+        counts = keys.iloc[group_pos].reset_index(drop=True)
+        counts["skill_tag"] = np.asarray(tags, dtype=object)[tag_pos]
+        counts["n_jobs"] = per_tag[group_pos, tag_pos].astype(np.int64)
+    else:
+        exploded = _exploded_tags(df).rename("skill_tag")
+        skill = df.loc[exploded.index, by].assign(skill_tag=exploded)
+        counts = (
+            skill.groupby([*by, "skill_tag"], dropna=False, observed=True)
+            .size()
+            .reset_index(name="n_jobs")
+        )
+    counts = counts.sort_values([*by, "skill_tag"]).reset_index(drop=True)
+    return counts.sort_values("n_jobs", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def write_skill_bits(tags: list[str], output_dir: str | Path) -> Path:
+    """Persist the `skill_mask` tag -> bit map next to `cleaned.parquet`."""
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / SKILL_BITS_FILENAME
+    payload = {"tags": tags}
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load_skill_bits(output_dir: str | Path) -> list[str] | None:
+    path = Path(output_dir) / SKILL_BITS_FILENAME
+    if not path.exists():
+        return None
+    tags = json.loads(path.read_text(encoding="utf-8")).get("tags")
+    return [str(tag) for tag in tags] if isinstance(tags, list) and tags else None
+
+
+def mine_skill_candidates(
+    input_path: str | Path,
+    output_path: str | Path,
+    skill_dictionary: dict[str, Iterable[str]] | None = None,
+    token_boundaries: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    top_k: int = DEFAULT_TOP_K,
+    min_titles: int = DEFAULT_MIN_TITLES,
+    max_words: int = DEFAULT_MAX_WORDS,
+    rank_by: str = "tfidf",
+    num_buckets: int = DEFAULT_NUM_BUCKETS,
+    min_lift: float = DEFAULT_MIN_LIFT,
+) -> pd.DataFrame:
+    """
+    Mine candidate skill terms from the `title` column of `input_path` and write them
+    as a `skill_dictionary` YAML file; see `mine_skill_terms` for the ranking.
+
+    Titles are streamed in batches of `batch_size`, twice, so memory stays bounded
+    by the batch size and the hashed counters whatever the number of titles.
+    """
+    matcher = compiled_skill_matcher(skill_dictionary, token_boundaries)
+
+    def batches():
+        for frame in iter_input_data(input_path, batch_size=batch_size, columns=["title"]):
+            if "title" in frame.columns:
+                yield frame["title"]
+
+    stats: dict[str, object] = {}
+    candidates = mine_skill_terms(
+        batches,
+        matcher,
+        top_k=top_k,
+        min_titles=min_titles,
+        max_words=max_words,
+        rank_by=rank_by,
+        num_buckets=num_buckets,
+        min_lift=min_lift,
+        stats=stats,
+    )
+    path = write_skill_candidates(candidates, output_path, stats=stats)
+    logger.info(
+        "Wrote %s skill candidates from %s titles: %s", len(candidates), stats.get("titles"), path
+    )
+    return candidates
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Skill dictionary tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    mine = subparsers.add_parser(
+        "mine", help="Rank title n-grams the skill dictionary does not cover yet."
+    )
+    mine.add_argument("--input", required=True, help="cleaned.parquet (or any input) with titles.")
+    mine.add_argument("--output", required=True, help="Candidate skill_dictionary YAML path.")
+    mine.add_argument("--config", required=False, help="App config YAML with the dictionary.")
+    mine.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    mine.add_argument(
+        "--min-titles",
+        type=int,
+        default=DEFAULT_MIN_TITLES,
+        help="Ignore terms found in fewer titles.",
+    )
+    mine.add_argument(
+        "--max-words", type=int, default=DEFAULT_MAX_WORDS, help="Longest ASCII word n-gram."
+    )
+    mine.add_argument("--rank-by", choices=RANK_METRICS, default="tfidf")
+    mine.add_argument(
+        "--min-lift",
+        type=float,
+        default=DEFAULT_MIN_LIFT,
+        help="Drop terms no more common among untagged titles than among all titles.",
+    )
+    mine.add_argument(
+        "--buckets",
+        type=int,
+        default=DEFAULT_NUM_BUCKETS,
+        help="Hashed term counters of the first pass; bounds memory.",
+    )
+    mine.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    mine.add_argument("--skill-token-boundaries", action="store_true", default=None)
+    mine.add_argument(
+        "--log-level", default=None, choices=["DEBUG", "INFO", "WARNING", "ERROR"]
+    )
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    try:
+        resolved = resolve_section_config(
+            "clean",
+            app_config_path=args.config,
+            cli_values={
+                "skill_token_boundaries": args.skill_token_boundaries,
+                "log_level": args.log_level,
+            },
+        )
+    except ConfigValidationError as exc:
+        raise SystemExit(f"Configuration error: {exc}") from exc
+    setup_logging(str(resolved.get("log_level", "INFO")))
+    skill_dictionary = resolved.get("skill_dictionary")
+    mine_skill_candidates(
+        args.input,
+        args.output,
+        skill_dictionary=skill_dictionary if isinstance(skill_dictionary, dict) else None,
+        token_boundaries=bool(resolved.get("skill_token_boundaries", False)),
+        batch_size=args.batch_size,
+        top_k=args.top_k,
+        min_titles=args.min_titles,
+        max_words=args.max_words,
+        rank_by=args.rank_by,
+        num_buckets=args.buckets,
+        min_lift=args.min_lift,
+    )
+
+
+if __name__ == "__main__":
+    main()
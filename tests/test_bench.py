@@ -0,0 +1,49 @@
+from datalab.bench.corpus import synthetic_jobs_frame, synthetic_parser_texts
+from datalab.bench.memory import profile_clean_stages, render_memory_table
+from datalab.bench.parsers import compare_to_baseline, render_parser_table, run_parser_benchmark
+
+
+def test_synthetic_jobs_frame_is_deterministic():
+    first = synthetic_jobs_frame(50, seed=3)
+    second = synthetic_jobs_frame(50, seed=3)
+    assert first.equals(second)
+    assert {"url", "title", "salary_text", "exp_text", "edu_text"}.issubset(first.columns)
+
+
+def test_profile_clean_stages_records_every_stage():
+    copy_run = profile_clean_stages(200, copy_on_write=False)
+    cow_run = profile_clean_stages(200, copy_on_write=True)
+
+    stages = [s["stage"] for s in copy_run["stages"]]
+    assert stages[0] == "normalize_missing_values"
+    assert stages[-1] == "encode_categoricals"
+    assert copy_run["rows_cleaned"] == cow_run["rows_cleaned"]
+    assert all(s["peak_traced_mb"] >= 0 for s in cow_run["stages"])
+
+    table = render_memory_table({"modes": {"copy": copy_run, "copy_on_write": cow_run}})
+    assert "| extract_jd_features |" in table
+
+
+def test_synthetic_parser_texts_are_deterministic_and_repeat():
+    first = synthetic_parser_texts(500, distinct=40, seed=3)
+    assert first.equals(synthetic_parser_texts(500, distinct=40, seed=3))
+    assert first["salary_text"].nunique() <= 40
+    assert first["salary_text"].str.contains("万|千|k|K|薪|面议|以上|以下").any()
+
+
+def test_parser_benchmark_reports_every_path_and_flags_regressions():
+    results = run_parser_benchmark(300, distinct=30, repeat=1)
+    assert set(results["parsers"]) == {"salary", "experience", "education"}
+    for entry in results["parsers"].values():
+        assert set(entry["paths"]) == {"scalar", "vectorized", "memoized"}
+        assert all(timing["rows_per_sec"] > 0 for timing in entry["paths"].values())
+
+    assert compare_to_baseline(results, results) == []
+    faster = {
+        "parsers": {
+            "salary": {"paths": {"memoized": {"rows_per_sec": 1e12}}},
+        }
+    }
+    regressions = compare_to_baseline(results, faster, max_regression=0.2)
+    assert [(r["parser"], r["path"]) for r in regressions] == [("salary", "memoized")]
+    assert "| salary | memoized |" in render_parser_table(results, faster)
@@ -1,8 +1,17 @@
 import pandas as pd
 import pytest
 
-from datalab.cleaning import clean_dataframe
+import datalab.cleaning as cleaning
+from datalab.cleaning import (
+    apply_schema,
+    clean_dataframe,
+    impute_grouped,
+    infer_column_types,
+    infer_object_types,
+    normalize_missing_values,
+)
 from datalab.exceptions import DataValidationError
+from datalab.schema import SchemaViolationError
 
 
 def test_missing_value_fill_numeric_and_categorical():
@@ -42,3 +51,169 @@ def test_infer_datetime_and_fill():
     out = clean_dataframe(df)
     assert str(out["ts"].dtype).startswith("datetime64")
     assert out["ts"].isna().sum() == 0
+
+
+def test_copy_on_write_mode_matches_and_leaves_input_untouched():
+    df = pd.DataFrame(
+        {
+            "url": ["u1", "u1", None],
+            "title": ["Python Dev", "Python Dev", "SQL"],
+            "salary_text": ["10-20K", "10-20K", None],
+            "x": [1.0, None, 1000.0],
+        }
+    )
+    snapshot = df.copy()
+    default = clean_dataframe(df)
+    fused = clean_dataframe(df, copy_on_write=True)
+    pd.testing.assert_frame_equal(default, fused)
+    pd.testing.assert_frame_equal(df, snapshot)
+
+
+def test_inferred_types_are_sampled_cached_and_reinferred_when_stale():
+    df = pd.DataFrame(
+        {
+            "published": ["2024-01-%02d" % (i % 28 + 1) for i in range(200)],
+            "amount": [str(i) for i in range(200)],
+            "label": ["x"] * 200,
+        }
+    )
+    inferred = infer_column_types(df, sample_size=20)
+    assert inferred == {
+        "published": {"type": "datetime", "format": "%Y-%m-%d"},
+        "amount": {"type": "numeric"},
+    }
+
+    cache = dict(inferred)
+    out = infer_object_types(df, inferred_types=cache)
+    assert pd.api.types.is_datetime64_any_dtype(out["published"])
+    assert pd.api.types.is_numeric_dtype(out["amount"])
+
+    # A column whose values no longer fit the cached decision is inferred again.
+    later = pd.DataFrame({"amount": ["n/a", "none", "abc"], "published": ["2024-02-01"] * 3})
+    out = infer_object_types(later, inferred_types=cache)
+    assert cache["amount"] == {"type": "text"}
+    assert not pd.api.types.is_numeric_dtype(out["amount"])
+    assert pd.api.types.is_datetime64_any_dtype(out["published"])
+
+
+def test_free_text_decisions_are_cached_and_not_reinferred(monkeypatch: pytest.MonkeyPatch):
+    df = pd.DataFrame({"label": ["free text %d" % i for i in range(50)], "empty": [None] * 50})
+    cache: dict = {}
+    infer_object_types(df, inferred_types=cache)
+    assert cache == {"label": {"type": "text"}}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached text column was inferred again")
+
+    monkeypatch.setattr(cleaning, "_infer_column_type", fail)
+    out = infer_object_types(df.drop(columns=["empty"]), inferred_types=cache)
+    assert out["label"].tolist() == df["label"].tolist()
+
+
+def test_near_duplicate_stage_collapses_reposts_and_reports_clusters():
+    df = pd.DataFrame(
+        {
+            "url": ["u1", "u1?utm=x", "u2", "u3", "u4"],
+            "title": [
+                "Senior Python Engineer",
+                "senior  python engineer",
+                "Java Developer",
+                "Senior Python Engineers",
+                None,
+            ],
+            "company": ["ACME", "acme", "Foo", "ACME", None],
+            "city": ["Shenzhen"] * 5,
+        }
+    )
+    stats: dict = {}
+    out = clean_dataframe(df, near_duplicate_threshold=0.8, near_duplicate_stats=stats)
+    assert out["url"].tolist() == ["u1", "u2", "u4"]
+    assert stats["clusters"] == 1
+    assert stats["rows_removed"] == 2
+    assert stats["largest_cluster"] == 3
+
+    assert len(clean_dataframe(df)) == 5
+
+
+def test_impute_grouped_uses_group_medians_with_fallback_rule():
+    df = pd.DataFrame(
+        {
+            "city": ["SZ", "SZ", "SZ", "BJ", "BJ", "BJ", "SH"],
+            "exp_min_years": [1, 1, 6, 1, 1, 1, 2],
+            "salary_min_k": [10.0, None, 40.0, 20.0, 22.0, None, None],
+        }
+    )
+    rules = [
+        {
+            "columns": ["salary_min_k"],
+            "by": ["city", {"column": "exp_min_years", "bins": [0, 3, 99]}],
+        },
+        {"columns": ["salary_min_k"], "by": ["city"], "min_count": 2},
+    ]
+    out = impute_grouped(df, rules)
+    assert out["salary_min_k"].tolist()[:6] == [10.0, 10.0, 40.0, 20.0, 22.0, 21.0]
+    # SH has no observed salary in any group, so it stays missing.
+    assert pd.isna(out["salary_min_k"].iloc[6])
+
+
+def test_grouped_rules_fill_raw_numeric_columns_before_global_fill():
+    df = pd.DataFrame(
+        {
+            "url": [f"u{i}" for i in range(7)],
+            "city": ["SZ", "SZ", "BJ", "BJ", "SH", "SH", "GZ"],
+            "score": [1.0, None, 100.0, None, None, None, 49.0],
+        }
+    )
+    rules = [{"columns": ["score"], "by": ["city"]}]
+    out = clean_dataframe(df, imputation=rules)
+    by_url = out.set_index("url")["score"]
+    assert by_url[["u1", "u3"]].tolist() == [1.0, 100.0]
+    # SH has no observed score, so the global median is the fallback.
+    assert by_url[["u4", "u5"]].tolist() == [49.0, 49.0]
+
+
+def test_apply_schema_str_keeps_missing_values_null():
+    df = pd.DataFrame({"code": [1.5, None, 3.0], "label": ["a", None, "c"]})
+    out = apply_schema(df, {"code": "str", "label": "str"})
+    assert out["code"].tolist() == ["1.5", None, "3.0"]
+    assert out["label"].tolist() == ["a", None, "c"]
+    assert "nan" not in out["code"].tolist()
+
+
+def test_apply_schema_casts_in_one_pass_and_reports_violations():
+    df = pd.DataFrame(
+        {
+            "id": ["1", "2", None],
+            "flag": ["Yes", "n", None],
+            "posted": ["2024-01-02", "03/04/2024", None],
+        }
+    )
+    out = apply_schema(df, {"id": "int", "flag": "bool", "posted": "datetime"})
+    assert str(out["id"].dtype) == "Int64"
+    assert out["flag"].tolist()[:2] == [True, False]
+    assert out["posted"].iloc[1] == pd.Timestamp("2024-03-04")
+
+    bad = pd.DataFrame({"id": ["A", "2", "x", "3.5"], "flag": ["yes", "maybe", "no", None]})
+    with pytest.raises(SchemaViolationError) as excinfo:
+        apply_schema(bad, {"id": "int", "flag": "bool"}, max_violations=2)
+    assert excinfo.value.violations == {
+        "id": {"dtype": "int", "count": 3, "rows": [0, 2], "values": ["A", "x"]},
+        "flag": {"dtype": "bool", "count": 1, "rows": [1], "values": ["maybe"]},
+    }
+
+
+def test_normalize_missing_values_strips_sentinels_and_counts_them():
+    df = pd.DataFrame(
+        {
+            "city": ["SZ", "  null ", "N/A", None],
+            "mixed": ["NA ", 3, "x", None],
+            "amount": [1.0, 2.0, None, 4.0],
+        }
+    )
+    counts: dict[str, int] = {}
+    out = normalize_missing_values(df, counts)
+    assert out["city"].isna().tolist() == [False, True, True, True]
+    assert out["mixed"].isna().tolist() == [True, False, False, True]
+    assert out["amount"].equals(df["amount"])
+    assert counts == {"city": 2, "mixed": 1}
+    assert df["city"].iloc[1] == "  null "
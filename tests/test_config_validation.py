@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -5,6 +6,7 @@ import pytest
 from datalab.config import (
     ConfigValidationError,
     load_app_config,
+    load_app_config_cached,
     resolve_section_config,
 )
 
@@ -70,3 +72,41 @@ crawl:
         required_keys={"seed_url", "output"},
     )
     assert int(resolved["pages"]) == 4
+
+
+def test_clean_imputation_rules_are_validated(tmp_path: Path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        """
+clean:
+  input: data/raw
+  output: data/clean
+  imputation:
+    - columns: [salary_min_k]
+      by: [city, {column: exp_min_years, bins: [0, 3, 100]}]
+      strategy: mode
+""".strip(),
+        encoding="utf-8",
+    )
+    with pytest.raises(ConfigValidationError, match="Invalid strategy in imputation"):
+        resolve_section_config("clean", app_config_path=str(cfg), cli_values={})
+
+
+def test_workers_must_be_positive(tmp_path: Path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("clean:\n  workers: 0\n", encoding="utf-8")
+    with pytest.raises(ConfigValidationError, match="'workers' must be >= 1"):
+        resolve_section_config("clean", app_config_path=str(cfg), cli_values={})
+
+
+def test_cached_app_config_reloads_when_file_changes(tmp_path: Path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("clean:\n  skill_dictionary:\n    python: [python]\n", encoding="utf-8")
+    first = load_app_config_cached(str(cfg))
+    first["clean"]["skill_dictionary"]["python"].append("py")
+    assert load_app_config_cached(str(cfg))["clean"]["skill_dictionary"] == {"python": ["python"]}
+
+    cfg.write_text("clean:\n  skill_dictionary:\n    sql: [sql]\n", encoding="utf-8")
+    stat = cfg.stat()
+    os.utime(cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_app_config_cached(str(cfg))["clean"]["skill_dictionary"] == {"sql": ["sql"]}
@@ -3,7 +3,8 @@ from pathlib import Path
 import duckdb
 import pandas as pd
 
-from datalab.db.build import build_duckdb, write_example_queries
+from datalab.db.build import EXAMPLE_SQL, build_duckdb, write_example_queries
+from datalab.skill_tags import SKILL_LONG_TABLE_FILENAME, skill_long_table, write_skill_bits
 
 
 def test_build_duckdb_creates_file_and_query_works(tmp_path: Path):
@@ -36,3 +37,28 @@ def test_build_duckdb_creates_file_and_query_works(tmp_path: Path):
     with duckdb.connect(str(out_db), read_only=True) as conn:
         count = conn.execute("SELECT COUNT(*) FROM jd_cleaned").fetchone()[0]
     assert count == 1
+
+
+def test_build_duckdb_loads_skill_bit_and_long_tables(tmp_path: Path):
+    parquet_path = tmp_path / "cleaned.parquet"
+    pd.DataFrame(
+        {
+            "city": ["SZ", "SZ", "BJ"],
+            "company": ["A", "B", "C"],
+            "skill_tags": ["python|sql", "sql", ""],
+            "skill_mask": pd.Series([0b101, 0b100, 0], dtype="uint64"),
+        }
+    ).to_parquet(parquet_path, index=False)
+    tags = ["python", "spark", "sql"]
+    write_skill_bits(tags, tmp_path)
+    frame = pd.read_parquet(parquet_path)
+    skill_long_table(frame, tags).to_parquet(tmp_path / SKILL_LONG_TABLE_FILENAME, index=False)
+
+    out_db = build_duckdb(parquet_path, tmp_path / "jobs.duckdb")
+    with duckdb.connect(str(out_db), read_only=True) as conn:
+        by_bits = conn.execute(EXAMPLE_SQL["skill_counts_by_city"]).fetchall()
+        by_long = conn.execute(
+            "SELECT j.city, s.tag, COUNT(*) FROM jd_cleaned AS j "
+            "JOIN jd_skill_tags AS s USING (row_id) GROUP BY ALL ORDER BY 3 DESC, 1, 2"
+        ).fetchall()
+    assert sorted(by_bits) == sorted(by_long) == [("SZ", "python", 1), ("SZ", "sql", 2)]
@@ -0,0 +1,202 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import datalab.clean as clean_module
+from datalab.clean import run_pipeline
+from datalab.dedupe_index import SeenKeyIndex
+from datalab.manifest import MANIFEST_FILENAME
+
+
+def _write_jobs(path: Path, urls: list[str]) -> None:
+    pd.DataFrame(
+        {
+            "url": urls,
+            "title": [f"Python Engineer {u}" for u in urls],
+            "company": ["ACME"] * len(urls),
+            "city": ["Shenzhen"] * len(urls),
+            "salary_text": ["20-30K"] * len(urls),
+        }
+    ).to_csv(path, index=False)
+
+
+def test_incremental_run_recleans_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    _write_jobs(raw / "day1.csv", ["u1", "u2"])
+    _write_jobs(raw / "day2.csv", ["u2", "u3"])
+
+    prepared: list[int] = []
+    original = clean_module.prepare_dataframe
+
+    def counting_prepare(df, **kwargs):
+        prepared.append(len(df))
+        return original(df, **kwargs)
+
+    monkeypatch.setattr(clean_module, "prepare_dataframe", counting_prepare)
+
+    run_pipeline(str(raw), str(out), schema=None, topk=5, incremental=True)
+    assert len(prepared) == 2
+    assert sorted(pd.read_parquet(out / "cleaned.parquet")["url"]) == ["u1", "u2", "u3"]
+
+    prepared.clear()
+    run_pipeline(str(raw), str(out), schema=None, topk=5, incremental=True)
+    assert prepared == []
+
+    _write_jobs(raw / "day3.csv", ["u3", "u4", "u5"])
+    (raw / "day1.csv").unlink()
+    run_pipeline(str(raw), str(out), schema=None, topk=5, incremental=True)
+    assert prepared == [3]
+
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    assert sorted(cleaned["url"]) == ["u2", "u3", "u4", "u5"]
+    metrics = json.loads((out / "metrics.json").read_text(encoding="utf-8"))
+    assert metrics["row_count_raw"] == 5
+    manifest = json.loads((out / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    assert sorted(Path(p).name for p in manifest["files"]) == ["day2.csv", "day3.csv"]
+    assert len(list((out / "shards").glob("*.parquet"))) == 2
+
+
+def test_incremental_cache_invalidated_by_skill_dictionary(tmp_path: Path):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    _write_jobs(raw / "day1.csv", ["u1"])
+
+    run_pipeline(str(raw), str(out), schema=None, topk=5, incremental=True)
+    run_pipeline(
+        str(raw),
+        str(out),
+        schema=None,
+        topk=5,
+        skill_dictionary={"engineering": ["engineer"]},
+        incremental=True,
+    )
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    assert cleaned["skill_tags"].tolist() == ["engineering"]
+
+
+def test_incremental_cache_invalidated_by_parser_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    _write_jobs(raw / "day1.csv", ["u1"])
+    run_pipeline(str(raw), str(out), schema=None, topk=5, incremental=True)
+
+    prepared: list[int] = []
+    original = clean_module.prepare_dataframe
+
+    def counting_prepare(df, **kwargs):
+        prepared.append(len(df))
+        return original(df, **kwargs)
+
+    monkeypatch.setattr(clean_module, "prepare_dataframe", counting_prepare)
+    monkeypatch.setattr(clean_module, "PARSER_FINGERPRINT", "changed-parser-rules")
+    run_pipeline(str(raw), str(out), schema=None, topk=5, incremental=True)
+    assert prepared == [1]
+
+
+def test_seen_index_drops_postings_from_earlier_runs(tmp_path: Path):
+    index_path = tmp_path / "state" / "seen_keys.npy"
+    day1 = tmp_path / "day1"
+    day2 = tmp_path / "day2"
+    day1.mkdir()
+    day2.mkdir()
+    _write_jobs(day1 / "jobs.csv", ["u1", "u2"])
+    _write_jobs(day2 / "jobs.csv", ["u2", "u3", "u3"])
+
+    run_pipeline(str(day1), str(tmp_path / "out1"), None, 5, seen_index=str(index_path))
+    run_pipeline(
+        str(day2), str(tmp_path / "out2"), None, 5, batch_size=1, seen_index=str(index_path)
+    )
+
+    assert index_path.exists()
+    second = pd.read_parquet(tmp_path / "out2" / "cleaned.parquet")
+    assert second["url"].tolist() == ["u3"]
+    with pytest.raises(ValueError):
+        run_pipeline(
+            str(day2),
+            str(tmp_path / "out3"),
+            None,
+            5,
+            incremental=True,
+            seen_index=str(index_path),
+        )
+
+
+def test_seen_index_is_not_saved_when_writing_outputs_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    index_path = tmp_path / "seen_keys.npy"
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    _write_jobs(raw / "jobs.csv", ["u1", "u2"])
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(clean_module, "_write_outputs", fail)
+        with pytest.raises(OSError, match="disk full"):
+            run_pipeline(str(raw), str(tmp_path / "out1"), None, 5, seen_index=str(index_path))
+    assert not index_path.exists()
+
+    run_pipeline(str(raw), str(tmp_path / "out2"), None, 5, seen_index=str(index_path))
+    cleaned = pd.read_parquet(tmp_path / "out2" / "cleaned.parquet")
+    assert cleaned["url"].tolist() == ["u1", "u2"]
+
+
+def test_incremental_merges_files_with_different_column_types(tmp_path: Path):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    pd.DataFrame(
+        {
+            "url": ["a1", "a2"],
+            "title": ["Data Engineer", "Analyst"],
+            "publish_date": [None, None],
+            "salary_text": ["20-30K", "15-25K"],
+            "code": [1, 2],
+        }
+    ).to_csv(raw / "a.csv", index=False)
+    pd.DataFrame(
+        {
+            "url": ["b1", "b2"],
+            "title": ["BI", "ML Engineer"],
+            "publish_date": ["2025-10-01", "2025-10-02"],
+            "salary_text": ["20-30K·14薪", "面议"],
+            "code": ["X1", "Y2"],
+        }
+    ).to_csv(raw / "b.csv", index=False)
+    _write_jobs(raw / "c.csv", ["c1"])
+
+    for _ in range(2):  # cold run, then from cached shards
+        run_pipeline(str(raw), str(out), schema=None, topk=5, incremental=True)
+        cleaned = pd.read_parquet(out / "cleaned.parquet").set_index("url")
+        assert pd.api.types.is_datetime64_any_dtype(cleaned["publish_date"])
+        assert cleaned.loc["b1", "salary_months"] == 14.0
+        assert cleaned.loc[["a1", "b1"], "code"].tolist() == ["1", "X1"]
+
+
+def test_seen_key_index_merges_batches_in_sorted_order(tmp_path: Path):
+    rng = np.random.default_rng(0)
+    batches = [rng.integers(0, 2**63, size=50, dtype=np.uint64) for _ in range(5)]
+    batches.append(np.concatenate([batches[0][:10], batches[3][-5:]]))
+    index = SeenKeyIndex(tmp_path / "seen.npy")
+    for batch in batches:
+        index.add(batch)
+
+    expected = np.unique(np.concatenate(batches))
+    assert len(index) == expected.size
+    assert index.contains(expected).all()
+    assert not index.contains(np.asarray([2**63 + 1], dtype=np.uint64)).any()
+    index.save()
+    assert np.array_equal(np.load(tmp_path / "seen.npy"), expected)
@@ -1,9 +1,16 @@
+import json
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pytest
+from openpyxl import Workbook
 
+import datalab.excel as excel_module
 from datalab.clean import run_pipeline
-from datalab.io import read_input_data
+from datalab.excel import EXCEL_CACHE_ENV
+from datalab.io import discover_input_files, iter_input_data, read_input_data, read_single_file
+from datalab.jd.analyze import generate_jd_market_report
 from datalab.report import build_quality_report
 
 
@@ -47,3 +54,456 @@ def test_run_pipeline_writes_expected_outputs(tmp_path: Path):
     assert (out / "cleaned.parquet").exists()
     assert (out / "metrics.json").exists()
     assert (out / "data_quality_report.md").exists()
+
+
+def test_run_pipeline_parse_cache_is_shared_across_runs(tmp_path: Path):
+    raw = tmp_path / "jobs.csv"
+    cache_dir = tmp_path / "parse_cache"
+    pd.DataFrame(
+        {
+            "url": ["u1", "u2"],
+            "salary_text": ["15-25K·13薪", "面议"],
+            "exp_text": ["3-5年", "经验不限"],
+            "edu_text": ["本科", "硕士"],
+        }
+    ).to_csv(raw, index=False)
+
+    run_pipeline(str(raw), str(tmp_path / "first"), None, 5, parse_cache=str(cache_dir))
+    run_pipeline(
+        str(raw), str(tmp_path / "second"), None, 5, batch_size=1, parse_cache=str(cache_dir)
+    )
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == [
+        "education.parquet",
+        "experience.parquet",
+        "salary.parquet",
+    ]
+    first = pd.read_parquet(tmp_path / "first" / "cleaned.parquet")
+    second = pd.read_parquet(tmp_path / "second" / "cleaned.parquet")
+    pd.testing.assert_series_equal(first["salary_max_k"], second["salary_max_k"])
+    assert second["edu_level"].astype(str).tolist() == ["bachelor", "master"]
+
+
+def test_iter_input_data_yields_bounded_batches(tmp_path: Path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    pd.DataFrame({"id": range(5)}).to_csv(raw / "a.csv", index=False)
+    pd.DataFrame({"id": range(3)}).to_json(raw / "b.jsonl", orient="records", lines=True)
+
+    batches = list(iter_input_data(raw, batch_size=2))
+    assert [len(b) for b in batches] == [2, 2, 1, 2, 1]
+    assert [b["__source_file"].iloc[0] for b in batches] == ["a.csv"] * 3 + ["b.jsonl"] * 2
+
+
+def test_run_pipeline_streaming_dedupes_across_batches(tmp_path: Path):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    pd.DataFrame(
+        {
+            "url": ["u1", "u2", "u1", "u3", "u2"],
+            "title": ["A", "B", "A", "C", "B"],
+            "salary_text": ["10-20K", "15-25K", "10-20K", "面议", "15-25K"],
+        }
+    ).to_csv(raw / "jobs.csv", index=False)
+
+    run_pipeline(str(raw), str(out), schema=None, topk=5, batch_size=2)
+
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    assert sorted(cleaned["url"]) == ["u1", "u2", "u3"]
+    metrics = json.loads((out / "metrics.json").read_text(encoding="utf-8"))
+    assert metrics["row_count_raw"] == 5
+    assert metrics["row_count_cleaned"] == 3
+    assert "## Column Details" in (out / "data_quality_report.md").read_text(encoding="utf-8")
+
+
+def test_run_pipeline_streaming_widens_types_across_files(tmp_path: Path):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    # File a: empty publish_date, no "薪" months, numeric-looking codes.
+    pd.DataFrame(
+        {
+            "url": ["a1", "a2"],
+            "title": ["Data Engineer", "Analyst"],
+            "publish_date": [None, None],
+            "salary_text": ["20-30K", "15-25K"],
+            "code": [1, 2],
+        }
+    ).to_csv(raw / "a.csv", index=False)
+    pd.DataFrame(
+        {
+            "url": ["b1", "b2"],
+            "title": ["BI", "ML Engineer"],
+            "publish_date": ["2025-10-01", "2025-10-02"],
+            "salary_text": ["20-30K·14薪", "面议"],
+            "code": ["X1", "Y2"],
+        }
+    ).to_csv(raw / "b.csv", index=False)
+
+    run_pipeline(str(raw), str(out), schema=None, topk=5, batch_size=2)
+
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    assert cleaned["url"].tolist() == ["a1", "a2", "b1", "b2"]
+    assert pd.api.types.is_datetime64_any_dtype(cleaned["publish_date"])
+    assert cleaned["publish_date"].isna().tolist() == [True, True, False, False]
+    assert cleaned["salary_months"].dtype == "float64"
+    assert cleaned["salary_months"].tolist()[2] == 14.0
+    assert cleaned["code"].tolist() == ["1", "2", "X1", "Y2"]
+    assert not list(out.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_run_pipeline_reports_missing_sentinel_counts(tmp_path: Path, batch_size):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    pd.DataFrame(
+        {
+            "url": ["u1", "u2", "u3", "u4"],
+            "title": ["A", "B", " N/A ", "C"],
+            # Padded or lower-case, so pandas' CSV reader keeps them as text.
+            "salary_text": ["10-20K", " null ", "面议", "none"],
+        }
+    ).to_csv(raw / "jobs.csv", index=False)
+
+    run_pipeline(str(raw), str(out), schema=None, topk=5, batch_size=batch_size)
+
+    metrics = json.loads((out / "metrics.json").read_text(encoding="utf-8"))
+    assert metrics["missing_sentinels"] == {"title": 1, "salary_text": 2}
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_run_pipeline_writes_skill_bits_and_long_table(tmp_path: Path, batch_size):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    pd.DataFrame(
+        {
+            "url": ["u1", "u2", "u3", "u4", "u5"],
+            "title": ["Python Dev", "SQL Analyst", "Ops", "Spark SQL", "Docker Python"],
+        }
+    ).to_csv(raw / "jobs.csv", index=False)
+
+    run_pipeline(
+        str(raw), str(out), schema=None, topk=5, batch_size=batch_size, skill_long_table=True
+    )
+
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    tags = json.loads((out / "skill_bits.json").read_text(encoding="utf-8"))["tags"]
+    long_table = pd.read_parquet(out / "skill_tags_long.parquet")
+    rebuilt = (
+        long_table.assign(tag=long_table["tag"].astype(str))
+        .groupby("row_id")["tag"]
+        .agg("|".join)
+        .reindex(range(len(cleaned)), fill_value="")
+    )
+    assert rebuilt.tolist() == cleaned["skill_tags"].tolist()
+    masks = cleaned["skill_mask"].tolist()
+    assert masks == [
+        sum(1 << tags.index(tag) for tag in row.split("|") if tag) for row in cleaned["skill_tags"]
+    ]
+
+    run_pipeline(str(raw), str(out), schema=None, topk=5, batch_size=batch_size)
+    assert not (out / "skill_tags_long.parquet").exists()
+
+
+def test_read_input_data_parallel_matches_sequential_order(tmp_path: Path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    for i in range(4):
+        pd.DataFrame({"id": [i * 10, i * 10 + 1], "amount": [i, i]}).to_csv(
+            raw / f"part{i}.csv", index=False
+        )
+    pd.DataFrame([{"id": 99, "amount": 9}]).to_json(raw / "extra.jsonl", orient="records", lines=True)
+
+    sequential = read_input_data(raw)
+    parallel = read_input_data(raw, workers=3)
+    pd.testing.assert_frame_equal(sequential, parallel, check_dtype=False)
+
+
+def test_run_pipeline_output_does_not_depend_on_io_workers(tmp_path: Path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    for i in range(3):
+        pd.DataFrame(
+            {
+                "url": [f"u{i}a", f"u{i}b", f"u{i}c"],
+                "title": ["n/a", "Data Engineer", "Analyst"],
+                "company": ["#N/A", "A", "A"],
+                "ts": ["2024-01-01 10:00:00+08:00"] * 3,
+            }
+        ).to_csv(raw / f"part{i}.csv", index=False)
+
+    outputs = []
+    for workers in (1, 2):
+        out = tmp_path / f"clean-{workers}"
+        run_pipeline(str(raw), str(out), schema=None, topk=5, io_workers=workers)
+        outputs.append(pd.read_parquet(out / "cleaned.parquet"))
+    pd.testing.assert_frame_equal(outputs[0], outputs[1])
+
+
+def test_read_single_file_pyarrow_engine_keeps_arrow_strings(tmp_path: Path):
+    path = tmp_path / "jobs.csv"
+    pd.DataFrame({"title": ["Data Engineer", "Analyst"], "n": [1, 2]}).to_csv(path, index=False)
+
+    out = read_single_file(path, engine="pyarrow", dtype_backend="pyarrow")
+    assert out["title"].dtype == "string[pyarrow]"
+    assert out["n"].tolist() == [1, 2]
+
+
+def test_run_pipeline_pyarrow_backend_end_to_end(tmp_path: Path):
+    out = tmp_path / "clean"
+    run_pipeline(
+        "data/sample", str(out), schema=None, topk=5, engine="pyarrow", dtype_backend="pyarrow"
+    )
+
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    baseline_out = tmp_path / "baseline"
+    run_pipeline("data/sample", str(baseline_out), schema=None, topk=5)
+    baseline = pd.read_parquet(baseline_out / "cleaned.parquet")
+    assert cleaned["edu_level"].tolist() == baseline["edu_level"].tolist()
+    assert cleaned["salary_min_k"].tolist() == baseline["salary_min_k"].tolist()
+    generate_jd_market_report(out / "cleaned.parquet", out / "jd_market_report.md")
+
+
+def test_read_columnar_inputs_with_projection(tmp_path: Path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    frame = pd.DataFrame({"url": ["u1", "u2"], "title": ["A", "B"], "payload": ["x", "y"]})
+    frame.to_parquet(raw / "a.parquet", index=False)
+    frame.to_feather(raw / "b.feather")
+    frame.to_feather(raw / "c.arrow")
+
+    out = read_input_data(raw, columns=["url", "title", "missing"])
+    assert list(out.columns) == ["url", "title", "__source_file"]
+    assert out["__source_file"].tolist() == ["a.parquet"] * 2 + ["b.feather"] * 2 + ["c.arrow"] * 2
+
+    batches = list(iter_input_data(raw / "a.parquet", batch_size=1, columns=["title"]))
+    assert [b["title"].iloc[0] for b in batches] == ["A", "B"]
+
+
+def test_recleaning_parquet_keeps_original_source_file(tmp_path: Path):
+    first = tmp_path / "first"
+    run_pipeline("data/sample", str(first), schema=None, topk=5)
+    second = tmp_path / "second"
+    run_pipeline(str(first / "cleaned.parquet"), str(second), schema=None, topk=5, columns=["jd"])
+
+    recleaned = pd.read_parquet(second / "cleaned.parquet")
+    assert set(recleaned["__source_file"]) == {"jobs_sample.csv"}
+    assert "publish_date" not in recleaned.columns
+
+
+def test_compressed_inputs_are_discovered_and_streamed(tmp_path: Path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    frame = pd.DataFrame({"id": [1, 2, 3], "title": ["数据工程师", "Analyst", "Py"]})
+    frame.to_csv(raw / "a.csv.gz", index=False)
+    with pa.output_stream(str(raw / "b.jsonl.zst"), compression="zstd") as sink:
+        sink.write(frame.to_json(orient="records", lines=True, force_ascii=False).encode("utf-8"))
+    (raw / "ignored.xlsx.gz").write_bytes(b"")
+
+    assert [p.name for p in discover_input_files(raw)] == ["a.csv.gz", "b.jsonl.zst"]
+    for engine in ("pandas", "pyarrow"):
+        out = read_input_data(raw, engine=engine)
+        assert out["title"].tolist() == frame["title"].tolist() * 2
+        batches = list(iter_input_data(raw, batch_size=2, engine=engine))
+        assert [len(b) for b in batches] == [2, 1, 2, 1]
+
+
+def test_pyarrow_engine_reads_pandas_na_strings_as_missing(tmp_path: Path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    pd.DataFrame(
+        {
+            "url": ["u1", "u2", "u3", "u4"],
+            "title": ["Data Engineer", "nan", "Analyst", "<NA>"],
+            "salary_text": ["20-30K", "#N/A", "15-25K", "None"],
+            "exp_text": ["3-5年", "n/a", "1-3年", "NULL"],
+        }
+    ).to_csv(raw / "jobs.csv", index=False)
+
+    missing = {"url": 0, "title": 2, "salary_text": 2, "exp_text": 2}
+    for engine in ("pandas", "pyarrow"):
+        assert read_single_file(raw / "jobs.csv", engine=engine).isna().sum().to_dict() == missing
+        batches = list(iter_input_data(raw, batch_size=2, engine=engine))
+        assert pd.concat(batches).isna().sum().drop("__source_file").to_dict() == missing
+
+    for batch_size in (None, 2):
+        outputs = []
+        for engine in ("pandas", "pyarrow"):
+            out = tmp_path / f"clean-{engine}-{batch_size}"
+            run_pipeline(
+                str(raw), str(out), schema=None, topk=5, engine=engine, batch_size=batch_size
+            )
+            outputs.append(pd.read_parquet(out / "cleaned.parquet"))
+        pd.testing.assert_frame_equal(outputs[0], outputs[1])
+
+
+def test_pyarrow_csv_stream_survives_type_change_after_first_block(tmp_path: Path):
+    path = tmp_path / "jobs.csv"
+    # Well past pyarrow's 1 MiB first block, so "code" is inferred as int64 there.
+    codes = [str(i) for i in range(200_000)] + ["abc"]
+    pd.DataFrame({"code": codes, "title": "Analyst", "extra": 1}).to_csv(path, index=False)
+
+    batches = list(
+        iter_input_data(path, batch_size=50_000, engine="pyarrow", columns=["code", "title"])
+    )
+
+    assert all(len(b) <= 50_000 for b in batches)
+    out = pd.concat(batches, ignore_index=True)
+    assert list(out.columns) == ["code", "title", "__source_file"]
+    assert out["code"].astype(str).tolist() == codes
+
+
+def test_excel_reads_populate_and_reuse_parquet_sidecar(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(EXCEL_CACHE_ENV, str(cache_dir))
+    path = tmp_path / "partner.xlsx"
+    frame = pd.DataFrame({"title": ["Data Engineer", "Analyst", "BI"], "n": [1, 2, 3]})
+    frame.to_excel(path, index=False)
+
+    first = read_single_file(path)
+    pd.testing.assert_frame_equal(first, frame)
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+    # A second read must not touch openpyxl at all.
+    monkeypatch.setattr(excel_module, "load_workbook", None)
+    batches = list(iter_input_data(path, batch_size=2, columns=["title"]))
+    assert batches[1]["title"].tolist() == ["BI"]
+    pd.testing.assert_frame_equal(read_single_file(path), frame)
+
+
+def test_excel_rows_and_headers_match_read_excel(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delenv(EXCEL_CACHE_ENV, raising=False)
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    path = raw / "partner.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["url", "title", "title", "company", None])
+    sheet.append(["u1", "Data Engineer", "DE", "A"])
+    sheet.append([None, None, None, None])
+    sheet.append(["u2", "Analyst", "BA", "B", None, "x"])
+    sheet.append([None, None])
+    sheet.append([None])
+    workbook.save(path)
+
+    expected = pd.read_excel(path)
+    assert list(expected.columns) == [
+        "url", "title", "title.1", "company", "Unnamed: 4", "Unnamed: 5"
+    ]
+    got = read_single_file(path)
+    pd.testing.assert_frame_equal(
+        got.astype(object).where(got.notna(), None),
+        expected.astype(object).where(expected.notna(), None),
+    )
+    batches = list(iter_input_data(path, batch_size=1))
+    assert [len(b) for b in batches] == [1, 1, 1]
+
+    out = tmp_path / "clean"
+    run_pipeline(str(raw), str(out), schema=None, topk=5)
+    metrics = json.loads((out / "metrics.json").read_text(encoding="utf-8"))
+    assert metrics["row_count_raw"] == 3
+    # Without DATALAB_EXCEL_CACHE_DIR no sidecar is written anywhere.
+    assert excel_module.excel_cache_dir() is None
+
+
+def test_excel_na_strings_match_read_excel(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(EXCEL_CACHE_ENV, raising=False)
+    path = tmp_path / "partner.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["title", "salary_text", "n"])
+    sheet.append(["#N/A", "20-30K", 1])
+    sheet.append(["Analyst", "n/a", "nan"])
+    sheet.append(["<NA>", "NULL", 3])
+    workbook.save(path)
+
+    expected = pd.read_excel(path)
+    got = read_single_file(path)
+    assert got.isna().to_numpy().tolist() == expected.isna().to_numpy().tolist()
+    assert got.isna().sum().to_dict() == {"title": 2, "salary_text": 2, "n": 1}
+
+
+def test_run_pipeline_streaming_outlier_sketch_uses_global_bounds(tmp_path: Path):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    scores = [10, 11, 12, 13, 14, 15, 16, 17, 5000, 18]
+    pd.DataFrame({"url": [f"u{i}" for i in range(10)], "score": scores}).to_csv(
+        raw / "jobs.csv", index=False
+    )
+
+    run_pipeline(str(raw), str(out), schema=None, topk=5, batch_size=2, outlier_sketch=True)
+
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    assert cleaned["score"].dtype == "int64"
+    # Per-batch quartiles of (5000, 18) would leave the outlier untouched.
+    assert cleaned["score"].drop(index=8).tolist() == [10, 11, 12, 13, 14, 15, 16, 17, 18]
+    assert 18 <= cleaned["score"].iloc[8] < 30
+    with pytest.raises(ValueError):
+        run_pipeline(str(raw), str(out), schema=None, topk=5, outlier_sketch=True)
+
+
+@pytest.mark.parametrize("batch_size", [None, 150])
+def test_low_cardinality_columns_are_stored_as_categories(tmp_path: Path, batch_size):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    rows = 400
+    pd.DataFrame(
+        {
+            "url": [f"u{i}" for i in range(rows)],
+            "title": [f"Data Engineer {i}" for i in range(rows)],
+            "company": [f"Co{i % 7}" for i in range(rows)],
+            "city": [["Shenzhen", "Beijing", "Shanghai"][i % 3] for i in range(rows)],
+            "salary_text": ["20-30K"] * rows,
+            "exp_text": ["3-5年"] * rows,
+            "edu_text": ["本科"] * rows,
+        }
+    ).to_csv(raw / "jobs.csv", index=False)
+
+    run_pipeline(
+        str(raw), str(out), schema=None, topk=5, batch_size=batch_size, categorical_max_ratio=0.5
+    )
+
+    cleaned = pd.read_parquet(out / "cleaned.parquet")
+    assert isinstance(cleaned["city"].dtype, pd.CategoricalDtype)
+    assert isinstance(cleaned["company"].dtype, pd.CategoricalDtype)
+    assert cleaned["url"].dtype == object
+    assert cleaned["title"].dtype == object
+    assert len(cleaned) == rows
+
+    report = generate_jd_market_report(out / "cleaned.parquet", out / "jd_market_report.md")
+    assert "| Beijing |" in report.read_text(encoding="utf-8")
+
+
+def test_categories_are_opt_in_and_decided_once_when_streaming(tmp_path: Path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    cities = ["Shenzhen", "Beijing"] * 10 + [f"City{i}" for i in range(20)]
+    pd.DataFrame(
+        {
+            "url": [f"u{i}" for i in range(40)],
+            "title": ["Data Engineer"] * 40,
+            "city": cities,
+        }
+    ).to_csv(raw / "jobs.csv", index=False)
+
+    run_pipeline(str(raw), str(tmp_path / "default"), schema=None, topk=5, batch_size=20)
+    default = pd.read_parquet(tmp_path / "default" / "cleaned.parquet")
+    assert not any(isinstance(dtype, pd.CategoricalDtype) for dtype in default.dtypes)
+
+    # Only the first batch has few distinct cities; the column stays a category.
+    out = tmp_path / "encoded"
+    run_pipeline(
+        str(raw), str(out), schema=None, topk=5, batch_size=20, categorical_max_ratio=0.5
+    )
+    encoded = pd.read_parquet(out / "cleaned.parquet")
+    assert isinstance(encoded["city"].dtype, pd.CategoricalDtype)
+    assert encoded["city"].astype(str).tolist() == cities
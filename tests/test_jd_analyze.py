@@ -128,3 +128,25 @@ def test_top20_contains_provenance_fields():
     assert "https://example.com/job/1" in report
     assert "2026-01-01T00:00:00+00:00" in report
     assert "20-30K" in report
+
+
+def test_skill_heatmap_from_bit_masks_matches_tag_strings():
+    df = pd.DataFrame(
+        {
+            "city": ["SZ", "SZ", "BJ"],
+            "salary_min_k": [20, 10, None],
+            "salary_max_k": [30, 20, None],
+            "salary_months": [12, 12, None],
+            "salary_is_negotiable": [False, False, True],
+            "exp_min_years": [1, 3, None],
+            "exp_max_years": [3, 5, None],
+            "url": ["u1", "u2", "u3"],
+            "title": ["A", "B", "C"],
+            "company": ["X", "Y", "Z"],
+            "skill_tags": ["python|sql", "sql", ""],
+            "skill_mask": pd.Series([0b101, 0b100, 0], dtype="uint64"),
+        }
+    )
+    from_bits = build_jd_market_report(df, skill_bits=["python", "spark", "sql"])
+    assert from_bits == build_jd_market_report(df)
+    assert "| SZ | 1-3y | python | 1 |" in from_bits
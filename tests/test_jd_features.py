@@ -1,7 +1,23 @@
 import pandas as pd
+import pytest
 
+from datalab.bench.corpus import EDU_TEXTS, EXP_TEXTS, SALARY_TEXTS
 from datalab.cleaning import clean_dataframe
-from datalab.jd_features import normalize_education, parse_experience, parse_salary
+from datalab.jd_features import (
+    PARSER_FINGERPRINT,
+    normalize_education,
+    normalize_education_memoized,
+    normalize_education_series,
+    parse_experience,
+    parse_experience_memoized,
+    parse_experience_series,
+    parse_salary,
+    parse_salary_memoized,
+    parse_salary_series,
+)
+from datalab.parse_cache import ParseCache
+
+EDGE_TEXTS = [None, float("nan"), "  ", "１３-２０k", "10-15", "3w-5", "2万 12薪 面议", "NEGOTIABLE", "3\u3000年以上"]
 
 
 def test_parse_salary_range_and_months():
@@ -19,6 +35,75 @@ def test_parse_experience_and_education():
     assert normalize_education("本科及以上") == "bachelor"
 
 
+@pytest.mark.parametrize("values", [SALARY_TEXTS + EDGE_TEXTS, ["面议", None], ["20k"]])
+def test_parse_salary_series_matches_scalar_parser(values):
+    series = pd.Series(values, index=range(10, 10 + len(values)))
+    expected = pd.DataFrame(
+        series.apply(parse_salary).tolist(),
+        index=series.index,
+        columns=["salary_min_k", "salary_max_k", "salary_months", "salary_is_negotiable"],
+    )
+    pd.testing.assert_frame_equal(parse_salary_series(series), expected)
+
+
+@pytest.mark.parametrize("values", [EXP_TEXTS + EDGE_TEXTS, ["经验不限", None]])
+def test_parse_experience_series_matches_scalar_parser(values):
+    series = pd.Series(values)
+    expected = pd.DataFrame(
+        series.apply(parse_experience).tolist(), columns=["exp_min_years", "exp_max_years"]
+    )
+    pd.testing.assert_frame_equal(parse_experience_series(series), expected)
+
+
+def test_normalize_education_series_matches_scalar_parser():
+    series = pd.Series(EDU_TEXTS + EDGE_TEXTS + ["博士/硕士", "不限"])
+    pd.testing.assert_series_equal(
+        normalize_education_series(series), series.apply(normalize_education)
+    )
+
+
+def test_memoized_parsers_match_scalar_parsers_on_repeated_texts():
+    series = pd.Series((SALARY_TEXTS + EXP_TEXTS + EDU_TEXTS + EDGE_TEXTS) * 3)
+    salary = parse_salary_memoized(series)
+    pd.testing.assert_frame_equal(
+        salary, pd.DataFrame(series.apply(parse_salary).tolist(), columns=salary.columns)
+    )
+    experience = parse_experience_memoized(series)
+    pd.testing.assert_frame_equal(
+        experience,
+        pd.DataFrame(series.apply(parse_experience).tolist(), columns=experience.columns),
+    )
+    pd.testing.assert_series_equal(
+        normalize_education_memoized(series),
+        series.apply(normalize_education),
+        check_names=False,
+    )
+
+
+def test_parse_cache_reuses_saved_texts_and_ignores_other_rules(tmp_path):
+    series = pd.Series(["15-25K·13薪", "面议", None, "15-25K·13薪"])
+    cache = ParseCache(tmp_path / "cache", PARSER_FINGERPRINT)
+    expected = parse_salary_memoized(series, cache)
+    cache.save()
+    assert (tmp_path / "cache" / "salary.parquet").exists()
+
+    calls = []
+
+    def parse(texts):
+        calls.append(list(texts))
+        raise AssertionError("cached texts must not be parsed again")
+
+    reloaded = ParseCache(tmp_path / "cache", PARSER_FINGERPRINT)
+    table = reloaded.lookup("salary", pd.Series(["面议", ""]).to_numpy(dtype=object), parse)
+    assert table.loc["面议", "salary_is_negotiable"]
+    assert not calls
+    pd.testing.assert_frame_equal(parse_salary_memoized(series, reloaded), expected)
+
+    stale = ParseCache(tmp_path / "cache", "other-rules")
+    parse_salary_memoized(series, stale)
+    assert len(stale) == 3
+
+
 def test_deduplicate_by_url_with_fallback_fields():
     df = pd.DataFrame(
         [
@@ -72,3 +72,12 @@ def test_write_metrics_outputs_json(tmp_path: Path):
     assert path.exists()
     loaded = json.loads(path.read_text(encoding="utf-8"))
     assert loaded["parse_rate"] == 0.5
+
+
+def test_compute_metrics_includes_near_duplicate_stats_only_when_given():
+    cleaned_df = pd.DataFrame({"url": ["u1", "u2"]})
+    assert "near_duplicates" not in compute_metrics(None, cleaned_df, raw_rows=3)
+
+    stats = {"threshold": 0.8, "clusters": 1, "rows_removed": 1}
+    metrics = compute_metrics(None, cleaned_df, raw_rows=3, near_duplicates=stats)
+    assert metrics["near_duplicates"] == stats
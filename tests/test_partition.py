@@ -0,0 +1,58 @@
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import datalab.cleaning as cleaning
+from datalab.bench.corpus import synthetic_jobs_frame
+from datalab.cleaning import prepare_dataframe
+from datalab.parse_cache import ParseCache
+from datalab.partition import map_partitions, partition_bounds
+
+
+def _tag_partition(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    out["first_row"] = df["value"].iloc[0]
+    return out
+
+
+def test_partition_bounds_cover_rows_in_order():
+    assert partition_bounds(10, 3) == [(0, 4), (4, 8), (8, 10)]
+    assert partition_bounds(2, 4) == [(0, 1), (1, 2)]
+
+
+def test_map_partitions_keeps_row_order_and_index():
+    df = pd.DataFrame({"value": range(9)}, index=[f"r{i}" for i in range(9)])
+    out = map_partitions(df, _tag_partition, workers=3, min_partition_rows=3)
+    assert out.index.tolist() == df.index.tolist()
+    assert out["value"].tolist() == list(range(9))
+    assert out["first_row"].tolist() == [0, 0, 0, 3, 3, 3, 6, 6, 6]
+
+    small = map_partitions(df, _tag_partition, workers=3, min_partition_rows=100)
+    assert small["first_row"].tolist() == [0] * 9
+
+    with pytest.raises(ValueError, match="workers"):
+        map_partitions(df, _tag_partition, workers=0)
+
+
+def test_partitioned_prepare_matches_single_process(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cleaning, "map_partitions", partial(map_partitions, min_partition_rows=20))
+    frame = synthetic_jobs_frame(90, seed=5)
+    frame.loc[:29, "salary_text"] = None
+    expected = prepare_dataframe(frame)
+    partitioned = prepare_dataframe(frame, workers=3)
+    pd.testing.assert_frame_equal(partitioned, expected)
+
+
+def test_partitioned_prepare_writes_parse_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cleaning, "map_partitions", partial(map_partitions, min_partition_rows=20))
+    cache_dir = tmp_path / "parse-cache"
+    prepare_dataframe(
+        synthetic_jobs_frame(60, seed=3),
+        workers=2,
+        parse_cache=ParseCache(cache_dir, "test"),
+    )
+    tables = list(cache_dir.glob("*.parquet"))
+    assert tables
+    assert all(pd.read_parquet(path).shape[0] > 0 for path in tables)
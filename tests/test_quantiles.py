@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from datalab.cleaning import clip_outliers_iqr, iqr_bounds_from_sketches, update_iqr_sketches
+from datalab.quantiles import KLLSketch
+
+
+def test_merged_kll_sketch_quartiles_are_within_documented_rank_error():
+    rng = np.random.default_rng(11)
+    data = rng.lognormal(mean=3, sigma=1, size=200_000)
+    shards = []
+    for shard_values in np.array_split(data, 4):
+        sketch = KLLSketch(seed=len(shards))
+        for chunk in np.array_split(shard_values, 10):
+            sketch.update(chunk)
+        shards.append(sketch)
+    merged = shards[0]
+    for sketch in shards[1:]:
+        merged.merge(sketch)
+
+    assert merged.count == len(data)
+    ordered = np.sort(data)
+    for q in (0.25, 0.5, 0.75):
+        rank = np.searchsorted(ordered, merged.quantile(q)) / len(data)
+        assert abs(rank - q) < 0.02
+
+
+def test_small_sketch_is_exact_and_drives_clip_bounds():
+    df = pd.DataFrame({"salary": [10.0, 11.0, 12.0, 13.0, 14.0, None, 1000.0]})
+    sketches: dict[str, KLLSketch] = {}
+    update_iqr_sketches(sketches, df.iloc[:3])
+    update_iqr_sketches(sketches, df.iloc[3:])
+
+    bounds = iqr_bounds_from_sketches(sketches)
+    exact = clip_outliers_iqr(df)
+    sketched = clip_outliers_iqr(df, bounds=bounds)
+    pd.testing.assert_frame_equal(sketched, exact, check_exact=False, atol=1.0)
+    assert sketched["salary"].max() < 1000
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from datalab.clean import main, run_pipeline, run_recompute
+from datalab.cleaning import derived_column_groups
+
+
+def test_derived_column_groups_resolve_globs_and_reject_unknown():
+    assert derived_column_groups(["skill_tags", "salary_*"]) == ["salary", "skills"]
+    assert derived_column_groups(["edu_level", "experience"]) == ["experience", "education"]
+    with pytest.raises(ValueError, match="No derived columns match 'company'"):
+        derived_column_groups(["company"])
+
+
+@pytest.mark.parametrize("dtype_backend", ["numpy", "pyarrow"])
+def test_recompute_matches_full_clean_and_keeps_other_columns(tmp_path: Path, dtype_backend):
+    out = tmp_path / "clean"
+    run_pipeline("data/sample", str(out), schema=None, topk=5, dtype_backend=dtype_backend)
+    before = pd.read_parquet(out / "cleaned.parquet")
+    schema_before = pq.read_schema(out / "cleaned.parquet")
+
+    replaced = run_recompute(str(out), ["salary_*", "exp_*", "edu_level", "skill_tags"], topk=5)
+
+    assert "salary_min_k" in replaced and "skill_mask" in replaced
+    pd.testing.assert_frame_equal(pd.read_parquet(out / "cleaned.parquet"), before)
+    assert pq.read_schema(out / "cleaned.parquet").equals(schema_before)
+
+
+def test_recompute_cli_applies_new_skill_dictionary(tmp_path: Path):
+    raw = tmp_path / "raw"
+    out = tmp_path / "clean"
+    raw.mkdir()
+    pd.DataFrame(
+        {
+            "url": ["u1", "u2", "u3"],
+            "title": ["Rust Engineer", "Python Dev", "Go Backend"],
+            "company": ["A", "B", "C"],
+            "city": ["SZ", "SZ", "BJ"],
+            "salary_text": ["20-30K", "15-25K", "面议"],
+        }
+    ).to_csv(raw / "jobs.csv", index=False)
+    run_pipeline(str(raw), str(out), schema=None, topk=5, skill_dictionary={"python": ["python"]})
+    before = pd.read_parquet(out / "cleaned.parquet")
+    (out / "jd_market_report.md").write_text("stale", encoding="utf-8")
+
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "clean:\n  skill_dictionary:\n    python: [python]\n    rust: [rust]\n",
+        encoding="utf-8",
+    )
+    main(["recompute", "--output", str(out), "--columns", "skill_*", "--config", str(config)])
+
+    after = pd.read_parquet(out / "cleaned.parquet")
+    assert after["skill_tags"].tolist() == ["rust", "python", ""]
+    assert after["skill_mask"].tolist() == [2, 1, 0]
+    pd.testing.assert_frame_equal(
+        after.drop(columns=["skill_tags", "skill_tag_count", "skill_mask"]),
+        before.drop(columns=["skill_tags", "skill_tag_count", "skill_mask"]),
+    )
+    tags = json.loads((out / "skill_bits.json").read_text(encoding="utf-8"))["tags"]
+    assert tags == ["python", "rust"]
+    metrics = json.loads((out / "metrics.json").read_text(encoding="utf-8"))
+    assert metrics["row_count_raw"] == 3
+    assert "## 4) Skill Heatmap" in (out / "jd_market_report.md").read_text(encoding="utf-8")
+
+
+def test_recompute_adds_columns_missing_from_older_outputs(tmp_path: Path):
+    out = tmp_path / "clean"
+    run_pipeline("data/sample", str(out), schema=None, topk=5)
+    legacy = pd.read_parquet(out / "cleaned.parquet").drop(columns=["skill_mask"])
+    legacy.to_parquet(out / "cleaned.parquet", index=False)
+
+    run_recompute(str(out), ["skills"], topk=5)
+
+    after = pd.read_parquet(out / "cleaned.parquet")
+    assert after.columns[-1] == "skill_mask"
+    assert after["skill_mask"].dtype == "uint64"
+    assert (after["skill_mask"] > 0).sum() == (after["skill_tag_count"] > 0).sum()
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+from datalab.skill_matcher import SkillMatcher
+from datalab.skill_mining import mine_skill_terms, title_terms, write_skill_candidates
+from datalab.skill_tags import mine_skill_candidates
+
+
+def test_title_terms_cover_ascii_word_ngrams_and_cjk_windows():
+    terms = title_terms("Senior C++/Node.js 大数据开发 (2024)")
+    assert {"c++", "node.js", "c++ node.js", "senior c++"} <= terms
+    assert {"大数", "数据", "大数据", "数据开发", "大数据开"} <= terms
+    assert "2024" not in terms
+    assert "大数据开发" not in terms
+
+
+def _titles() -> list[str]:
+    return (
+        ["Kafka Engineer"] * 30
+        + ["Kafka Python Engineer"] * 10
+        + ["Python Engineer"] * 40
+        + ["Flink实时计算"] * 25
+        + ["Ops Engineer"] * 5
+    )
+
+
+def test_mine_skill_terms_ranks_uncovered_terms_with_exact_counts():
+    titles = pd.Series(_titles())
+    matcher = SkillMatcher({"python": ["python"]})
+    stats: dict = {}
+
+    def batches():
+        # Uneven batches, and few hash buckets so that terms collide.
+        return [titles.iloc[:33], titles.iloc[33:]]
+
+    found = mine_skill_terms(batches, matcher, top_k=5, min_titles=20, num_buckets=8, stats=stats)
+
+    assert stats == {"titles": 110, "uncovered_titles": 60}
+    assert "python" not in set(found["term"])
+    assert "engineer" not in set(found["term"])
+    kafka = found.set_index("term").loc["kafka"]
+    assert (kafka["n_titles"], kafka["n_uncovered"]) == (40, 30)
+    assert "flink" in set(found["term"])
+    # "实时计算" is a window of no longer candidate, its 2-character windows are.
+    assert "实时计算" in set(found["term"])
+    assert "实时" not in set(found["term"])
+
+
+def test_mine_skill_candidates_writes_skill_dictionary_yaml(tmp_path: Path):
+    parquet = tmp_path / "cleaned.parquet"
+    pd.DataFrame({"title": _titles() + ["C++ Engineer"] * 30}).to_parquet(parquet, index=False)
+    output = tmp_path / "candidates.yaml"
+
+    candidates = mine_skill_candidates(
+        parquet,
+        output,
+        skill_dictionary={"python": ["python"]},
+        batch_size=16,
+        top_k=3,
+        min_titles=20,
+    )
+
+    loaded = yaml.safe_load(output.read_text(encoding="utf-8"))["skill_dictionary"]
+    assert list(loaded) == candidates["term"].tolist()
+    assert loaded["c++"] == ["c++"]
+    assert "titles scanned: 140" in output.read_text(encoding="utf-8")
+
+    write_skill_candidates(candidates.head(0), output)
+    assert yaml.safe_load(output.read_text(encoding="utf-8")) == {"skill_dictionary": {}}
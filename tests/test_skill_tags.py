@@ -1,6 +1,16 @@
+import numpy as np
 import pandas as pd
 
-from datalab.skill_tags import extract_skill_tags
+from datalab.skill_matcher import SkillMatcher
+from datalab.skill_tags import (
+    compiled_skill_matcher,
+    extract_skill_tags,
+    load_skill_bits,
+    skill_bit_tags,
+    skill_counts,
+    skill_long_table,
+    write_skill_bits,
+)
 
 
 def test_extract_skill_tags_rule_based_dictionary():
@@ -20,3 +30,87 @@ def test_extract_skill_tags_rule_based_dictionary():
     assert out.loc[0, "skill_tags"] == "python"
     assert out.loc[1, "skill_tags"] == "spark|sql"
     assert out.loc[2, "skill_tags"] == ""
+
+
+def test_skill_matcher_matches_substring_scan_for_many_keywords():
+    rng = np.random.default_rng(3)
+    alphabet = list("abcdefgh数据开发")
+    dictionary = {
+        f"tag{i}": ["".join(rng.choice(alphabet, size=rng.integers(1, 5))) for _ in range(3)]
+        for i in range(400)
+    }
+    texts = ["".join(rng.choice(alphabet + [" "], size=40)) for _ in range(200)]
+    matcher = SkillMatcher(dictionary)
+    for text in texts:
+        expected = sorted(tag for tag, words in dictionary.items() if any(w in text for w in words))
+        assert matcher.tags(text) == expected
+
+
+def test_skill_matcher_token_boundaries_for_ascii_and_cjk():
+    dictionary = {"python": ["py", "python"], "cpp": ["c++"], "bigdata": ["大数据"]}
+    substring = SkillMatcher(dictionary)
+    bounded = SkillMatcher(dictionary, token_boundaries=True)
+
+    assert substring.tags("happy hour") == ["python"]
+    assert bounded.tags("happy hour") == []
+    assert bounded.tags("py/sql") == ["python"]
+    assert bounded.tags("python开发工程师") == ["python"]
+    assert bounded.tags("c++11 developer") == ["cpp"]
+    assert bounded.tags("做大数据平台") == ["bigdata"]
+
+
+def test_extract_skill_tags_token_boundaries_and_missing_text():
+    df = pd.DataFrame({"title": ["Happy Ops", None, "  PY Engineer "], "salary_text": ["", "", None]})
+    loose = extract_skill_tags(df, skill_dictionary={"python": ["py"]})
+    strict = extract_skill_tags(df, skill_dictionary={"python": ["py"]}, token_boundaries=True)
+    assert loose["skill_tags"].tolist() == ["python", "", "python"]
+    assert strict["skill_tags"].tolist() == ["", "", "python"]
+    assert strict["skill_tag_count"].tolist() == [0, 0, 1]
+
+
+def test_skill_mask_long_table_and_counts_match_tag_strings(tmp_path):
+    df = pd.DataFrame(
+        {
+            "title": ["Python Spark", "SQL", "Ops", "python sql", "Spark"],
+            "city": ["SZ", "SZ", "BJ", None, "BJ"],
+        }
+    )
+    dictionary = {"python": ["python"], "spark": ["spark"], "sql": ["sql"]}
+    out = extract_skill_tags(df, skill_dictionary=dictionary)
+    tags = skill_bit_tags(dictionary)
+    assert tags == ["python", "spark", "sql"]
+    assert out["skill_mask"].dtype == np.uint64
+    assert out["skill_mask"].tolist() == [0b011, 0b100, 0, 0b101, 0b010]
+
+    long_from_bits = skill_long_table(out, tags, row_offset=10)
+    long_from_text = skill_long_table(out)
+    assert long_from_bits["row_id"].tolist() == [10, 10, 11, 13, 13, 14]
+    assert long_from_bits["tag"].astype(str).tolist() == [
+        "python", "spark", "sql", "python", "sql", "spark"
+    ]
+    assert long_from_text["row_id"].tolist() == (long_from_bits["row_id"] - 10).tolist()
+    assert long_from_text["tag"].astype(str).tolist() == long_from_bits["tag"].astype(str).tolist()
+
+    pd.testing.assert_frame_equal(skill_counts(out, ["city"], tags), skill_counts(out, ["city"]))
+    top = skill_counts(out, ["city"], tags).iloc[0]
+    assert (top["city"], top["skill_tag"], top["n_jobs"]) == ("BJ", "spark", 1)
+
+    write_skill_bits(tags, tmp_path)
+    assert load_skill_bits(tmp_path) == tags
+
+
+def test_skill_mask_is_skipped_for_more_than_64_tags():
+    dictionary = {f"tag{i:02d}": [f"kw{i:02d}"] for i in range(65)}
+    out = extract_skill_tags(pd.DataFrame({"title": ["kw01 kw64"]}), skill_dictionary=dictionary)
+    assert skill_bit_tags(dictionary) == []
+    assert "skill_mask" not in out.columns
+    assert out.loc[0, "skill_tags"] == "tag01|tag64"
+    assert skill_counts(out, ["title"], [])["skill_tag"].tolist() == ["tag01", "tag64"]
+
+
+def test_compiled_skill_matcher_is_shared_per_dictionary_content():
+    matcher = compiled_skill_matcher({"Python": [" Python ", "py"]})
+    assert compiled_skill_matcher({"python": ["python", "py"]}) is matcher
+    assert compiled_skill_matcher({"python": ["python", "py"]}, token_boundaries=True) is not matcher
+    assert compiled_skill_matcher({"python": ["python"]}) is not matcher
+    assert matcher.tags("happy") == ["python"]